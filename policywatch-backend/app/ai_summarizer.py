@@ -1,13 +1,18 @@
 # app/ai_summarizer.py
 import os, time
 import asyncio
+import hashlib
 import json
 import httpx
+import asyncpg
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
+from .db import get_pool
+
 # Load .env here too, just in case this module is used outside FastAPI
 load_dotenv(dotenv_path=Path(__file__).resolve().parents[1] / ".env", override=False)
 
@@ -32,6 +37,29 @@ _calls_used = {"day": None, "count": 0}
 
 _lock = asyncio.Lock()
 
+# in-memory polish cache (also resets when process restarts): the same draft under
+# the same title -- re-runs, cross-listed pages -- is sent to the provider once
+POLISH_CACHE_SIZE = int(os.getenv("AI_POLISH_CACHE_SIZE", "4096"))
+_polish_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# persistent second tier, shared across restarts/workers. Off unless
+# AI_POLISH_DB_CACHE=1; if the table isn't there (or no DB is configured) it
+# switches itself off for the process.
+#   create table ai_polish_cache (
+#       hash_key text primary key,
+#       polished text not null,
+#       created_at timestamptz not null default now()
+#   );
+POLISH_DB_CACHE = os.getenv("AI_POLISH_DB_CACHE", "0") == "1"
+_polish_db = {"ok": POLISH_DB_CACHE}
+# at most one pooled connection for cache lookups, so concurrent polishes don't
+# crowd out the ingest's own connection
+_polish_db_sem = asyncio.Semaphore(1)
+
+# bump when the polish prompts/inputs change: cached polishes made under an older
+# prompt then stop matching
+_POLISH_PROMPT_VERSION = "1"
+
 print(
     "ai_summarizer init:",
     "AI_PROVIDER=", PROVIDER,
@@ -42,7 +70,11 @@ print(
 def _day_key():
     return time.strftime("%Y-%m-%d", time.gmtime())
 
-async def _within_budget_async() -> bool:
+async def _reserve_budget_async() -> bool:
+    """
+    Take one call from today's budget; False when it's used up. Check and bump
+    happen under one lock, so concurrent polishes can't all pass at count=199.
+    """
     # ✅ unlimited mode
     if DAILY_CALL_BUDGET <= 0:
         return True
@@ -52,15 +84,10 @@ async def _within_budget_async() -> bool:
         if _calls_used["day"] != day:
             _calls_used["day"] = day
             _calls_used["count"] = 0
-        return _calls_used["count"] < DAILY_CALL_BUDGET
-
-async def _bump_budget_async():
-    async with _lock:
-        day = _day_key()
-        if _calls_used["day"] != day:
-            _calls_used["day"] = day
-            _calls_used["count"] = 0
+        if _calls_used["count"] >= DAILY_CALL_BUDGET:
+            return False
         _calls_used["count"] += 1
+        return True
 
 
 async def _hf_polish(draft: str, title: str, url: str) -> str:
@@ -167,18 +194,85 @@ async def _openai_polish(draft: str, title: str, url: str) -> str:
         return draft
 
 
-async def ai_polish_summary(draft: str, title: str = "", url: str = "") -> str:
+def _polish_key(draft: str, title: str) -> str:
+    model = OPENAI_MODEL if PROVIDER in ("openai", "gpt") else HF_MODEL
+    raw = f"{_POLISH_PROMPT_VERSION}\0{PROVIDER}\0{model}\0{title}\0{draft}".encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def _polish_cache_put(key: str, draft: str, out: str) -> None:
+    # only real rewrites are kept; a provider error returns the draft and should be retried
+    if POLISH_CACHE_SIZE <= 0 or not out or out == draft:
+        return
+    _polish_cache[key] = out
+    _polish_cache.move_to_end(key)
+    while len(_polish_cache) > POLISH_CACHE_SIZE:
+        _polish_cache.popitem(last=False)
+
+async def _polish_db_call(sql: str, *args):
+    # short acquire timeout: ingests already hold pool connections, and a cache
+    # lookup must never wait behind them
+    if not _polish_db["ok"]:
+        return None
+    try:
+        async with _polish_db_sem:
+            pool = await get_pool()
+            async with pool.acquire(timeout=2.0) as conn:
+                return await conn.fetchval(sql, *args)
+    except (asyncpg.UndefinedTableError, RuntimeError) as e:
+        print("AI polish: DB cache disabled:", repr(e))
+        _polish_db["ok"] = False
+    except Exception as e:
+        print("AI polish: DB cache error:", repr(e))
+    return None
+
+async def _polish_store(key: str, draft: str, out: str) -> None:
+    if not out or out == draft:
+        return
+    _polish_cache_put(key, draft, out)
+    await _polish_db_call(
+        """
+        insert into ai_polish_cache (hash_key, polished) values ($1, $2)
+        on conflict (hash_key) do update set polished = excluded.polished, created_at = now()
+        """,
+        key,
+        out,
+    )
+
+async def ai_polish_summary(draft: str, title: str = "", url: str = "", *, use_cache: bool = True) -> str:
     """
     Provider-agnostic polish step.
     Providers:
       - openai (GPT-4.1-mini)
       - hf (legacy / fallback)
       - none (skip)
+    use_cache=False (re-polish jobs) always calls the provider; the fresh result
+    still replaces what the caches hold.
     """
     if not draft:
         return draft
 
-    if not await _within_budget_async():
+    key = _polish_key(draft, title)
+    if use_cache:
+        cached = _polish_cache.get(key)
+        if cached is not None:
+            _polish_cache.move_to_end(key)
+            print("AI polish: CACHE HIT", "url=", url)
+            return cached
+
+        cached = await _polish_db_call("select polished from ai_polish_cache where hash_key = $1", key)
+        if cached:
+            _polish_cache_put(key, draft, cached)
+            print("AI polish: DB CACHE HIT", "url=", url)
+            return cached
+
+    use_openai = PROVIDER in ("openai", "gpt") and bool(OPENAI_API_KEY)
+    use_hf = PROVIDER == "hf" and bool(HF_TOKEN)
+    if not (use_openai or use_hf):
+        print("AI polish: SKIP (no provider configured)", "provider=", PROVIDER, "url=", url)
+        return draft
+
+    # the slot is taken before the call: concurrent ingests can't overshoot the budget
+    if not await _reserve_budget_async():
         print("AI polish: SKIP (budget exceeded)", "url=", url)
         return draft
     
@@ -191,22 +285,17 @@ async def ai_polish_summary(draft: str, title: str = "", url: str = "") -> str:
     )
 
     # 🔹 OpenAI (PRIMARY)
-    if PROVIDER in ("openai", "gpt") and OPENAI_API_KEY:
+    if use_openai:
         print("AI polish: USING OPENAI", "model=", OPENAI_MODEL, "url=", url)
         out = await _openai_polish(draft, title, url)
-        await _bump_budget_async()
+        await _polish_store(key, draft, out)
         return out or draft
 
-
     # 🔹 HuggingFace fallback
-    if PROVIDER == "hf" and HF_TOKEN:
-        print("AI polish: USING HF", "model=", HF_MODEL, "url=", url)
-        out = await _hf_polish(draft, title, url)
-        await _bump_budget_async()
-        return out or draft
-
-    print("AI polish: SKIP (no provider configured)", "provider=", PROVIDER, "url=", url)
-    return draft
+    print("AI polish: USING HF", "model=", HF_MODEL, "url=", url)
+    out = await _hf_polish(draft, title, url)
+    await _polish_store(key, draft, out)
+    return out or draft
 
 async def ai_extract_flgov_date(page_text: str, url: str) -> datetime | None:
     """
@@ -287,8 +287,7 @@ def _il_extract_title(html: str, fallback: str = "") -> str:
                 cands.append(t)
 
     if cands:
-        cands.sort(key=len, reverse=True)
-        return cands[0]
+        return max(cands, key=len)  # first of the longest
 
     # 4) title tag fallback (often "Some Headline - Illinois.gov")
     m = re.search(r'(?is)<title[^>]*>(.*?)</title>', html)
@@ -2327,8 +2326,7 @@ def _extract_h1(html: str) -> str:
             h1s.append(t)
 
     if h1s:
-        h1s.sort(key=len, reverse=True)
-        return h1s[0]
+        return max(h1s, key=len)  # first of the longest
 
     # 3) title tag fallback
     m = re.search(r'(?is)<title[^>]*>(.*?)</title>', html)
@@ -3664,7 +3662,7 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                                     except Exception:
                                         pass
 
-                            pdf_text = _extract_pdf_text_from_bytes(pr.content if pr and pr.content else b"")
+                            pdf_text = await asyncio.to_thread(_extract_pdf_text_from_bytes, pr.content if pr and pr.content else b"")
                             pdf_text = _nz(pdf_text)
 
                             summary = ""
@@ -4070,7 +4068,7 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                             if pr.status_code >= 400:
                                 continue
 
-                            pdf_text = _extract_pdf_text_from_bytes(pr.content or b"")
+                            pdf_text = await asyncio.to_thread(_extract_pdf_text_from_bytes, pr.content or b"")
                             pdf_text = _nz(pdf_text)
 
                             # best date signal from the EO testimony line
@@ -4354,7 +4352,7 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                         if pr.status_code >= 400 or not pr.content:
                             continue
 
-                        pdf_text = _extract_pdf_text_from_bytes(pr.content or b"")
+                        pdf_text = await asyncio.to_thread(_extract_pdf_text_from_bytes, pr.content or b"")
                         pdf_text = _nz(pdf_text)
 
                         dt_pdf = _wa_date_from_pdf_text(pdf_text)
@@ -4466,7 +4464,7 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                         if pr.status_code >= 400 or not pr.content:
                             continue
 
-                        pdf_text = _extract_pdf_text_from_bytes(pr.content or b"")
+                        pdf_text = await asyncio.to_thread(_extract_pdf_text_from_bytes, pr.content or b"")
                         pdf_text = _nz(pdf_text)
 
                         pub_dt = _wa_date_from_proc_pdf_text(pdf_text)
@@ -4674,7 +4672,7 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                         if pr.status_code >= 400:
                             continue
 
-                        pdf_text = _extract_pdf_text_from_bytes(pr.content or b"")
+                        pdf_text = await asyncio.to_thread(_extract_pdf_text_from_bytes, pr.content or b"")
                         pdf_text = _nz(pdf_text)
 
                         # Date from EO testimony line (best signal)
@@ -4735,7 +4733,7 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                             # still upsert using listing title/desc + status + pub_dt
                             pdf_text = ""
                         else:
-                            pdf_text = _extract_pdf_text_from_bytes(pr.content or b"")
+                            pdf_text = await asyncio.to_thread(_extract_pdf_text_from_bytes, pr.content or b"")
 
                         # date from URL or filename, else Last-Modified header
                         pub_dt = _date_from_dated_url(url) or _date_from_il_pdf_filename(url)
@@ -4746,7 +4744,6 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                                     pub_dt = parsedate_to_datetime(lm).astimezone(timezone.utc)
                                 except Exception:
                                     pass
-                        pdf_text = _extract_pdf_text_from_bytes(pr.content if pr and pr.content else b"")
                         pdf_text = _nz(pdf_text)
                         summary = ""
                         if pdf_text:
@@ -4858,7 +4855,7 @@ async def ingest_state_newsroom(states: List[str] | None = None, max_pages: int
                         if m_pdf:
                             pdf_url = _abs_nygov(m_pdf.group("u"))
                             pr = await _get(cx, pdf_url)
-                            pdf_text = _extract_pdf_text_from_bytes(pr.content if pr and pr.content else b"")
+                            pdf_text = await asyncio.to_thread(_extract_pdf_text_from_bytes, pr.content if pr and pr.content else b"")
                             if pdf_text:
                                 summary = summarize_text(pdf_text, max_sentences=3, max_chars=700)
 
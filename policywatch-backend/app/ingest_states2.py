@@ -7,12 +7,18 @@ load_dotenv(dotenv_path=Path(__file__).resolve().parents[1] / ".env", override=F
 import xml.etree.ElementTree as ET
 import re
 import asyncio
+import functools
+from bisect import bisect_left, bisect_right
+from collections import deque
+from contextlib import aclosing
+from itertools import islice
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, List, Tuple
+from typing import Any, Callable, Optional, Dict, List, Tuple, Iterable, AsyncIterator, Awaitable
 from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, urljoin, unquote
 import html as _html
 import httpx
+import asyncpg
 from email.utils import parsedate_to_datetime
 import json
 from .db import connection
@@ -23,11 +29,17 @@ from .summarize import (
     _soft_normalize_caps,
     BROWSER_UA_HEADERS,
     _strip_html_to_text,
+    _extract_main_html,
 )
 from .ai_summarizer import ai_polish_summary
 import io
 from pypdf import PdfReader
 import os
+
+# page-head / sample dumps from the crawlers (slices, html.count scans, big reprs);
+# the one-line mode/new/seen summaries always print. INGEST_DEBUG=1 turns them on.
+_INGEST_DEBUG = os.getenv("INGEST_DEBUG", "0") == "1"
+
 # ----------------------------
 # PDF extraction (robust)
 # ----------------------------
@@ -37,20 +49,35 @@ try:
 except Exception:
     _pdf_extract_text = None
 
-def _extract_pdf_text_from_bytes(data: bytes) -> str:
+# summary-only callers read just the opening pages: the operative text of an
+# order/release is up front, and TextRank cost grows with the square of the
+# sentence count. Callers that date a document from its seal/signature line
+# (usually on the last page) still extract everything.
+_PDF_SUMMARY_MAX_PAGES = 5
+
+# filename -> fallback title: one translate pass instead of two chained
+# replace() copies. ".pdf" is still dropped wherever it appears (not just as
+# a suffix) so titles stay identical to what is already stored.
+_PDF_TITLE_TRANS = str.maketrans("_-", "  ")
+
+def _pdf_title_from_fname(fname: str) -> str:
+    return fname.replace(".pdf", "").translate(_PDF_TITLE_TRANS).strip()
+
+def _extract_pdf_text_from_bytes(data: bytes, max_pages: int = 0) -> str:
     """
-    Best-effort PDF -> text.
+    Best-effort PDF -> text (first max_pages pages; 0 = all).
     1) pdfminer.six (best for layout/text PDFs)
     2) pypdf fallback (better than returning "")
+    Pure CPU; the ingests call it through asyncio.to_thread.
     """
     if not data:
         return ""
 
-    # 1) pdfminer
+    # 1) pdfminer (pages are parsed lazily, so maxpages stops the work early)
     if _pdf_extract_text is not None:
         try:
             bio = io.BytesIO(data)
-            return _pdf_extract_text(bio) or ""
+            return _pdf_extract_text(bio, maxpages=max_pages) or ""
         except Exception:
             pass
 
@@ -60,7 +87,8 @@ def _extract_pdf_text_from_bytes(data: bytes) -> str:
         bio = io.BytesIO(data)
         reader = PdfReader(bio)
         out = []
-        for page in reader.pages:
+        pages = reader.pages[:max_pages] if max_pages else reader.pages
+        for page in pages:
             try:
                 out.append(page.extract_text() or "")
             except Exception:
@@ -69,6 +97,99 @@ def _extract_pdf_text_from_bytes(data: bytes) -> str:
     except Exception:
         return ""
 
+# ----------------------------
+# JSON decoding (orjson when available)
+# ----------------------------
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+def _jloads(s: str | bytes):
+    """
+    json.loads, via orjson when it's installed.
+    Falls back to the stdlib for what orjson rejects (NaN/Infinity, >64-bit ints).
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(s)
+        except Exception:
+            pass
+    return json.loads(s)
+
+# ----------------------------
+# HTTP/2 (when httpx's h2 extra is installed)
+# ----------------------------
+try:
+    import h2  # noqa: F401  (httpx raises at client creation without it)
+    _HTTP2 = True
+except Exception:
+    _HTTP2 = False
+
+# ----------------------------
+# Shared href / tag regexes
+# ----------------------------
+_HREF_BRE = re.compile(rb'href=["\']([^"\']+)["\']', re.I)
+_HREF_RE = re.compile(r'(?i)href=["\']([^"\']+)["\']')
+_TAG_STRIP_RE = re.compile(r"(?is)<[^>]+>")
+_TITLE_TAG_RE = re.compile(r"(?is)<title[^>]*>(.*?)</title>")
+_META_OG_TITLE_RE = re.compile(r'(?is)<meta[^>]+property=["\']og:title["\'][^>]+content=["\'](.*?)["\']')
+# body scans are possessive (3.11+ re): on an unclosed tag they fail in one pass
+# instead of retrying the lazy .*? from every position
+_H1_RE = re.compile(r"(?is)<h1[^>]*+>((?:[^<]++|<(?!/h1>))*+)</h1>")
+
+def _clean_fragment(t: str) -> str:
+    """
+    Tags -> " ", whitespace collapsed, stripped (for titles/h1s/short snippets).
+    Most fragments are plain text, so the tag regex only runs when there's a "<".
+    """
+    if "<" in t:
+        t = _TAG_STRIP_RE.sub(" ", t)
+    return " ".join(t.split())
+
+def _iter_hrefs(html: bytes) -> list[str]:
+    """
+    All href="..." values of a page, in document order, with JSON-escaped
+    slashes ("\\/") undone. A raw bytes scan rather than a DOM walk, so hrefs
+    inside inline script/JSON payloads come back too.
+    """
+    if not html:
+        return []
+    return [
+        m.group(1).replace(b"\\/", b"/").decode("utf-8", "replace")
+        for m in _HREF_BRE.finditer(html)
+    ]
+
+def _compile_keep_alternation(patterns: dict[str, str]) -> re.Pattern:
+    """
+    One anchored, case-insensitive regex over several link-filter patterns:
+    {"bucket": pattern, ...} -> (?P<bucket>pattern)|...  Use with .match();
+    m.lastgroup is the first bucket (in dict order) that matched.
+    """
+    return re.compile("|".join(f"(?P<{k}>{p})" for k, p in patterns.items()), re.I)
+
+def _abs_url(u: str, origin: str, *, keep_query: bool = False) -> str:
+    """
+    Shared body of the per-state _abs_* helpers: drop #fragment, strip,
+    absolutize against origin ("https://host", no trailing slash), drop ?query.
+    find + slice only; no split() lists.
+    """
+    h = u.find("#")
+    if h >= 0:
+        u = u[:h]
+    u = u.strip()
+    if not keep_query:
+        q = u.find("?")
+        if q >= 0:
+            u = u[:q]
+    if u.startswith("//"):
+        return "https:" + u
+    if u.startswith("http"):
+        return u
+    if u.startswith("/"):
+        return origin + u
+    return origin + "/" + u
+
 # ----------------------------
 # Ohio config
 # ----------------------------
@@ -166,6 +287,9 @@ VA_STATUS_MAP = {
     "proclamations": "proclamation",
     "executive_orders": "executive_order",
 }
+# compared against on every detail page
+_VA_NEWS_STATUS = VA_STATUS_MAP["news_releases"]
+_VA_PROC_STATUS = VA_STATUS_MAP["proclamations"]
 
 # --- Virginia listing scanners ---
 _VA_NEWS_DETAIL_PATH_RE = re.compile(r"^/newsroom/news-releases/.*\.html?$", re.I)
@@ -198,12 +322,12 @@ _GA_DATE_IN_PATH_RE = re.compile(r"^/press-releases/(?P<d>\d{4}-\d{2}-\d{2})/",
 
 def _date_from_ga_url(url: str) -> datetime | None:
     try:
-        path = urlsplit(url).path
+        path = _url_path(url)
         m = _GA_DATE_IN_PATH_RE.match(path)
         if not m:
             return None
-        d = m.group("d")
-        return datetime.strptime(d, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        d = m.group("d")  # YYYY-MM-DD, digits guaranteed by the regex
+        return _utc_date(int(d[:4]), int(d[5:7]), int(d[8:10]))
     except Exception:
         return None
     
@@ -267,7 +391,7 @@ async def _collect_ga_eo_year_urls(cx: httpx.AsyncClient, home_url: str) -> list
 
     # Sort descending by year in path
     def _year_key(u: str) -> int:
-        m2 = re.search(r"/(\d{4})$", urlsplit(u).path or "")
+        m2 = re.search(r"/(\d{4})$", _url_path(u) or "")
         return int(m2.group(1)) if m2 else 0
 
     years.sort(key=_year_key, reverse=True)
@@ -405,7 +529,7 @@ async def _collect_va_news_urls_by_prev_links(
             cands = []
             for mm in _VA_NAV_NEWS_LINK_RE.finditer(html.replace("\\/", "/")):
                 u = _abs_va(mm.group("href"))
-                if u and u != cur and _VA_NEWS_DETAIL_PATH_RE.match(urlsplit(u).path):
+                if u and u != cur and _VA_NEWS_DETAIL_PATH_RE.match(_url_path(u)):
                     cands.append(u)
             # pick the first distinct candidate
             if cands:
@@ -417,7 +541,7 @@ async def _collect_va_news_urls_by_prev_links(
 
         nxt = _abs_va(prev_href)
         # safety: only stay within VA news releases
-        if not _VA_NEWS_DETAIL_PATH_RE.match(urlsplit(nxt).path):
+        if not _VA_NEWS_DETAIL_PATH_RE.match(_url_path(nxt)):
             break
 
         cur = nxt
@@ -433,25 +557,24 @@ async def _collect_va_news_urls(
     stop_at_url: str | None = None,
 ) -> List[str]:
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         print("VA NEWS LIST fetch failed:", r.status_code, "len=", len(r.text or ""))
         return []
 
-    html = r.text.replace("\\/", "/")
+    html = _resp_html(r)
     print("VA NEWS LIST len=", len(html), "count('/newsroom/news-releases/')=", html.count("/newsroom/news-releases/"))
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
 
     out: List[str] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
+    for m in _HREF_RE.finditer(html):
         href = (m.group(1) or "").strip()
         if not href:
             continue
 
         # normalize to absolute
         u = _abs_va(href)
-        path = urlsplit(u).path
+        path = _url_path(u)
 
         if not _VA_NEWS_DETAIL_PATH_RE.match(path):
             continue
@@ -483,13 +606,13 @@ _VA_YEAR_RE = re.compile(r'\b(20\d{2})\b')
 
 _VA_FOR_IMMEDIATE_RE = re.compile(r'For Immediate Release:\s*([A-Za-z]{3,9}\.?\s+\d{1,2},\s+\d{4})', re.I)
 
-def _date_from_va_news(html: str, url: str) -> datetime | None:
+def _date_from_va_news(html: str, url: str, page: ParsedPage | None = None) -> datetime | None:
     """
     VA news pages include: "For Immediate Release: December 22, 2025"
     """
     if not html:
         return None
-    text = _strip_html_to_text(html)
+    text = page.text if page is not None else _strip_html_to_text(html)
     m = _VA_FOR_IMMEDIATE_RE.search(text)
     if m:
         dt = _parse_us_month_date(m.group(1))
@@ -499,8 +622,7 @@ def _date_from_va_news(html: str, url: str) -> datetime | None:
 
 # proclamations listing shows: "<a ...>Title</a>  ~ 16 Jan 2026" OR "~ 12 Jan 2026 to 16 Jan 2026"
 _VA_LISTING_DATE_DMY_RE = re.compile(
-    r'\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\s+(20\d{2})\b',
-    re.I
+    r'(?i)\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\s+(20\d{2})\b'
 )
 
 _MONTH_ABBR = {
@@ -508,6 +630,13 @@ _MONTH_ABBR = {
     "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12
 }
 
+# full (lowercase) month name -> number; shared by every state's date parser
+_MONTH_FULL = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12,
+}
+
 _VA_PROC_DETAIL_PATH_RE = re.compile(r"^/newsroom/proclamations/proclamation-list/", re.I)
 
 _VA_ANY_DATE_MDY_RE = re.compile(
@@ -517,7 +646,7 @@ _VA_ANY_DATE_MDY_RE = re.compile(
 )
 
 def _parse_any_va_date(s: str) -> datetime | None:
-    s = re.sub(r"\s+", " ", (s or "").strip())
+    s = _WS_RE.sub(" ", (s or "").strip())
 
     m = _VA_LISTING_DATE_DMY_RE.search(s)
     if m:
@@ -547,24 +676,23 @@ async def _collect_va_proclamation_urls_with_dates(
     stop_at_url: str | None = None,
 ) -> list[tuple[str, datetime | None]]:
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         print("VA PROC LIST fetch failed:", r.status_code, "len=", len(r.text or ""))
         return []
 
-    html = r.text.replace("\\/", "/")
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+    html = _resp_html(r)
 
     # 1) collect ALL unique (url, dt) pairs first
     pairs: list[tuple[str, datetime | None]] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
+    for m in _HREF_RE.finditer(html):
         href = (m.group(1) or "").strip()
         if not href:
             continue
 
         u = _abs_va(href)
-        path = urlsplit(u).path
+        path = _url_path(u)
         if not _VA_PROC_DETAIL_PATH_RE.match(path):
             continue
         if u in seen:
@@ -670,7 +798,7 @@ def _hi_posted_dt_from_listing_chunk(chunk: str) -> datetime | None:
 
     # fallback: "Jan 23, 2026"
     text = re.sub(r"(?is)<[^>]+>", " ", chunk or "")
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RE.sub(" ", text).strip()
     m2 = _US_MONTH_DATE_RE.search(text)
     if m2:
         dt2 = _parse_us_month_date(m2.group(0))
@@ -747,18 +875,12 @@ NJ_STATUS_MAP = {
 NJ_JURISDICTION = "new_jersey"
 NJ_AGENCY = "New Jersey Governor"
 
+@functools.lru_cache(maxsize=8192)
 def _abs_nj(u: str) -> str:
     if not u:
         return ""
-    u = u.split("#")[0].strip()
-    if u.startswith("//"):
-        u = "https:" + u
-    if u.startswith("http"):
-        return u.split("?")[0]
-    if not u.startswith("/"):
-        u = "/" + u
     # ✅ prefer www.nj.gov (matches new governor pages exactly)
-    return ("https://www.nj.gov" + u).split("?")[0]
+    return _abs_url(u, "https://www.nj.gov")
 
 # NEW format only:
 #   /governor/news/2026/approved/20260122a.shtml
@@ -773,18 +895,18 @@ def _date_from_nj_press_url(url: str) -> datetime | None:
     Extracts YYYYMMDD from the press release URL.
     """
     try:
-        path = urlsplit(url).path
+        path = _url_path(url)
         m = _NJ_PRESS_DETAIL_RE.match(path)
         if not m:
             return None
-        ymd = m.group("ymd")
-        dt = datetime.strptime(ymd, "%Y%m%d").replace(tzinfo=timezone.utc)
+        ymd = m.group("ymd")  # YYYYMMDD, digits guaranteed by the regex
+        dt = _utc_date(int(ymd[:4]), int(ymd[4:6]), int(ymd[6:8]))
         return _date_guard_not_future(dt)
     except Exception:
         return None
     
 def _nj_title_from_url(url: str) -> str:
-    path = urlsplit(url).path
+    path = _url_path(url)
     fname = path.rsplit("/", 1)[-1]
     fname = re.sub(r"\.shtml$", "", fname, flags=re.I)
 
@@ -827,24 +949,23 @@ async def _collect_nj_press_release_pairs(
 
     out: list[tuple[str, datetime | None]] = []
     seen: set[str] = set()
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
 
     for y in years_to_fetch:
         archive_url = _nj_press_archive_url(y)
         r = await _get(cx, archive_url, headers={"Referer": archive_url})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             # normal if future-year archive doesn't exist yet
             continue
 
-        html = r.text.replace("\\/", "/")
+        html = _resp_html(r)
 
         page_urls: list[str] = []
-        for m in href_re.finditer(html):
+        for m in _HREF_RE.finditer(html):
             href = (m.group(1) or "").strip()
             if not href:
                 continue
             u = _abs_nj(href)
-            path = urlsplit(u).path
+            path = _url_path(u)
             mm = _NJ_PRESS_DETAIL_RE.match(path)
             if not mm:
                 continue
@@ -879,6 +1000,18 @@ async def _collect_nj_press_release_pairs(
 
     return final
 
+_WS_RE = re.compile(r"\s+")
+
+# common non-headline lines on NJ legacy pages
+_NJ_TITLE_DROP_LINE_RE = re.compile(
+    r"(?i)^(posted on|updated|print|share|translate|back to top|home|administration|key initiatives|news and events|contact us)$"
+)
+
+_NJ_DATE_ONLY_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")
+
+# one line of text (same separators as str.splitlines)
+_NJ_LINE_RE = re.compile(r"[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]+")
+
 def _extract_nj_press_title(html: str) -> str:
     """
     NJ governor press release pages are old-school HTML tables and often do NOT have <h1>.
@@ -927,45 +1060,41 @@ def _extract_nj_press_title(html: str) -> str:
         tl = t.lower()
         if "for immediate release" in tl:
             continue
-        if re.fullmatch(r"\d{1,2}/\d{1,2}/\d{2,4}", t):  # just a date
+        if _NJ_DATE_ONLY_RE.fullmatch(t):  # just a date
             continue
         candidates.append(t)
 
     # 4) <title> tag fallback (often includes real headline + suffix)
-    m = re.search(r'(?is)<title[^>]*>(.*?)</title>', blob)
+    m = _TITLE_TAG_RE.search(blob)
     if m:
         t = _clean_nj_title(m.group(1))
         if t:
             candidates.append(t)
 
     # 5) Fallback: derive headline from visible body text near the top
-    try:
-        txt = _strip_html_to_text(blob)
-        lines = [re.sub(r"\s+", " ", ln).strip() for ln in txt.splitlines()]
-        lines = [ln for ln in lines if 10 <= len(ln) <= 180]
-
-        # drop common non-headline lines
-        drop_re = re.compile(
-            r"(?i)^(posted on|updated|print|share|translate|back to top|home|administration|key initiatives|news and events|contact us)$"
-        )
-
-        cleaned = []
-        for ln in lines[:80]:  # only scan the top
-            if drop_re.search(ln):
-                continue
-            if re.fullmatch(r"\d{1,2}/\d{1,2}/\d{2,4}", ln):
-                continue
-            if _is_generic_nj_title(ln):
-                continue
-            cleaned.append(ln)
+    # (the costliest step; skip it when steps 1-4 already found a usable headline)
+    has_good = any(20 <= len(c) <= 140 and not _is_generic_nj_title(c) for c in candidates)
+    if not has_good:
+        try:
+            txt = _strip_html_to_text(blob)
+            # lazily walk lines; only the first usable one is ever needed
+            lines = (_WS_RE.sub(" ", lm.group(0)).strip() for lm in _NJ_LINE_RE.finditer(txt))
+            lines = (ln for ln in lines if 10 <= len(ln) <= 180)
 
-        if cleaned:
-            candidates.append(cleaned[0])
-    except Exception:
-        pass
+            for ln in islice(lines, 80):  # only scan the top
+                if _NJ_TITLE_DROP_LINE_RE.search(ln):
+                    continue
+                if _NJ_DATE_ONLY_RE.fullmatch(ln):
+                    continue
+                if _is_generic_nj_title(ln):
+                    continue
+                candidates.append(ln)
+                break
+        except Exception:
+            pass
 
     # --- rank + return best ---
-    # Dedup while preserving order
+    # Dedup while preserving order, dropping generic titles in the same pass
     seen = set()
     uniq: list[str] = []
     for t in candidates:
@@ -973,68 +1102,71 @@ def _extract_nj_press_title(html: str) -> str:
         if not key or key in seen:
             continue
         seen.add(key)
+        if _is_generic_nj_title(t):
+            continue
         uniq.append(t)
 
-    # drop generic
-    uniq = [t for t in uniq if not _is_generic_nj_title(t)]
-
     if not uniq:
         return ""
 
-    # Prefer longer, more “headline-like” titles (but not absurdly long)
-    def score(t: str) -> tuple[int, int]:
-        tl = t.lower()
-        # penalize obviously non-headline junk
-        penalty = 0
-        if "http" in tl:
-            penalty -= 50
-        if "pdf" in tl:
-            penalty -= 10
-        # reward reasonable length
-        ln = len(t)
-        return (penalty + min(ln, 140), ln)
-
-    uniq.sort(key=score, reverse=True)
-    return uniq[0].strip()
+    # only the best is needed (max keeps the first on ties, same as the stable sort did)
+    return max(uniq, key=_nj_title_score).strip()
+
+_NJ_GENERIC_TITLES = {"news", "press release", "press releases", "home"}
+
+# site-chrome substrings, matched in one pass (input is already lowercased)
+_NJ_GENERIC_TITLE_RE = re.compile(
+    r"official site of the state of new jersey|state of new jersey|office of the governor|nj\.gov|services \| agencies \| faqs"
+)
+
+def _nj_title_score(t: str) -> tuple[int, int]:
+    """
+    Prefer longer, more “headline-like” titles (but not absurdly long).
+    Junk needles are plain literals, so str containment (not regex) is the fast path.
+    """
+    tl = t.lower()
+    # penalize obviously non-headline junk
+    penalty = 0
+    if "http" in tl:
+        penalty -= 50
+    if "pdf" in tl:
+        penalty -= 10
+    # reward reasonable length
+    ln = len(t)
+    return (penalty + min(ln, 140), ln)
 
 def _is_generic_nj_title(t: str) -> bool:
     if not t:
         return True
 
-    tl = re.sub(r"\s+", " ", t.strip().lower())
+    tl = _WS_RE.sub(" ", t.strip().lower())
 
-    if tl in {"news", "press release", "press releases", "home"}:
+    if tl in _NJ_GENERIC_TITLES:
         return True
 
     # ✅ governor-site chrome line usually includes both Governor and Lt. Governor
-    if ("governor" in tl) and ("lt. governor" in tl):
+    # ("lt. governor" already contains "governor", so one literal test covers both)
+    if "lt. governor" in tl:
         # looks like header, not a headline
         if ("|" in tl) or ("·" in tl) or len(tl) <= 120:
             return True
 
-    hard_bad = [
-        "official site of the state of new jersey",
-        "official site of the state of new jersey",
-        "state of new jersey",
-        "office of the governor",
-        "nj.gov",
-        "services | agencies | faqs",
-    ]
-
-    if any(x in tl for x in hard_bad):
+    if _NJ_GENERIC_TITLE_RE.search(tl):
         if len(tl) <= 90 or ("|" in tl) or (" - " in tl) or ("·" in tl):
             return True
 
     return False
 
+# tags (if any slipped in) and whitespace runs collapse to one space in a single pass
+_NJ_TAG_OR_WS_RE = re.compile(r"(?is)(?:<[^>]+>|\s)+")
+
+# common suffixes found in <title> tags: "- Governor ...", "| Governor ...", "| State of New Jersey ..."
+_NJ_TITLE_SUFFIX_RE = re.compile(r"(?i)\s*(?:[\-|–—]\s*Governor|\|\s*State of New Jersey).*$")
+
 def _clean_nj_title(t: str) -> str:
     t = _html.unescape(t or "")
-    t = re.sub(r"(?is)<[^>]+>", " ", t)          # strip tags if any slipped in
-    t = re.sub(r"\s+", " ", t).strip()
-    # remove common suffixes found in <title> tags
-    t = re.sub(r"(?i)\s*[\-|–|—]\s*Governor.*$", "", t).strip()
-    t = re.sub(r"(?i)\s*\|\s*Governor.*$", "", t).strip()
-    t = re.sub(r"(?i)\s*\|\s*State of New Jersey.*$", "", t).strip()
+    t = _NJ_TAG_OR_WS_RE.sub(" ", t).strip()
+    t = _NJ_TITLE_SUFFIX_RE.sub("", t).strip()
     return t
 
 # ✅ EO rolling window (future-proof)
@@ -1048,12 +1180,23 @@ NJ_EO_MURPHY_CUTOFF_PDF = _abs_nj("https://nj.gov/infobank/eo/056murphy/pdf/EO-3
 # NJ_EO_MURPHY_CUTOFF_PDF = "https://www.nj.gov/infobank/eo/056murphy/pdf/EO-350.pdf"
 
 
-_NJ_EO_PDF_NUM_RE = re.compile(r"^/infobank/eo/(?P<govdir>\d{3}[a-z]+)/pdf/EO-(?P<num>\d+)\.pdf$", re.I)
+# anchored on the full URL (scheme/host optional) so callers can skip urlsplit(u).path
+_NJ_EO_PDF_NUM_RE = re.compile(
+    r"^(?:https?://[^/?#]+)?/infobank/eo/(?P<govdir>\d{3}[a-z]+)/pdf/EO-(?P<num>\d+)\.pdf$", re.I
+)
+
+# one-pass href matcher for EO PDFs (any governor folder):
+# captures the URL (minus query/fragment), govdir and EO number straight from the raw href
+_NJ_EO_HREF_FUSED_RE = re.compile(
+    r'href=["\']\s*(?P<u>(?:(?:https?:)?//[^/"\'\s]+/|/)?infobank/eo/(?P<govdir>\d{3}[a-z]+)/pdf/EO-(?P<num>\d+)\.pdf)'
+    r'(?:[?#][^"\']*)?\s*["\']',
+    re.I,
+)
 
+@functools.lru_cache(maxsize=8192)
 def _nj_eo_num_from_url(u: str) -> int | None:
     try:
-        path = urlsplit(_abs_nj(u)).path
-        m = _NJ_EO_PDF_NUM_RE.match(path)
+        m = _NJ_EO_PDF_NUM_RE.match(_abs_nj(u))
         return int(m.group("num")) if m else None
     except Exception:
         return None
@@ -1070,53 +1213,54 @@ async def _collect_nj_eo_pdf_pairs_until_cutoff(
     Uses Date Issued (YYYY/MM/DD) when present in the row.
     """
     cutoff_pdf_url = _abs_nj(cutoff_pdf_url)
+    cutoff_num = _nj_eo_num_from_url(cutoff_pdf_url)
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         return []
 
-    html = r.text.replace("\\/", "/")
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+    html = r.content.replace(b"\\/", b"/")
 
     rows: list[tuple[str, int, datetime | None]] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
-        href = (m.group(1) or "").strip()
-        if not href:
-            continue
-
-        u = _abs_nj(href)
-        mm = _NJ_EO_PDF_NUM_RE.match(urlsplit(u).path)
-        if not mm:
-            continue
+    # rows at/below the cutoff never survive except the highest one (the inclusive stop),
+    # so keep just that one instead of collecting and sorting the whole archive
+    boundary: tuple[str, int, datetime | None] | None = None
 
+    for m, dm in _nj_iter_eo_rows(html, after=800):
+        u = _abs_nj(m.group("u").decode("ascii", "replace"))
         if u in seen:
             continue
         seen.add(u)
 
-        num = _nj_eo_num_from_url(u)
-        if num is None:
+        num = int(m.group("num"))
+
+        below_cutoff = cutoff_num is not None and num <= cutoff_num
+        if below_cutoff and boundary is not None and num <= boundary[1]:
             continue
 
         # Date Issued near row (same approach you already use)
-        ctx = html[m.start(): m.start() + 800]
         dt = None
-        dm = _NJ_DATE_YYYYMMDD_SLASH_RE.search(ctx)
         if dm:
             try:
-                dt = datetime(int(dm.group(1)), int(dm.group(2)), int(dm.group(3)), tzinfo=timezone.utc)
+                yy, mo, dd = _fast_ymd(html, dm.start("date"))
+                dt = _utc_date(yy, mo, dd)
                 dt = _date_guard_not_future(dt)
             except Exception:
                 dt = None
 
+        if below_cutoff:
+            boundary = (u, num, dt)
+            continue
+
         rows.append((u, num, dt))
         if len(rows) >= limit:
             break
 
     # newest first by EO number (more reliable than HTML order)
     rows.sort(key=lambda x: x[1], reverse=True)
-
-    cutoff_num = _nj_eo_num_from_url(cutoff_pdf_url)
+    if boundary is not None:
+        rows.append(boundary)
 
     print("NJ EO cutoff:", cutoff_pdf_url, "num=", cutoff_num)  # 👈 ADD THIS LINE
 
@@ -1130,7 +1274,7 @@ async def _collect_nj_eo_pdf_pairs_until_cutoff(
                 break
         else:
             # fallback to URL compare if cutoff_num couldn't be parsed
-            if _abs_nj(u) == cutoff_pdf_url:
+            if u == cutoff_pdf_url:
                 break
 
     return out
@@ -1140,11 +1284,57 @@ async def _collect_nj_eo_pdf_pairs_until_cutoff(
 # NJ Executive Orders archive parsing
 # ----------------------------
 
-# EO PDFs look like: /infobank/eo/056murphy/pdf/EO-408.pdf
-_NJ_EO_PDF_RE = re.compile(r"^/infobank/eo/056murphy/pdf/EO-(\d+)\.pdf$", re.I)
+# EO PDF hrefs and Date Issued tokens in one alternation, so a page is swept once in DOM order
+# (bytes pattern: archive pages are scanned straight from r.content without decoding the body)
+_NJ_ROW_TOKEN_RE = re.compile(
+    rb"(?P<pdf>" + _NJ_EO_HREF_FUSED_RE.pattern.encode("ascii") + rb")"
+    rb"|(?P<date>\b20\d{2}/\d{2}/\d{2}\b)",
+    re.I,
+)
+
+def _fast_ymd(buf: bytes, off: int) -> tuple[int, int, int]:
+    """
+    Parse a YYYY/MM/DD token at buf[off:off + 10] with digit arithmetic
+    (indexing bytes yields ints, so no group()/int() round-trips).
+    """
+    return (
+        (buf[off] - 48) * 1000 + (buf[off + 1] - 48) * 100 + (buf[off + 2] - 48) * 10 + (buf[off + 3] - 48),
+        (buf[off + 5] - 48) * 10 + (buf[off + 6] - 48),
+        (buf[off + 8] - 48) * 10 + (buf[off + 9] - 48),
+    )
+
+def _nj_iter_eo_rows(html: bytes, *, before: int = 0, after: int = 800):
+    """
+    Single forward pass over an EO archive page (raw bytes).
+    Yields (pdf_match, date_match | None) in page order, pairing each EO PDF href with the
+    first Date Issued token inside [href - before, href + after] (the row window the
+    collectors used to slice out and re-scan per link).
+    """
+    pending: deque[re.Match] = deque()   # PDFs still waiting for a date
+    recent: deque[re.Match] = deque()    # dates that can still be looked back to
+
+    for tok in _NJ_ROW_TOKEN_RE.finditer(html):
+        if tok.group("date"):
+            # rows whose window closed before this date never got one
+            while pending and tok.end() > pending[0].start() + after:
+                yield pending.popleft(), None
+            while pending:
+                yield pending.popleft(), tok
+            if before:
+                recent.append(tok)
+            continue
+
+        if before:
+            while recent and recent[0].start() < tok.start() - before:
+                recent.popleft()
+            if recent:
+                yield tok, recent[0]
+                continue
 
-# Date Issued column is YYYY/MM/DD in the HTML table (as shown in your screenshot)
-_NJ_DATE_YYYYMMDD_SLASH_RE = re.compile(r"\b(20\d{2})/(\d{2})/(\d{2})\b")
+        pending.append(tok)
+
+    while pending:
+        yield pending.popleft(), None
 
 # ----------------------------
 # NJ Executive Orders - dynamic governor discovery (future-proof)
@@ -1152,16 +1342,11 @@ _NJ_DATE_YYYYMMDD_SLASH_RE = re.compile(r"\b(20\d{2})/(\d{2})/(\d{2})\b")
 
 NJ_EO_INDEX = "https://nj.gov/infobank/eo/"
 
-# matches EO PDFs for ANY governor folder, e.g.
-# /infobank/eo/056murphy/pdf/EO-411.pdf
-# /infobank/eo/055christie/pdf/EO-123.pdf
-_NJ_EO_PDF_ANYGOV_RE = re.compile(r"^/infobank/eo/\d{3}[a-z]+/pdf/EO-(\d+)\.pdf$", re.I)
-
 # matches governor EO listing pages we can ingest from
 # e.g. /infobank/eo/056murphy/approved/eo_archive.shtml
 #      /infobank/eo/055christie/index.shtml
 _NJ_EO_GOV_PAGE_RE = re.compile(
-    r"^/infobank/eo/(?P<govdir>\d{3}[a-z]+)/(?:(?:approved/eo_archive\.shtml)|index\.shtml)$",
+    r"^(?:https?://[^/?#]+)?/infobank/eo/(?P<govdir>\d{3}[a-z]+)/(?:(?:approved/eo_archive\.shtml)|index\.shtml)$",
     re.I,
 )
 
@@ -1185,22 +1370,20 @@ async def _nj_find_latest_governor_eo_page(cx: httpx.AsyncClient) -> str:
     fallback = NJ_PUBLIC_PAGES.get("executive_orders", "")
     try:
         r = await _get(cx, NJ_EO_INDEX, headers={"Referer": NJ_EO_INDEX})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             return fallback
 
-        html = r.text.replace("\\/", "/")
-        href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+        html = _resp_html(r)
 
         best_num = -1
         best_url = ""
 
-        for m in href_re.finditer(html):
+        for m in _HREF_RE.finditer(html):
             href = (m.group(1) or "").strip()
             if not href:
                 continue
             u = _abs_nj(href)
-            path = urlsplit(u).path
-            mm = _NJ_EO_GOV_PAGE_RE.match(path)
+            mm = _NJ_EO_GOV_PAGE_RE.match(u)
             if not mm:
                 continue
 
@@ -1231,40 +1414,27 @@ async def _collect_nj_eo_pdf_pairs_2024_2025_anygov(
     Same as _collect_nj_eo_pdf_pairs_2024_2025, but accepts EO PDFs for ANY governor folder.
     """
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         return []
 
-    html = r.text.replace("\\/", "/")
-
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+    html = r.content.replace(b"\\/", b"/")
 
     pairs: list[tuple[str, datetime | None]] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
-        href = (m.group(1) or "").strip()
-        if not href:
-            continue
-
-        u = _abs_nj(href)
-        path = urlsplit(u).path
-        mm = _NJ_EO_PDF_ANYGOV_RE.match(path)
-        if not mm:
-            continue
-
+    # Pair each href occurrence with a Date Issued like YYYY/MM/DD (row context is usually nearby)
+    for m, dm in _nj_iter_eo_rows(html, after=600):
+        u = _abs_nj(m.group("u").decode("ascii", "replace"))
         if u in seen:
             continue
         seen.add(u)
 
-        # Look around this href occurrence for a Date Issued like YYYY/MM/DD
-        ctx = html[m.start(): m.start() + 600]  # row context is usually nearby
         dt = None
-        dm = _NJ_DATE_YYYYMMDD_SLASH_RE.search(ctx)
         if dm:
             try:
-                yy = int(dm.group(1))
+                yy, mo, dd = _fast_ymd(html, dm.start("date"))
                 if yy in years:
-                    dt = datetime(int(dm.group(1)), int(dm.group(2)), int(dm.group(3)), tzinfo=timezone.utc)
+                    dt = _utc_date(yy, mo, dd)
                     dt = _date_guard_not_future(dt)
                 else:
                     continue  # skip years we don't want
@@ -1292,42 +1462,27 @@ async def _collect_nj_eo_pdf_pairs_2024_2025(
     This avoids relying on EO numbering (more robust if numbering ever changes).
     """
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         return []
 
-    html = r.text.replace("\\/", "/")
-
-    # Find EO PDF hrefs, then look ahead in nearby context for the Date Issued in that row.
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+    html = r.content.replace(b"\\/", b"/")
 
     pairs: list[tuple[str, datetime | None]] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
-        href = (m.group(1) or "").strip()
-        if not href:
-            continue
-
-        u = _abs_nj(href)
-        path = urlsplit(u).path
-        mm = _NJ_EO_PDF_RE.match(path)
-        if not mm:
+    # Find EO PDF hrefs and pair each with the Date Issued in the surrounding row context.
+    for m, md in _nj_iter_eo_rows(html, before=300, after=800):
+        if m.group("govdir").lower() != b"056murphy":
             continue
 
-        # context window likely contains the row with date issued
-        start = max(m.start() - 300, 0)
-        end = min(m.end() + 800, len(html))
-        ctx = _strip_html_to_text(html[start:end])
+        u = _abs_nj(m.group("u").decode("ascii", "replace"))
 
         dt = None
-        md = _NJ_DATE_YYYYMMDD_SLASH_RE.search(ctx)
         if md:
             try:
-                yy = int(md.group(1))
-                mo = int(md.group(2))
-                dd = int(md.group(3))
+                yy, mo, dd = _fast_ymd(html, md.start("date"))
                 if yy in years:
-                    dt = datetime(yy, mo, dd, tzinfo=timezone.utc)
+                    dt = _utc_date(yy, mo, dd)
                     dt = _date_guard_not_future(dt)
                 else:
                     continue  # skip non-2024/2025
@@ -1355,26 +1510,47 @@ async def _collect_nj_eo_pdf_pairs_2024_2025(
 # ----------------------------
 
 # AO PDFs look like: https://nj.gov/governor/news/ao/docs/AO_2021-3.pdf
-_NJ_AO_PDF_RE = re.compile(r"^/governor/news/ao/docs/[^#?]+\.pdf$", re.I)
+_NJ_AO_PDF_RE = re.compile(r"^(?:https?://[^/?#]+)?/governor/news/ao/docs/[^#?]+\.pdf$", re.I)
 
 _NJ_MONTH_RE = r"(?:January|February|March|April|May|June|July|August|September|October|November|December)"
 _NJ_WD_RE = r"(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)"
 
+_NJ_WD_PREFIX_RE = re.compile(rf"^{_NJ_WD_RE},\s+", re.I)
+
+@functools.lru_cache(maxsize=4096)
 def _nj_parse_month_day_year(s: str) -> Optional[datetime]:
-    s = re.sub(r"\s+", " ", (s or "").strip())
+    s = _WS_RE.sub(" ", (s or "").strip())
     if not s:
         return None
 
     # Strip weekday if present: "Thursday, March 19, 2020" -> "March 19, 2020"
-    s = re.sub(rf"^{_NJ_WD_RE},\s+", "", s, flags=re.I)
+    s = _NJ_WD_PREFIX_RE.sub("", s, count=1)
 
+    # "Month D, YYYY" by hand (strptime re-interprets the format on every call)
     try:
-        dt = datetime.strptime(s, "%B %d, %Y")
-        return dt.replace(tzinfo=timezone.utc)
+        mon_name, rest = s.split(" ", 1)
+        day_str, year_str = rest.split(", ", 1)
+        if not (len(day_str) <= 2 and day_str.isdigit() and len(year_str) == 4 and year_str.isdigit()):
+            return None
+        return _utc_date(int(year_str), _MONTH_FULL[mon_name.lower()], int(day_str))
     except Exception:
         return None
 
 
+# One scan over the AO text: keywords and dates come out in document order.
+# "on <date>" / "which is <date>" carry their own date; every date also feeds the fallbacks.
+_NJ_AO_DATE_PAT = rf"(?:{_NJ_WD_RE},\s+)?{_NJ_MONTH_RE}\s+\d{{1,2}},\s+\d{{4}}"
+_NJ_AO_SCAN_RE = re.compile(
+    rf"(?P<imm>shall take effect immediately)"
+    rf"|(?P<take>shall take effect)"
+    rf"|(?P<eff>\beffective)"
+    rf"|\bwhich is\s+(?P<wdate>{_NJ_AO_DATE_PAT})"
+    rf"|\bon\s+(?P<odate>{_NJ_AO_DATE_PAT})"
+    rf"|(?P<date>{_NJ_AO_DATE_PAT})",
+    re.I,
+)
+
+
 def _nj_ao_published_at_from_text(pdf_text: str) -> Optional[datetime]:
     """
     Extract a reliable published/effective date from NJ Administrative Order PDF text.
@@ -1393,62 +1569,48 @@ def _nj_ao_published_at_from_text(pdf_text: str) -> Optional[datetime]:
     t1 = t.replace("\r", "\n")
     t1 = re.sub(r"[ \t]+", " ", t1)
 
-    # A flexible "Month DD, YYYY" matcher that survives line wraps
-    date_pat = rf"(?:{_NJ_WD_RE},\s+)?({_NJ_MONTH_RE}\s+\d{{1,2}},\s+\d{{4}})"
-
-    # 1) "shall take effect ... on <date>" (allow newlines between tokens)
-    m = re.search(
-        rf"shall take effect(?:[\s\S]*?)\bon\s+{date_pat}",
-        t1,
-        flags=re.I,
-    )
-    if m:
-        dt = _nj_parse_month_day_year(m.group(1))
-        if dt:
-            return dt
+    seen_take = False
+    seen_eff = False
+    imm_until = -1  # a date starting at/before this offset is "near" a take-effect-immediately
 
-    # 2) "effective ... on <date>" (covers: effective at 8:00 p.m. on Thursday, March 19, 2020)
-    m = re.search(
-        rf"\beffective(?:[\s\S]*?)\bon\s+{date_pat}",
-        t1,
-        flags=re.I,
-    )
-    if m:
-        dt = _nj_parse_month_day_year(m.group(1))
-        if dt:
-            return dt
+    take_on = eff_on = which_is = immediately = last = None
 
-    # 3) "which is <date>" (covers: "which is Saturday, March 21, 2020 at 9:00 p.m.")
-    m = re.search(
-        rf"\bwhich is\s+{date_pat}",
-        t1,
-        flags=re.I,
-    )
-    if m:
-        dt = _nj_parse_month_day_year(m.group(1))
-        if dt:
-            return dt
+    for m in _NJ_AO_SCAN_RE.finditer(t1):
+        if m.group("imm") or m.group("take"):
+            seen_take = True
+            if m.group("imm"):
+                imm_until = m.end() + 1200
+            continue
+        if m.group("eff"):
+            seen_eff = True
+            continue
 
-    # 4) If it says "take effect immediately", prefer a nearby explicit date first…
-    if re.search(r"shall take effect immediately", t1, flags=re.I):
-        m = re.search(
-            rf"shall take effect immediately[\s\S]{{0,1200}}?{date_pat}",
-            t1,
-            flags=re.I,
-        )
-        if m:
-            dt = _nj_parse_month_day_year(m.group(1))
+        key = "wdate" if m.group("wdate") else ("odate" if m.group("odate") else "date")
+        ds = m.group(key)
+
+        if key == "odate":
+            # 1) "shall take effect ... on <date>"  2) "effective ... on <date>"
+            if seen_take and take_on is None:
+                take_on = ds
+            if seen_eff and eff_on is None:
+                eff_on = ds
+        elif key == "wdate" and which_is is None:
+            # 3) "which is <date>"
+            which_is = ds
+
+        # 4) "take effect immediately" -> first explicit date shortly after it
+        if immediately is None and m.start(key) <= imm_until:
+            immediately = ds
+
+        # 5) final fallback: the LAST date in the document
+        last = ds
+
+    for ds in (take_on, eff_on, which_is, immediately, last):
+        if ds:
+            dt = _nj_parse_month_day_year(ds)
             if dt:
                 return dt
 
-    # 5) Final fallback: pick the LAST Month DD, YYYY in the document
-    date_only_pat = rf"{_NJ_MONTH_RE}\s+\d{{1,2}},\s+\d{{4}}"
-    all_dates = re.findall(date_only_pat, t1, flags=re.I)
-    if all_dates:
-        dt = _nj_parse_month_day_year(all_dates[-1])
-        if dt:
-            return dt
-
     return None
 
 
@@ -1459,23 +1621,20 @@ async def _collect_nj_ao_pdf_urls(
     limit: int = 20000,
 ) -> list[str]:
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         return []
 
-    html = r.text.replace("\\/", "/")
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
-
     out: list[str] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
-        href = (m.group(1) or "").strip()
+    for href in _iter_hrefs(r.content):
+        href = href.strip()
         if not href:
             continue
         u = _abs_nj(href)
         if not u:
             continue
-        if not _NJ_AO_PDF_RE.match(urlsplit(u).path):
+        if not _NJ_AO_PDF_RE.match(u):
             continue
         if u in seen:
             continue
@@ -1505,7 +1664,7 @@ def _hi_date_from_pdf_filename(url: str) -> datetime | None:
     We parse first 6 digits if present.
     """
     try:
-        fname = urlsplit(url).path.rsplit("/", 1)[-1]
+        fname = _url_path(url).rsplit("/", 1)[-1]
         m = re.match(r"^(?P<yymmdd>\d{6})", fname or "")
         if not m:
             return None
@@ -1514,7 +1673,7 @@ def _hi_date_from_pdf_filename(url: str) -> datetime | None:
         mm = int(yymmdd[2:4])
         dd = int(yymmdd[4:6])
         year = 2000 + yy
-        return datetime(year, mm, dd, tzinfo=timezone.utc)
+        return _utc_date(year, mm, dd)
     except Exception:
         return None
 
@@ -1534,19 +1693,17 @@ async def _collect_hi_press_release_urls(
     """
     out: List[str] = []
     seen: set[str] = set()
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
 
     for p in range(1, max_pages + 1):
         page_url = _hi_category_page(start_url, p)
         r = await _get(cx, page_url, headers={"Referer": HI_PUBLIC_PAGES["all_newsroom"]})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             break
 
-        html = r.text.replace("\\/", "/")
         page_found: List[str] = []
 
-        for m in href_re.finditer(html):
-            u = (m.group(1) or "").split("#")[0].strip()
+        for href in _iter_hrefs(r.content):
+            u = href.split("#")[0].strip()
             if not u:
                 continue
             # only accept newsroom detail pages
@@ -1586,7 +1743,7 @@ _HI_TIME_DT_RE = re.compile(r'(?is)<time[^>]+datetime=["\']([^"\']+)["\']')
 
 def _hi_strip_html(s: str) -> str:
     s = re.sub(r"(?is)<[^>]+>", " ", s or "")
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 def _hi_parse_posted_dt_from_article(article_html: str) -> datetime | None:
     # <time datetime="2026-01-16T...">
@@ -1608,6 +1765,9 @@ def _hi_parse_posted_dt_from_article(article_html: str) -> datetime | None:
 
     return None
 
+# detail pages in flight at once while resolving category entries to PDFs
+_HI_DETAIL_CONCURRENCY = 8
+
 async def _collect_hi_pdf_items_from_category(
     cx: httpx.AsyncClient,
     *,
@@ -1625,18 +1785,21 @@ async def _collect_hi_pdf_items_from_category(
     """
     out: List[Tuple[str, str, datetime | None]] = []
     seen_pdf: set[str] = set()
+    stop_at_pdf_norm = _norm_url(stop_at_pdf_url) if stop_at_pdf_url else ""
+    sem = asyncio.Semaphore(_HI_DETAIL_CONCURRENCY)
 
     for p in range(1, max_pages + 1):
         page_url = _hi_category_page(start_url, p)
         r = await _get(cx, page_url, headers={"Referer": HI_PUBLIC_PAGES["all_newsroom"]})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             break
 
-        page_html = r.text.replace("\\/", "/")
+        page_html = _resp_html(r)
         matches = list(_HI_ENTRY_RE.finditer(page_html))
 
         print("HI LIST page:", page_url, "status=", r.status_code, "len=", len(page_html))
-        print("HI LIST head:", page_html[:500])
+        if _INGEST_DEBUG:
+            print("HI LIST head:", page_html[:500])
         print("HI ENTRY matches:", len(matches))
 
         if not matches:
@@ -1644,10 +1807,13 @@ async def _collect_hi_pdf_items_from_category(
 
         page_new = 0
 
+        # (title, posted_dt, pdf_url or None, detail_url_norm to fetch)
+        entries: List[Tuple[str, datetime | None, str | None, str]] = []
+
         for m in matches:
             href = (m.group("href") or "").strip()
             title = re.sub(r"(?is)<[^>]+>", " ", (m.group("title") or ""))
-            title = re.sub(r"\s+", " ", title).strip()
+            title = _WS_RE.sub(" ", title).strip()
 
             detail_url = clean_url(urljoin("https://governor.hawaii.gov/", href))
             if not detail_url:
@@ -1659,44 +1825,71 @@ async def _collect_hi_pdf_items_from_category(
             posted_dt = _hi_posted_dt_from_listing_chunk(chunk)
 
             # Normalize once (strip fragment/query BEFORE checks)
-            detail_url_norm = clean_url(detail_url).split("#", 1)[0].split("?", 1)[0].strip()
+            detail_url_norm = _norm_url(detail_url)
             dul = detail_url_norm.lower()
 
             # If listing already links to a PDF, use it directly.
             if "/wp-content/uploads/" in dul and dul.endswith(".pdf"):
-                pdf_url = detail_url_norm
+                entries.append((title, posted_dt, detail_url_norm, ""))
             else:
-                # Otherwise, it's a post/detail page: fetch it and extract first PDF
+                # Otherwise, it's a post/detail page: fetch it (below) and extract first PDF
                 if not _hi_is_detail_page_url(detail_url_norm):
                     print("SKIP detail_url:", detail_url)
                     continue
+                entries.append((title, posted_dt, None, detail_url_norm))
 
-                dr = await _get(cx, detail_url_norm, headers={"Referer": page_url})
-                if dr.status_code >= 400 or not dr.text:
-                    continue
+        # Fetch detail pages a window at a time, in listing order, so we never get more
+        # than one window past the cutoff PDF or past what's left of `limit`.
+        i = 0
+        while i < len(entries):
+            want = max(1, min(_HI_DETAIL_CONCURRENCY, limit - len(out)))
+            window: List[Tuple[str, datetime | None, str | None, str]] = []
+            n_fetch = 0
+            while i < len(entries) and n_fetch < want:
+                e = entries[i]
+                i += 1
+                window.append(e)
+                if e[2] is None:
+                    n_fetch += 1
+
+            fetch_urls = [du for (_, _, pu, du) in window if pu is None]
+            fetched = await asyncio.gather(
+                *[_get_bounded(sem, cx, du, headers={"Referer": page_url}) for du in fetch_urls],
+                return_exceptions=True,
+            )
+            detail_resp = dict(zip(fetch_urls, fetched))
 
-                pdf_url = _hi_first_pdf_from_html(dr.text.replace("\\/", "/"))
-                if not pdf_url:
-                    continue
+            for (title, posted_dt, pdf_url, detail_url_norm) in window:
+                if pdf_url is None:
+                    dr = detail_resp[detail_url_norm]
+                    if isinstance(dr, BaseException):
+                        print("HI detail fetch failed:", detail_url_norm, repr(dr))
+                        continue
+                    if dr.status_code >= 400 or not dr.content:
+                        continue
 
-                pdf_url = clean_url(pdf_url).split("#", 1)[0].split("?", 1)[0].strip()
+                    pdf_url = _hi_first_pdf_from_html(_resp_html(dr))
+                    if not pdf_url:
+                        continue
 
-            if pdf_url in seen_pdf:
-                continue
-            seen_pdf.add(pdf_url)
+                    pdf_url = _norm_url(pdf_url)
+
+                if pdf_url in seen_pdf:
+                    continue
+                seen_pdf.add(pdf_url)
 
-            if not title:
-                # fallback to filename
-                fname = urlsplit(pdf_url).path.rsplit("/", 1)[-1]
-                title = (fname or pdf_url).replace(".pdf", "").replace("_", " ").replace("-", " ").strip()
+                if not title:
+                    # fallback to filename
+                    fname = _url_path(pdf_url).rsplit("/", 1)[-1]
+                    title = _pdf_title_from_fname(fname or pdf_url)
 
-            out.append((pdf_url, title, posted_dt))
-            page_new += 1
+                out.append((pdf_url, title, posted_dt))
+                page_new += 1
 
-            if stop_at_pdf_url and clean_url(pdf_url) == clean_url(stop_at_pdf_url):
-                return out
-            if len(out) >= limit:
-                return out
+                if stop_at_pdf_norm and pdf_url == stop_at_pdf_norm:
+                    return out
+                if len(out) >= limit:
+                    return out
 
         if page_new == 0:
             break
@@ -1725,10 +1918,13 @@ VT_STATUS_MAP = {
     "proclamations": "proclamation",
 }
 
-_VT_KEEP_PRESS_RE = re.compile(r"^https://governor\.vermont\.gov/press-release/", re.I)
-_VT_KEEP_DOC_RE   = re.compile(r"^https://governor\.vermont\.gov/document/", re.I)
+# listing-link buckets, one alternation; m.lastgroup says which bucket a URL fell in
+_VT_KEEP_RE = _compile_keep_alternation({
+    "press": r"https://governor\.vermont\.gov/press-release/",
+    "doc": r"https://governor\.vermont\.gov/document/",
+})
 
-_VT_PDF_RE = re.compile(r"^https://governor\.vermont\.gov/sites/scott/files/documents/[^#?]+\.pdf$", re.I)
+_VT_PDF_RE = re.compile(r"(?i)^https://governor\.vermont\.gov/sites/scott/files/documents/[^#?]+\.pdf$")
 
 
 # ----------------------------
@@ -1757,7 +1953,7 @@ CO_JURISDICTION = "colorado"
 CO_AGENCY = "Colorado Governor"
 
 # detail pages look like: /governor/news/<slug>
-_CO_PRESS_DETAIL_PATH_RE = re.compile(r"^/governor/news/[^#?]+$", re.I)
+_CO_PRESS_DETAIL_PATH_RE = re.compile(r"(?i)^/governor/news/[^#?]+$")
 
 _CO_PRESS_DATE_RE = re.compile(
     r'\b(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+'
@@ -1784,38 +1980,35 @@ _CO_GDRIVE_ID_RE = re.compile(
 )
 
 _CO_LISTING_DATE_RE = re.compile(
-    r'\b(?:MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY),\s+'
+    r'(?i)\b(?:MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY),\s+'
     r'(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+'
-    r'(\d{1,2}),\s+(20\d{2})\b',
-    re.I
+    r'(\d{1,2}),\s+(20\d{2})\b'
 )
 
-def _co_parse_listing_date(s: str) -> datetime | None:
-    s = s or ""
-
+# raw parse only: the not-in-future guard depends on "now", so it must not be cached
+@functools.lru_cache(maxsize=4096)
+def _co_parse_listing_date_raw(s: str) -> datetime | None:
     # 1) weekday + month date (your existing)
     m = _CO_LISTING_DATE_RE.search(s)
     if m:
         mon = m.group(1).lower()
         day = int(m.group(2))
         year = int(m.group(3))
-        month_map = {
-            "january": 1, "february": 2, "march": 3, "april": 4,
-            "may": 5, "june": 6, "july": 7, "august": 8,
-            "september": 9, "october": 10, "november": 11, "december": 12,
-        }
-        month = month_map.get(mon, 0)
+        month = _MONTH_FULL.get(mon, 0)
         if month:
-            return _date_guard_not_future(datetime(year, month, day, tzinfo=timezone.utc))
+            return _utc_date(year, month, day)
 
     # 2) ✅ fallback: Month DD, YYYY (no weekday)
     mm = _US_MONTH_DATE_RE.search(s)
     if mm:
-        dt = _parse_us_month_date(mm.group(0))
-        return _date_guard_not_future(dt) if dt else None
+        return _parse_us_month_date(mm.group(0))
 
     return None
 
+def _co_parse_listing_date(s: str) -> datetime | None:
+    dt = _co_parse_listing_date_raw(s or "")
+    return _date_guard_not_future(dt) if dt else None
+
 
 def _co_drive_download_url(u: str) -> str:
     u = (u or "").strip()
@@ -1834,7 +2027,7 @@ def _extract_co_eo_date(pdf_text: str) -> datetime | None:
     text = pdf_text.replace("\r", "\n")
     text = re.sub(r"[ \t]+", " ", text)
     text = re.sub(r"\n+", "\n", text)
-    flat = re.sub(r"\s+", " ", text).strip()
+    flat = _WS_RE.sub(" ", text).strip()
 
     m = _CO_EO_SEAL_RE.search(flat)
     if not m:
@@ -1849,16 +2042,35 @@ def _extract_co_eo_date(pdf_text: str) -> datetime | None:
         return None
 
     year = int(year_raw)
-    month_map = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12,
-    }
-    month = month_map.get(month_raw, 0)
+    month = _MONTH_FULL.get(month_raw, 0)
     if not month:
         return None
 
-    return _date_guard_not_future(datetime(year, month, day, tzinfo=timezone.utc))
+    return _date_guard_not_future(_utc_date(year, month, day))
+
+# hyphens (incl. odd ones) -> space, other ASCII punctuation dropped ("_" kept, it's \w);
+# afterwards "twenty-eighth" / "twenty eighth" / "twenty - eighth" all split the same way
+_CO_ORD_TRANSLATE = str.maketrans(
+    {"-": " ", "\u2011": " ", "\u2013": " ", "\u2014": " "}
+    | {c: None for c in "!\"#$%&'()*+,./:;<=>?@[\\]^`{|}~"}
+)
+
+_CO_ORD_ONES = {
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
+    "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9,
+}
+
+# every day ordinal 1-31 (compounds in their normalized "twenty eighth" form)
+_CO_ORDINAL_DAY = {
+    **_CO_ORD_ONES,
+    "tenth": 10, "eleventh": 11, "twelfth": 12, "thirteenth": 13, "fourteenth": 14,
+    "fifteenth": 15, "sixteenth": 16, "seventeenth": 17, "eighteenth": 18,
+    "nineteenth": 19,
+    "twentieth": 20,
+    "thirtieth": 30,
+    **{f"twenty {w}": 20 + n for w, n in _CO_ORD_ONES.items()},
+    "thirty first": 31,
+}
 
 def _co_ordinal_word_to_int(s: str) -> int | None:
     """
@@ -1874,56 +2086,37 @@ def _co_ordinal_word_to_int(s: str) -> int | None:
         return None
 
     w = s.strip().lower()
-    w = w.replace("\u2011", "-").replace("\u2013", "-").replace("\u2014", "-")  # weird hyphens
-    w = re.sub(r"[^\w\s-]", "", w)  # strip punctuation
-    w = re.sub(r"\s+", " ", w).strip()
-
-    # numeric like "20", "20th"
-    m = re.match(r"^(\d{1,2})", w)
-    if m:
-        d = int(m.group(1))
-        return d if 1 <= d <= 31 else None
-
-    # base ordinal map
-    base = {
-        "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
-        "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9, "tenth": 10,
-        "eleventh": 11, "twelfth": 12, "thirteenth": 13, "fourteenth": 14,
-        "fifteenth": 15, "sixteenth": 16, "seventeenth": 17, "eighteenth": 18,
-        "nineteenth": 19,
-        "twentieth": 20,
-        "thirtieth": 30,
-    }
-    if w in base:
-        return base[w]
-
-    # handle "twenty-eighth" / "twenty eighth" / "thirty-first"
-    parts = re.split(r"[-\s]+", w)
-    if not parts:
+    # longest word form is "twenty-seventh"; anything much longer can only be numeric
+    if len(w) > 24 and not w[:1].isdigit():
         return None
+    w = w.translate(_CO_ORD_TRANSLATE)
+    if not w.isascii():
+        w = re.sub(r"[^\w\s-]", "", w)  # non-ASCII punctuation (rare)
+    w = " ".join(w.split())
 
-    tens = {"twenty": 20, "thirty": 30}
-    ones = {
-        "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
-        "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9,
-    }
-
-    if len(parts) == 2 and parts[0] in tens and parts[1] in ones:
-        d = tens[parts[0]] + ones[parts[1]]
+    # numeric like "20", "20th"
+    if w[:1].isdecimal():
+        d = int(w[:2] if w[1:2].isdecimal() else w[:1])
         return d if 1 <= d <= 31 else None
 
-    return None
+    return _CO_ORDINAL_DAY.get(w)
 
 
 
-def _date_from_co_press(html: str) -> datetime | None:
-    if not html:
+def _date_from_co_press(page: ParsedPage) -> datetime | None:
+    if not page.html:
         return None
 
-    text = _strip_html_to_text(html)
-
     # 1) Colorado's visible date line often includes weekday:
     #    "THURSDAY, DECEMBER 18, 2025"
+    # date lines rarely straddle tags, so try the raw main HTML before building the text view
+    main = page.main_raw
+    if main is not None:
+        m = _CO_LISTING_DATE_RE.search(main)
+        if m:
+            return _co_parse_listing_date(m.group(0))
+
+    text = page.text
     m = _CO_LISTING_DATE_RE.search(text)
     if m:
         return _co_parse_listing_date(m.group(0))
@@ -1940,21 +2133,11 @@ def _date_from_co_press(html: str) -> datetime | None:
 def _abs_co(u: str) -> str:
     if not u:
         return ""
-    u = u.split("#")[0].strip()
-    if u.startswith("//"):
-        u = "https:" + u
-    if u.startswith("http"):
-        return u.split("?")[0]
-    if not u.startswith("/"):
-        u = "/" + u
-    return ("https://www.colorado.gov" + u).split("?")[0]
+    return _abs_url(u, "https://www.colorado.gov")
 
 def _canon_co(u: str) -> str:
-    u = _abs_co(u)
-    if not u:
-        return ""
-    u = u.split("#")[0].split("?")[0]
-    return u.rstrip("/")
+    # _abs_co already dropped query/fragment
+    return _abs_co(u).rstrip("/")
 
 def _co_news_page(page: int) -> str:
     # https://www.colorado.gov/governor/news?page=0
@@ -1976,61 +2159,69 @@ async def _collect_co_press_release_pairs(
     stop_norm = _canon_co(stop_at_url) if stop_at_url else None
     out: list[tuple[str, datetime | None]] = []
     seen: set[str] = set()
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+    # bound once; these run for every href on every listing page
+    out_append = out.append
+    seen_add = seen.add
+
+    pages = (_co_news_page(p) for p in range(0, max_pages))
+    async with aclosing(_iter_listing_pages(cx, pages, headers={"Referer": CO_PUBLIC_PAGES["press_releases"]})) as listing:
+        async for page_url, r in listing:
+            if r.status_code >= 400 or not r.content:
+                break
 
-    for p in range(0, max_pages):
-        page_url = _co_news_page(p)
-        r = await _get(cx, page_url, headers={"Referer": CO_PUBLIC_PAGES["press_releases"]})
-        if r.status_code >= 400 or not r.text:
-            break
+            html = _resp_html(r)
+            new_count = 0
 
-        html = r.text.replace("\\/", "/")
-        new_count = 0
+            # listing dates, tokenized and parsed once per page;
+            # each link takes the last one ending before it
+            date_ends: list[int] = []
+            date_dts: list[datetime | None] = []
+            for dm in _CO_LISTING_DATE_RE.finditer(html):
+                date_ends.append(dm.end())
+                date_dts.append(_co_parse_listing_date(dm.group(0)))
 
-        for m in href_re.finditer(html):
-            href = (m.group(1) or "").strip()
-            if not href:
-                continue
-            u = _canon_co(href)
-            if not u:
-                continue
+            for m in _HREF_RE.finditer(html):
+                href = (m.group(1) or "").strip()
+                if not href:
+                    continue
+                u = _canon_co(href)
+                if not u:
+                    continue
 
-            # keep only /governor/news/<slug> detail pages
-            if not _CO_PRESS_DETAIL_PATH_RE.match(urlsplit(u).path):
-                continue
+                # keep only /governor/news/<slug> detail pages
+                # (substring pretest skips urlsplit for nav/footer links)
+                if "/governor/news/" not in u or not _CO_PRESS_DETAIL_PATH_RE.match(_url_path(u)):
+                    continue
 
-            if u in seen:
-                continue
+                if u in seen:
+                    continue
 
-            # listing date is usually near the link on the listing page
-            before = html[:m.start()]
-            last_date = None
+                # listing date is usually near the link on the listing page
+                di = bisect_right(date_ends, m.start()) - 1
+                dt = date_dts[di] if di >= 0 else None
 
-            for dm in _CO_LISTING_DATE_RE.finditer(before):
-                last_date = dm.group(0)
+                seen_add(u)
+                out_append((u, dt))
+                new_count += 1
 
-            dt = None
-            if last_date:
-                dt = _co_parse_listing_date(last_date)
+                if stop_norm and u == stop_norm:
+                    return out
+                if len(out) >= limit:
+                    return out
 
-            seen.add(u)
-            out.append((u, dt))
-            new_count += 1
-
-            if stop_norm and u == stop_norm:
-                return out
-            if len(out) >= limit:
-                return out
-
-        if new_count == 0:
-            break
-
-        await asyncio.sleep(0.1)
+            if new_count == 0:
+                break
 
     return out
 
 # Colorado EO page contains google drive "view" links
-_CO_GDRIVE_VIEW_RE = re.compile(r"^https?://drive\.google\.com/file/d/([^/]+)/view", re.I)
+_CO_GDRIVE_VIEW_RE = re.compile(r"(?i)^https?://drive\.google\.com/file/d/([^/]+)/view")
+
+# "Executive Order ..." title hint, matched on raw HTML: inline tags are skipped whole,
+# block tags (and '.' / newline, as in the text view) end the hint
+_CO_EO_TITLE_HINT_RE = re.compile(
+    r"(?i)\b(executive\s+order(?:[^.\n<]|<(?!/?(?:p|div|h\d|br|li|td|tr)\b)[^>]*>){0,140})"
+)
 
 
 async def _collect_co_eo_drive_items(
@@ -2043,16 +2234,15 @@ async def _collect_co_eo_drive_items(
     Returns [(drive_view_url, title_hint, date_hint)] from a CO EO page.
     """
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         return []
 
-    html = r.text.replace("\\/", "/")
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+    html = _resp_html(r)
 
     out: list[tuple[str, str, datetime | None]] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
+    for m in _HREF_RE.finditer(html):
         href = clean_url(m.group(1) or "")
         if not href:
             continue
@@ -2072,10 +2262,10 @@ async def _collect_co_eo_drive_items(
             continue
         seen.add(href)
 
-        # title/date hints from nearby context
+        # title/date hints from nearby context (raw HTML; no per-link text conversion)
         ctx_start = max(m.start() - 250, 0)
         ctx_end = min(m.end() + 400, len(html))
-        ctx = _strip_html_to_text(html[ctx_start:ctx_end])
+        ctx = html[ctx_start:ctx_end]
 
         dt = None
         mm = _US_MONTH_DATE_RE.search(ctx)
@@ -2086,9 +2276,12 @@ async def _collect_co_eo_drive_items(
         # lightweight title hint: use closest text chunk or fallback later
         title_hint = ""
         # try to capture something like "Executive Order ..." in the context
-        tmatch = re.search(r"(?i)\b(executive\s+order[^.\n]{0,140})", ctx)
+        tmatch = _CO_EO_TITLE_HINT_RE.search(ctx)
         if tmatch:
-            title_hint = re.sub(r"\s+", " ", tmatch.group(1)).strip()
+            t = tmatch.group(1)
+            if "<" in t:
+                t = _TAG_STRIP_RE.sub(" ", t)
+            title_hint = _WS_RE.sub(" ", _html.unescape(t)).strip()
 
         out.append((href, title_hint, dt))
 
@@ -2098,6 +2291,7 @@ async def _collect_co_eo_drive_items(
     return out
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_dmy_abbr(s: str) -> datetime | None:
     """
     Parses "16 Jan 2026" style dates (as used on VA proclamation list).
@@ -2120,8 +2314,7 @@ def _parse_dmy_abbr(s: str) -> datetime | None:
 
 # EO PDFs often include: "this 12th day of September 2025."
 _VA_EO_SEAL_RE = re.compile(
-    r'\bthis\s+(\d{1,2})(?:st|nd|rd|th)\s+day\s+of\s+([A-Za-z]+)\s+(20\d{2})\b',
-    re.I
+    r'(?i)\bthis\s+(\d{1,2})(?:st|nd|rd|th)\s+day\s+of\s+([A-Za-z]+)\s+(20\d{2})\b'
 )
 
 def _extract_va_eo_date(pdf_text: str) -> datetime | None:
@@ -2131,20 +2324,19 @@ def _extract_va_eo_date(pdf_text: str) -> datetime | None:
     """
     if not pdf_text:
         return None
-    matches = list(_VA_EO_SEAL_RE.finditer(pdf_text))
-    if not matches:
+    # cheap pretest: no "day" anywhere means no seal line
+    if "day" not in pdf_text and "DAY" not in pdf_text and "Day" not in pdf_text:
+        return None
+    m = None
+    for m in _VA_EO_SEAL_RE.finditer(pdf_text):
+        pass
+    if m is None:
         return None
-    m = matches[-1]
     day = int(m.group(1))
     month_name = (m.group(2) or "").strip().lower()
     year = int(m.group(3))
 
-    # full month name -> month number
-    month_map = {
-        "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6,
-        "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12
-    }
-    mon = month_map.get(month_name, 0)
+    mon = _MONTH_FULL.get(month_name, 0)
     if mon <= 0:
         return None
     try:
@@ -2155,14 +2347,8 @@ def _extract_va_eo_date(pdf_text: str) -> datetime | None:
 def _abs_ga(u: str) -> str:
     if not u:
         return u
-    u = u.split("#")[0].strip()
-    if u.startswith("//"):
-        u = "https:" + u
-    if u.startswith("http"):
-        return u
-    if not u.startswith("/"):
-        u = "/" + u
-    return "https://gov.georgia.gov" + u
+    # GA keeps the query string (listing pages paginate with ?page=N)
+    return _abs_url(u, "https://gov.georgia.gov", keep_query=True)
 
 async def _collect_ga_press_release_pairs(
     cx: httpx.AsyncClient,
@@ -2178,59 +2364,67 @@ async def _collect_ga_press_release_pairs(
     out: list[tuple[str, datetime | None]] = []
     seen: set[str] = set()
 
-    for p in range(max_pages):
-        page_url = f"https://gov.georgia.gov/press-releases/{year}?page={p}"
-        r = await _get(cx, page_url, headers={"Referer": GA_PUBLIC_PAGES["press_releases_2025"]})
-        if r.status_code >= 400 or not r.text:
-            break
+    pages = (f"https://gov.georgia.gov/press-releases/{year}?page={p}" for p in range(max_pages))
+    async with aclosing(_iter_listing_pages(cx, pages, headers={"Referer": GA_PUBLIC_PAGES["press_releases_2025"]})) as listing:
+        async for page_url, r in listing:
+            if r.status_code >= 400 or not r.content:
+                break
 
-        html = r.text.replace("\\/", "/")
+            html = _resp_html(r)
 
-        # find all press release detail hrefs, then search nearby for "Month DD, YYYY"
-        href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
-        any_new = 0
+            # find all press release detail hrefs, then search nearby for "Month DD, YYYY"
+            any_new = 0
 
-        for m in href_re.finditer(html):
-            href = (m.group(1) or "").strip()
-            if not href:
-                continue
-            u = _abs_ga(href)
+            # raw-HTML date hits for the whole page, so each link is a bisect instead of a strip+search
+            date_hits = [(dm.start(), dm.end(), dm.group(0)) for dm in _US_MONTH_DATE_RE.finditer(html)]
+            date_starts = [h[0] for h in date_hits]
 
-            path = urlsplit(u).path
-            if not _GA_PRESS_DETAIL_RE.match(path):
-                continue
+            for m in _HREF_RE.finditer(html):
+                href = (m.group(1) or "").strip()
+                if not href:
+                    continue
+                u = _abs_ga(href)
 
-            if u in seen:
-                continue
+                path = _url_path(u)
+                if not _GA_PRESS_DETAIL_RE.match(path):
+                    continue
 
-            # look around the link for the listing date text
-            start = max(m.start() - 150, 0)
-            end = min(m.end() + 500, len(html))
-            context = html[start:end]
-            context_text = _strip_html_to_text(context)
-
-            # common listing: "December 19, 2025"
-            dt = None
-            mm = _US_MONTH_DATE_RE.search(context_text)
-            if mm:
-                dt = _parse_us_month_date(mm.group(0))
-                dt = _date_guard_not_future(dt) if dt else None
-
-            # keep only 2025
-            if dt and dt.year != year:
-                continue
+                if u in seen:
+                    continue
 
-            seen.add(u)
-            out.append((u, dt))
-            any_new += 1
+                # look around the link for the listing date text
+                start = max(m.start() - 150, 0)
+                end = min(m.end() + 500, len(html))
 
-            if len(out) >= limit:
-                return out
+                # common listing: "December 19, 2025"
+                date_txt = None
+                di = bisect_left(date_starts, start)
+                if di < len(date_hits) and date_hits[di][1] <= end:
+                    date_txt = date_hits[di][2]
+                else:
+                    # date split by markup/entities ("December&nbsp;19"): fall back to the text view
+                    mm = _US_MONTH_DATE_RE.search(_strip_html_to_text(html[start:end]))
+                    if mm:
+                        date_txt = mm.group(0)
 
-        if any_new == 0:
-            break
+                dt = None
+                if date_txt:
+                    dt = _parse_us_month_date(date_txt)
+                    dt = _date_guard_not_future(dt) if dt else None
 
-        await asyncio.sleep(0.1)
+                # keep only 2025
+                if dt and dt.year != year:
+                    continue
+
+                seen.add(u)
+                out.append((u, dt))
+                any_new += 1
+
+                if len(out) >= limit:
+                    return out
+
+            if any_new == 0:
+                break
 
     return out
 
@@ -2276,17 +2470,25 @@ async def _collect_va_proclamation_urls_years(
 # Small helpers
 # ----------------------------
 
+@functools.lru_cache(maxsize=4096)
+def _utc_date(y: int, m: int, d: int) -> datetime:
+    # listing pages repeat the same publication day across rows; datetimes are immutable so share them
+    return datetime(y, m, d, tzinfo=timezone.utc)
+
+# smart quotes / nbsp fixups, applied in one translate pass
+_CLEAN_URL_TRANS = str.maketrans({"“": None, "”": None, "’": "'", "\u00a0": " "})
+_CLEAN_HEADER_TRANS = str.maketrans({"“": '"', "”": '"', "\u00a0": " "})
+
 def clean_url(u: str) -> str:
     if not u:
         return u
-    return (
-        u.strip()
-         .replace("“", "")
-         .replace("”", "")
-         .replace("’", "'")
-         .replace("\u00a0", " ")
-         .strip(" \t\r\n\"'")
-    )
+    return u.strip().translate(_CLEAN_URL_TRANS).strip(" \t\r\n\"'")
+
+_URL_TAIL_RE = re.compile(r"(?s)[?#].*")
+
+def _norm_url(u: str) -> str:
+    # clean_url + drop query/fragment in one regex pass (instead of split("#")[0].split("?")[0])
+    return _URL_TAIL_RE.sub("", clean_url(u or ""), count=1).strip()
 
 def clean_headers(headers: dict | None) -> dict | None:
     if not headers:
@@ -2296,8 +2498,9 @@ def clean_headers(headers: dict | None) -> dict | None:
         if v is None:
             continue
         v = str(v)
-        v = v.replace("“", '"').replace("”", '"').replace("\u00a0", " ")
-        v = v.encode("ascii", "ignore").decode("ascii")
+        # both fixups only touch non-ASCII chars, so plain values pass straight through
+        if not v.isascii():
+            v = v.translate(_CLEAN_HEADER_TRANS).encode("ascii", "ignore").decode("ascii")
         out[str(k)] = v
     return out
 
@@ -2309,21 +2512,14 @@ def _nz(s: str | None) -> str:
 def _abs_ohio(u: str) -> str:
     if not u:
         return u
-    u = u.split("#")[0].strip()
-
-    # protocol-relative
-    if u.startswith("//"):
-        u = "https:" + u
+    return _abs_url(u, "https://governor.ohio.gov")
 
-    # absolute
-    if u.startswith("http"):
-        return u.split("?")[0]
-
-    # relative
-    if not u.startswith("/"):
-        u = "/" + u
-    return ("https://governor.ohio.gov" + u).split("?")[0]
 
+@functools.lru_cache(maxsize=4096)
+def _url_path(u: str) -> str:
+    # link filters ask for the path of the same hrefs over and over (nav/footer on every page);
+    # urlsplit's own cache is only 128 entries
+    return urlsplit(u).path
 
 def _set_query_param(url: str, key: str, value: str) -> str:
     parts = urlsplit(url)
@@ -2334,85 +2530,110 @@ def _set_query_param(url: str, key: str, value: str) -> str:
 def _abs_az(u: str) -> str:
     if not u:
         return u
-    u = u.split("#")[0].strip()
-    if u.startswith("//"):
-        u = "https:" + u
-    if u.startswith("http"):
-        return u.split("?")[0]
-    if not u.startswith("/"):
-        u = "/" + u
-    return ("https://azgovernor.gov" + u).split("?")[0]
+    return _abs_url(u, "https://azgovernor.gov")
 
 def _abs_va(u: str) -> str:
     if not u:
         return u
-    u = u.split("#")[0].strip()
-    if u.startswith("//"):
-        u = "https:" + u
-    if u.startswith("http"):
-        return u.split("?")[0]
-    if not u.startswith("/"):
-        u = "/" + u
-    return ("https://www.governor.virginia.gov" + u).split("?")[0]
+    return _abs_url(u, "https://www.governor.virginia.gov")
 
 def _abs_vt(u: str) -> str:
     if not u:
         return u
-    u = u.split("#")[0].strip()
-    if u.startswith("//"):
-        u = "https:" + u
-    if u.startswith("http"):
-        return u.split("?")[0]
-    if not u.startswith("/"):
-        u = "/" + u
-    return ("https://governor.vermont.gov" + u).split("?")[0]
+    return _abs_url(u, "https://governor.vermont.gov")
 
 def _canon_vt(u: str) -> str:
-    u = _abs_vt(u)
-    if not u:
-        return ""
-    u = u.split("#")[0].split("?")[0].rstrip("/")
-    return u
+    # _abs_vt already dropped query/fragment
+    return (_abs_vt(u) or "").rstrip("/")
+
+def _canon_dedupe_vt(urls: Iterable[str]) -> list[str]:
+    # canonicalize + dedupe, first-seen order; each url is canonicalized once
+    return [cu for cu in dict.fromkeys(map(_canon_vt, urls)) if cu]
 
 
 
 def _vt_page(url: str, page: int) -> str:
     # All your VT lists page via ?page=N (including the first page)
+    if "?" not in url and "#" not in url:
+        return f"{url}?page={page}"
     return _set_query_param(url, "page", str(page))
 
 
-def _extract_first_pdf_link_vt(html: str) -> str:
+def _extract_first_pdf_link_vt(page: ParsedPage) -> str:
     """
     VT document pages (EOs/Proclamations) have a PDF link like:
       https://governor.vermont.gov/sites/scott/files/documents/....pdf
     We grab the first matching PDF link.
     """
-    if not html:
-        return ""
-    blob = html.replace("\\/", "/")
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
-    for m in href_re.finditer(blob):
-        u = _abs_vt(m.group(1))
+    for href in page.hrefs:
+        u = _abs_vt(href)
         if u and _VT_PDF_RE.match(u):
             return u
     return ""
 
 
-def _date_from_vt_doc_page(html: str) -> datetime | None:
+def _date_from_vt_doc_page(page: ParsedPage) -> datetime | None:
     """
     VT document pages show a date line like 'September 17, 2025' or 'June 1, 2025'.
     We parse the first Month DD, YYYY we see.
     """
-    if not html:
+    if not page.html:
         return None
-    text = _strip_html_to_text(html)
-    m = _US_MONTH_DATE_RE.search(text)
-    if not m:
+    hit = _first_us_month_date(page)
+    if not hit:
         return None
-    dt = _parse_us_month_date(m.group(0))
+    dt = _parse_us_month_date(hit)
     return _date_guard_not_future(dt) if dt else None
 
 
+_VA_NEWS_PATH_RE = re.compile(r'(/newsroom/news-releases/[^"\s<>]+?\.(?:html?|php))', re.I)
+_VA_NEWS_NEEDLE = "/newsroom/news-releases/"
+
+# JSON keys that carry a release date (feeds vary a lot)
+_VA_JSON_DATE_KEYS = frozenset({
+    "datecode",
+    "date", "datetime", "published", "published_at", "publishedat",
+    "publishdate", "pubdate", "datepublished", "created", "created_at",
+    "releasedate", "release_date", "updated", "updated_at",
+})
+
+@functools.lru_cache(maxsize=8192)
+def _parse_feed_dt(s: str) -> datetime | None:
+    """
+    Date value from a VA news feed field (already str()-ed and stripped).
+    Feeds repeat the same few values a lot, so results are memoized.
+    """
+    # YYYYMMDD (e.g., 20251223)
+    if len(s) == 8 and s.isdecimal():
+        try:
+            return datetime.strptime(s, "%Y%m%d").replace(tzinfo=timezone.utc)
+        except Exception:
+            pass
+
+    # ISO
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(timezone.utc)
+    except Exception:
+        pass
+
+    # RFC2822
+    try:
+        return parsedate_to_datetime(s).astimezone(timezone.utc)
+    except Exception:
+        pass
+
+    # Month DD, YYYY
+    dt = _parse_us_month_date(s)
+    if dt:
+        return dt
+
+    # DMY like "16 Jan 2026"
+    dt2 = _parse_dmy_abbr(s)
+    if dt2:
+        return dt2
+
+    return None
+
 def _extract_urls_dates_from_any_json(obj: object) -> list[tuple[str, datetime | None]]:
     """
     Robust VA news feed extractor:
@@ -2425,47 +2646,12 @@ def _extract_urls_dates_from_any_json(obj: object) -> list[tuple[str, datetime |
     def parse_dt(v: object) -> datetime | None:
         if v is None:
             return None
-
         s = str(v).strip()
-        if not s:
-            return None
-
-        # YYYYMMDD (e.g., 20251223)
-        if re.fullmatch(r"\d{8}", s):
-            try:
-                return datetime.strptime(s, "%Y%m%d").replace(tzinfo=timezone.utc)
-            except Exception:
-                pass
-
-        # ISO
-        try:
-            return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(timezone.utc)
-        except Exception:
-            pass
-
-        # RFC2822
-        try:
-            return parsedate_to_datetime(s).astimezone(timezone.utc)
-        except Exception:
-            pass
-
-        # Month DD, YYYY
-        dt = _parse_us_month_date(s)
-        if dt:
-            return dt
-
-        # DMY like "16 Jan 2026"
-        dt2 = _parse_dmy_abbr(s)
-        if dt2:
-            return dt2
-
-        return None
+        return _parse_feed_dt(s) if s else None
 
     def looks_like_news_path(s: str) -> bool:
-        if not s:
-            return False
-        s = s.strip()
-        return ("/newsroom/news-releases/" in s) and (".htm" in s or ".html" in s)
+        # ".htm" also covers ".html"
+        return bool(s) and _VA_NEWS_NEEDLE in s and ".htm" in s
 
     def norm_news_url(s: str) -> str:
         s = (s or "").strip()
@@ -2477,85 +2663,81 @@ def _extract_urls_dates_from_any_json(obj: object) -> list[tuple[str, datetime |
             return _abs_va(s)
         return s
 
-    # find hrefs inside any big string blob
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
-    path_re = re.compile(r'(/newsroom/news-releases/[^"\s<>]+?\.(?:html?|php))', re.I)
+    seen: set[str] = set()
+
+    def emit(u: str, dt: datetime | None) -> None:
+        # dedupe as we go (keep first), on the fragment-free URL
+        h = u.find("#")
+        if h >= 0:
+            u = u[:h].strip()
+        if u and u not in seen:
+            seen.add(u)
+            out.append((u, dt))
+
+    # find hrefs / plain news paths inside any big string blob
 
     def scan_string_blob(blob: str):
         if not blob:
             return
         # href="..."
-        for m in href_re.finditer(blob):
+        for m in _HREF_RE.finditer(blob):
             u = m.group(1) or ""
             if looks_like_news_path(u):
-                out.append((norm_news_url(u), None))
+                emit(norm_news_url(u), None)
 
         # plain paths
-        for m in path_re.finditer(blob):
+        for m in _VA_NEWS_PATH_RE.finditer(blob):
             u = m.group(1) or ""
             if looks_like_news_path(u):
-                out.append((norm_news_url(u), None))
+                emit(norm_news_url(u), None)
 
-    def walk(node: object):
-        if isinstance(node, dict):
+    # iterative pre-order walk (same visiting order as the old recursive one,
+    # without the recursion limit on deeply nested feeds)
+    date_keys = _VA_JSON_DATE_KEYS
+    needle = _VA_NEWS_NEEDLE
+    stack: list[object] = [obj]
+    pop = stack.pop
+    push_many = stack.extend
+
+    while stack:
+        node = pop()
+        t = type(node)
+
+        if t is dict:
             url_val = None
             dt_val = None
 
             for k, v in node.items():
-                ks = str(k).lower()
-
-                # URL candidates (many feeds use these keys)
-                if url_val is None and isinstance(v, str):
-                    if ks in ("url", "link", "href", "permalink", "storyurl", "pageurl"):
-                        if looks_like_news_path(v):
-                            url_val = v
-                    # even if key is unknown, still accept if it looks like the path
-                    if url_val is None and looks_like_news_path(v):
-                        url_val = v
-
-                # date candidates (feeds vary a lot)
-                if dt_val is None and ks in (
-                    "datecode",
-                    "date", "datetime", "published", "published_at", "publishedat",
-                    "publishdate", "pubdate", "datepublished", "created", "created_at",
-                    "releasedate", "release_date", "updated", "updated_at"
-                ):
+                is_str = type(v) is str
+
+                # URL candidates: any string value that looks like a release path
+                # (url/link/href/permalink/... keys included, so no key check needed)
+                if url_val is None and is_str and looks_like_news_path(v):
+                    url_val = v
+
+                # date candidates
+                if dt_val is None and str(k).lower() in date_keys:
                     dt_val = parse_dt(v)
 
                 # strings may contain HTML snippets with hrefs
-                if isinstance(v, str) and len(v) > 40 and "/newsroom/news-releases/" in v:
+                if is_str and len(v) > 40 and needle in v:
                     scan_string_blob(v)
 
             if url_val:
-                out.append((norm_news_url(url_val), _date_guard_not_future(dt_val)))
+                emit(norm_news_url(url_val), _date_guard_not_future(dt_val))
 
-            for v in node.values():
-                walk(v)
+            push_many(reversed(node.values()))
 
-        elif isinstance(node, list):
-            for it in node:
-                walk(it)
+        elif t is list:
+            push_many(reversed(node))
 
-        elif isinstance(node, str):
-            if "/newsroom/news-releases/" in node:
+        elif t is str:
+            if needle in node:
                 scan_string_blob(node)
                 if looks_like_news_path(node):
-                    out.append((norm_news_url(node), None))
+                    emit(norm_news_url(node), None)
 
-    walk(obj)
-
-    # dedupe preserve order (keep first)
-    dedup: list[tuple[str, datetime | None]] = []
-    seen: set[str] = set()
-    for (u, dt) in out:
-        u = (u or "").split("#")[0].strip()
-        if not u:
-            continue
-        if u in seen:
-            continue
-        seen.add(u)
-        dedup.append((u, dt))
-    return dedup
+    return out
 
 async def _collect_va_news_urls_from_feed(
     cx: httpx.AsyncClient,
@@ -2682,7 +2864,7 @@ async def _collect_vt_listing_urls(
     cx: httpx.AsyncClient,
     *,
     base_url: str,
-    keep_re: re.Pattern,
+    keep: str,
     max_pages: int,
     limit: int,
     stop_at_url: str | None = None,
@@ -2690,48 +2872,46 @@ async def _collect_vt_listing_urls(
 ) -> List[str]:
     """
     Crawl VT listing pages that paginate with ?page=N.
-    Scrape hrefs, normalize to absolute, filter via keep_re.
+    Scrape hrefs, normalize to absolute, keep those in the given _VT_KEEP_RE bucket.
     Stops at stop_at_url (inclusive).
     """
+    keep_match = _VT_KEEP_RE.match
     out: List[str] = []
     seen: set[str] = set()
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
-
-    for p in range(0, max_pages + 1):
-        page_url = _vt_page(base_url, p)
-        r = await _get(cx, page_url, headers={"Referer": referer or base_url})
-        if r.status_code >= 400 or not r.text:
-            break
 
-        html = r.text.replace("\\/", "/")
-
-        page_found: List[str] = []
-        for m in href_re.finditer(html):
-            u = _abs_vt(m.group(1))
-            if not u:
-                continue
-            if not keep_re.search(u):
-                continue
-            page_found.append(u)
+    pages = (_vt_page(base_url, p) for p in range(0, max_pages + 1))
+    async with aclosing(_iter_listing_pages(cx, pages, headers={"Referer": referer or base_url})) as listing:
+        async for page_url, r in listing:
+            if r.status_code >= 400 or not r.content:
+                break
 
-        new_count = 0
-        for u in page_found:
-            if u in seen:
-                continue
-            seen.add(u)
-            out.append(u)
-            new_count += 1
+            # hrefs straight from the raw bytes (_iter_hrefs undoes "\\/" per match)
+            page_found: List[str] = []
+            for href in _iter_hrefs(r.content):
+                u = _abs_vt(href)
+                if not u:
+                    continue
+                km = keep_match(u)
+                if km is None or km.lastgroup != keep:
+                    continue
+                page_found.append(u)
 
-            if stop_at_url and u == stop_at_url:
-                return out
+            new_count = 0
+            for u in page_found:
+                if u in seen:
+                    continue
+                seen.add(u)
+                out.append(u)
+                new_count += 1
 
-            if len(out) >= limit:
-                return out
+                if stop_at_url and u == stop_at_url:
+                    return out
 
-        if new_count == 0:
-            break
+                if len(out) >= limit:
+                    return out
 
-        await asyncio.sleep(0.1)
+            if new_count == 0:
+                break
 
     return out
 
@@ -2757,9 +2937,8 @@ def _extract_links_from_views_ajax_payload(payload: object) -> List[str]:
                 blobs.append(v)
 
     # scrape hrefs
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
     for blob in blobs:
-        for m in href_re.finditer(blob):
+        for m in _HREF_RE.finditer(blob):
             u = _abs_az(m.group(1))
             if u:
                 urls.append(u)
@@ -2783,21 +2962,33 @@ async def _safe_ai_polish(summary: str, title: str, url: str) -> str:
     except Exception:
         return summary
     
+_VIEW_DOM_ID_RE = re.compile(r'name=["\']view_dom_id["\']\s+value=["\']([^"\']+)["\']', re.I)
+_VIEW_DOM_ID_JSON_RE = re.compile(r'"view_dom_id"\s*:\s*"([^"]+)"', re.I)
+
 def _extract_view_dom_id(html: str) -> str:
     if not html:
         return ""
     # common: <input type="hidden" name="view_dom_id" value="...">
-    m = re.search(r'name=["\']view_dom_id["\']\s+value=["\']([^"\']+)["\']', html, re.I)
+    m = _VIEW_DOM_ID_RE.search(html)
     if m:
         return (m.group(1) or "").strip()
 
     # sometimes in Drupal settings JSON blobs
-    m2 = re.search(r'"view_dom_id"\s*:\s*"([^"]+)"', html, re.I)
+    m2 = _VIEW_DOM_ID_JSON_RE.search(html)
     if m2:
         return (m2.group(1) or "").strip()
 
     return ""
 
+_VA_TITLE_GENERIC = frozenset({"governor of virginia", "home", "newsroom"})
+
+# og:title, <h1>/<h2> and <title> in one left-to-right scan
+_VA_TITLE_SCAN_RE = re.compile(
+    r'(?is)<meta[^>]+property=["\']og:title["\'][^>]+content=["\'](?P<og>.*?)["\']'
+    r'|<(?P<tag>h[12])[^>]*>(?P<h>.*?)</(?P=tag)>'
+    r'|<title[^>]*>(?P<title>.*?)</title>'
+)
+
 def _extract_va_title(html: str) -> str:
     """
     VA pages often have a generic header <h1> ("Governor of Virginia").
@@ -2806,36 +2997,35 @@ def _extract_va_title(html: str) -> str:
     if not html:
         return ""
 
-    generic = {"governor of virginia", "home", "newsroom"}
-
-    # og:title
-    m = re.search(r'(?is)<meta[^>]+property=["\']og:title["\'][^>]+content=["\'](.*?)["\']', html)
-    if m:
-        t = re.sub(r"\s+", " ", m.group(1)).strip()
-        if t and t.lower() not in generic:
-            return t
-
-    # collect h1/h2 candidates
-    cands: list[str] = []
-    for tag in ("h1", "h2"):
-        for mh in re.finditer(rf'(?is)<{tag}[^>]*>(.*?)</{tag}>', html):
-            t = re.sub(r'(?is)<[^>]+>', " ", mh.group(1))
-            t = re.sub(r"\s+", " ", t).strip()
-            if not t:
-                continue
-            if t.lower() in generic:
-                continue
-            cands.append(t)
+    og: str | None = None
+    title: str | None = None
+    h1s: list[str] = []
+    h2s: list[str] = []
+
+    for m in _VA_TITLE_SCAN_RE.finditer(html):
+        g = m.lastgroup
+        if g == "og":
+            if og is None:
+                og = _WS_RE.sub(" ", m.group("og")).strip()
+                # og:title wins outright when it's specific
+                if og and og.lower() not in _VA_TITLE_GENERIC:
+                    return og
+        elif g == "title":
+            if title is None:
+                title = m.group("title")
+        else:
+            t = _clean_fragment(m.group("h"))
+            if t and t.lower() not in _VA_TITLE_GENERIC:
+                (h1s if m.group("tag").lower() == "h1" else h2s).append(t)
 
+    # longest heading; ties go to h1 and then document order
+    cands = h1s + h2s
     if cands:
-        cands.sort(key=len, reverse=True)
-        return cands[0]
+        return max(cands, key=len)
 
     # last fallback: <title>
-    m2 = re.search(r'(?is)<title[^>]*>(.*?)</title>', html)
-    if m2:
-        t = re.sub(r'(?is)<[^>]+>', " ", m2.group(1))
-        t = re.sub(r"\s+", " ", t).strip()
+    if title is not None:
+        t = _clean_fragment(title)
         if t:
             return t
 
@@ -2853,12 +3043,12 @@ def _title_from_va_slug(url: str) -> str:
     url slug -> human title
     e.g. .../religious-freedom-day-3.html -> Religious Freedom Day
     """
-    path = urlsplit(url).path.rstrip("/")
+    path = _url_path(url).rstrip("/")
     slug = path.rsplit("/", 1)[-1]
     slug = slug.replace(".html", "").replace(".htm", "")
     slug = re.sub(r"-\d+$", "", slug)  # drop trailing -3, -2, etc.
     slug = slug.replace("-", " ").strip()
-    slug = re.sub(r"\s+", " ", slug)
+    slug = _WS_RE.sub(" ", slug)
     # Title Case but keep small words lower-ish
     words = slug.split()
     if not words:
@@ -2881,7 +3071,7 @@ def _extract_va_title_by_status(html: str, url: str, status: str) -> str:
     t = _extract_va_title(html) or _extract_h1(html) or ""
     tl = t.strip().lower()
 
-    if status == VA_STATUS_MAP["proclamations"]:
+    if status == _VA_PROC_STATUS:
         # if it's generic, derive from slug
         if not t or tl in _GENERIC_TITLES:
             slug_t = _title_from_va_slug(url)
@@ -2894,6 +3084,53 @@ def _extract_va_title_by_status(html: str, url: str, status: str) -> str:
     return (t.strip() if t else url)
 
 
+# body caps for _get: pages/feeds vs. documents (PDFs etc. still need their full bytes)
+_GET_MAX_TEXT_BYTES = 4 * 1024 * 1024
+_GET_MAX_BINARY_BYTES = 32 * 1024 * 1024
+
+# Content-Type discriminator for the per-URL upserts. Header values repeat across
+# a crawl ("text/html; charset=UTF-8" thousands of times), so each distinct value
+# is lowercased and classified once.
+_CT_HTML = 1
+_CT_PDF = 2
+_CT_OCTET = 4
+
+@functools.lru_cache(maxsize=256)
+def _ct_flags(content_type: str) -> int:
+    ct = content_type.lower()
+    return (
+        (_CT_HTML if "html" in ct else 0)
+        | (_CT_PDF if "pdf" in ct else 0)
+        | (_CT_OCTET if "octet-stream" in ct else 0)
+    )
+
+def _is_html_response(r: httpx.Response) -> bool:
+    return bool(_ct_flags(r.headers.get("Content-Type") or "") & _CT_HTML)
+
+def _is_pdf_response(r: httpx.Response, *urls: str, octet_ok: bool = False) -> bool:
+    # PDF content type, or (servers mislabel PDFs) a URL ending in .pdf
+    flags = _ct_flags(r.headers.get("Content-Type") or "")
+    if flags & _CT_PDF or (octet_ok and flags & _CT_OCTET):
+        return True
+    return any(u[-4:].lower() == ".pdf" for u in urls)
+
+# _get's response extension flagging a body cut at the cap
+_GET_TRUNCATED = "policywatch_truncated"
+_GET_TRANSFER_HEADERS = ("Content-Encoding", "Content-Length", "Transfer-Encoding")
+
+def _pdf_body(r: httpx.Response) -> bytes:
+    # PDF bytes to extract text from; b"" when _get cut the body (a truncated
+    # PDF is missing its trailer, so no summary rather than a garbled one)
+    if r.extensions.get(_GET_TRUNCATED):
+        return b""
+    return r.content or b""
+
+def _get_body_cap(content_type: str) -> int:
+    ct = content_type.lower()
+    if "html" in ct or "text" in ct or "json" in ct or "xml" in ct:
+        return _GET_MAX_TEXT_BYTES
+    return _GET_MAX_BINARY_BYTES
+
 async def _get(
     cx: httpx.AsyncClient,
     url: str,
@@ -2905,13 +3142,36 @@ async def _get(
     for i in range(tries):
         try:
             headers = clean_headers(headers)   # ✅ ADD THIS LINE
-            r = await cx.get(
+            # streamed so a runaway body is cut at the cap instead of buffered whole
+            async with cx.stream(
+                "GET",
                 url,
                 headers=headers,
                 timeout=httpx.Timeout(connect=15.0, read=read_timeout, write=15.0, pool=None),
-            )
-            if r.status_code < 500 and r.status_code != 429:
-                return r
+            ) as r:
+                if r.status_code < 500 and r.status_code != 429:
+                    cap = _get_body_cap(r.headers.get("Content-Type") or "")
+                    buf = bytearray()
+                    truncated = False
+                    async for chunk in r.aiter_bytes(65536):
+                        buf += chunk
+                        if len(buf) > cap:
+                            print("GET body over cap, truncated:", url, "cap=", cap)
+                            del buf[cap:]
+                            truncated = True
+                            break
+                    # detached copy holding the bytes read; aiter_bytes already decoded
+                    # them, so the transfer headers no longer describe the body
+                    hdrs = httpx.Headers(r.headers)
+                    for h in _GET_TRANSFER_HEADERS:
+                        hdrs.pop(h, None)
+                    return httpx.Response(
+                        r.status_code,
+                        headers=hdrs,
+                        content=bytes(buf),
+                        request=r.request,
+                        extensions={_GET_TRUNCATED: truncated},
+                    )
         except (
             httpx.ReadTimeout,
             httpx.ConnectTimeout,
@@ -2930,133 +3190,485 @@ async def _get(
         headers={"X-Error": str(last_exc) if last_exc else ""},
     )
 
+async def _get_bounded(
+    sem: asyncio.Semaphore,
+    cx: httpx.AsyncClient,
+    url: str,
+    **kwargs,
+) -> httpx.Response:
+    # _get, but with at most sem's worth of requests in flight (for gather over detail pages)
+    async with sem:
+        return await _get(cx, url, **kwargs)
+
+# ----------------------------
+# Batched items upserts
+# ----------------------------
+# shared by the per-row upsert and the staging-table merge so the two can't drift
+_ITEMS_CONFLICT_SQL = """
+    on conflict (external_id) do update set
+        source_id=excluded.source_id,
+        title=excluded.title,
+        summary=excluded.summary,
+        url=excluded.url,
+        jurisdiction=excluded.jurisdiction,
+        agency=excluded.agency,
+        status=excluded.status,
+        published_at = COALESCE(excluded.published_at, items.published_at),
+        fetched_at=now()
+"""
+_ITEMS_UPSERT_SQL = """
+    insert into items (
+        external_id, source_id, title, summary, url,
+        jurisdiction, agency, status, published_at, fetched_at
+    )
+    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
+""" + _ITEMS_CONFLICT_SQL
+
+# backfill path: COPY the batch into a per-transaction staging table, then one
+# INSERT ... SELECT with the same conflict rules as _ITEMS_UPSERT_SQL
+_ITEMS_STAGE_COLUMNS = (
+    "external_id", "source_id", "title", "summary", "url",
+    "jurisdiction", "agency", "status", "published_at",
+)
+_ITEMS_STAGE_CREATE_SQL = """
+    create temp table _items_stage on commit drop as
+    select external_id, source_id, title, summary, url,
+           jurisdiction, agency, status, published_at
+    from items with no data
+"""
+_ITEMS_STAGE_MERGE_SQL = """
+    insert into items (
+        external_id, source_id, title, summary, url,
+        jurisdiction, agency, status, published_at, fetched_at
+    )
+    select external_id, source_id, title, summary, url,
+           jurisdiction, agency, status, published_at, now()
+    from _items_stage
+""" + _ITEMS_CONFLICT_SQL
+_ITEMS_BULK_BATCH = 1000
+_ITEMS_COPY_MIN = 200   # below this a plain executemany is as quick as the extra DDL
+
+def _collapse_item_rows(batch: List[tuple]) -> List[tuple]:
+    # one row per external_id (a single INSERT ... ON CONFLICT can't touch a row
+    # twice). Last write wins, but a missing published_at keeps an earlier one --
+    # what the COALESCE in sequential upserts would have produced.
+    by_id: dict[str, tuple] = {}
+    for row in batch:
+        prev = by_id.get(row[0])
+        if prev is not None and row[8] is None and prev[8] is not None:
+            row = row[:8] + (prev[8],)
+        by_id[row[0]] = row
+    return list(by_id.values())
+
+class _ItemRowBuffer:
+    """
+    Collects items rows (external_id, source_id, title, summary, url, jurisdiction,
+    agency, status, published_at) and writes them with executemany in batches
+    instead of one INSERT round-trip per URL. Concurrent upserts can share it: the
+    single asyncpg connection only ever sees one batch at a time.
+
+    A batch is one transaction, so if it fails the batch is replayed row by row
+    and only the rows Postgres rejects are dropped (and printed). `written`
+    counts rows that actually reached the table.
+
+    No named conn.prepare() here: db.init_pool runs with statement_cache_size=0
+    (pooled connections can't be trusted to keep server-side statements), and
+    executemany already parses _ITEMS_UPSERT_SQL once per batch and only re-binds
+    per row.
+    """
+
+    def __init__(self, conn, batch_size: int = 100):
+        self._conn = conn
+        self._batch_size = batch_size
+        self._rows: List[tuple] = []
+        self._lock = asyncio.Lock()
+        self._copy = False
+        self.written = 0
+
+    def bulk(self) -> None:
+        """
+        Backfill mode: bigger batches, and batches of _ITEMS_COPY_MIN+ rows go
+        through COPY into a temp staging table plus a single merge INSERT.
+        Stays on for the rest of the run, so cron-mode sources that share this
+        buffer afterwards get the same batching.
+        """
+        self._batch_size = max(self._batch_size, _ITEMS_BULK_BATCH)
+        self._copy = True
+
+    async def add(self, row: tuple) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._rows:
+            return
+        batch, self._rows = self._rows, []
+        async with self._lock:
+            try:
+                if self._copy and len(batch) >= _ITEMS_COPY_MIN:
+                    rows = _collapse_item_rows(batch)
+                    # one transaction: the staging table lives (and is dropped) within it
+                    async with self._conn.transaction():
+                        await self._conn.execute(_ITEMS_STAGE_CREATE_SQL)
+                        await self._conn.copy_records_to_table(
+                            "_items_stage",
+                            records=rows,
+                            columns=_ITEMS_STAGE_COLUMNS,
+                        )
+                        await self._conn.execute(_ITEMS_STAGE_MERGE_SQL)
+                    self.written += len(rows)
+                else:
+                    await self._conn.executemany(_ITEMS_UPSERT_SQL, batch)
+                    self.written += len(batch)
+            except (asyncpg.PostgresError, asyncpg.DataError):
+                # the whole batch rolled back; replay it one row at a time
+                for row in batch:
+                    try:
+                        await self._conn.execute(_ITEMS_UPSERT_SQL, *row)
+                    except (asyncpg.PostgresError, asyncpg.DataError) as e:
+                        print("items upsert failed:", row[0], repr(e))
+                    else:
+                        self.written += 1
+
+async def _gather_upserts(
+    sem: asyncio.Semaphore,
+    calls: Iterable[Awaitable[bool]],
+    buf: Optional[_ItemRowBuffer] = None,
+) -> int:
+    """
+    Await upsert coroutines with at most sem's worth in flight. Every call settles
+    (and buf, if given, is flushed) before the first failure is re-raised, so a bad
+    URL doesn't drop rows already produced.
+
+    Returns how many rows buf wrote over the run, or how many calls reported True
+    when there's no buffer.
+    """
+    async def one(call: Awaitable[bool]) -> bool:
+        async with sem:
+            return await call
+
+    written_before = buf.written if buf is not None else 0
+    try:
+        results = await asyncio.gather(*(one(c) for c in calls), return_exceptions=True)
+    finally:
+        if buf is not None:
+            await buf.flush()
+    for res in results:
+        if isinstance(res, BaseException):
+            raise res
+    if buf is not None:
+        return buf.written - written_before
+    return sum(1 for res in results if res)
+
+def _summarize_page(title: str, url: str, html: str, page: ParsedPage) -> str:
+    # extractive summary + caps cleanup for one detail page; pure CPU, so the
+    # gathered ingests run it via asyncio.to_thread to keep other fetches moving
+    summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700, text=page.text)
+    return _soft_normalize_caps(summary) if summary else summary
+
+async def _iter_listing_pages(
+    cx: httpx.AsyncClient,
+    page_urls: Iterable[str],
+    *,
+    window: int = 2,
+    delay: float = 0.1,
+    **kwargs,
+) -> AsyncIterator[tuple[str, httpx.Response]]:
+    """
+    Yield (page_url, response) strictly in page order while keeping up to `window`
+    fetches in flight ahead of the consumer (replaces fetch -> parse -> sleep(0.1)).
+    Each new prefetch still waits `delay` first, so these sites see about the same
+    request pacing as the old sequential loop; the gain is only that the next page's
+    fetch overlaps parsing the current one.
+    Callers keep their own stop rules and just break/return; use it under
+    contextlib.aclosing so pending prefetches are cancelled as soon as they do.
+    """
+    it = iter(page_urls)
+    pending: deque[tuple[str, asyncio.Task]] = deque(
+        (u, asyncio.ensure_future(_get(cx, u, **kwargs))) for u in islice(it, window)
+    )
+    try:
+        while pending:
+            u, task = pending.popleft()
+            r = await task
+            nxt = next(it, None)
+            if nxt is not None:
+                if delay:
+                    await asyncio.sleep(delay)
+                pending.append((nxt, asyncio.ensure_future(_get(cx, nxt, **kwargs))))
+            yield u, r
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+def _resp_html(r: httpx.Response) -> str:
+    """
+    Response body as text with JSON-escaped slashes ("\\/") undone.
+    Plain HTML (no "\\/" in the raw bytes) is decoded once and returned as-is;
+    otherwise the bytes are fixed up before the single decode.
+    """
+    raw = r.content
+    if b"\\/" not in raw:
+        return r.text
+    return raw.replace(b"\\/", b"/").decode(r.encoding or "utf-8", errors="replace")
+
+# blocks _strip_html_to_text removes before flattening
+_TEXT_DROPPED_BLOCK_RE = re.compile(r"(?i)<(?:script|style|noscript|nav|header|footer|aside)\b")
+
+class ParsedPage:
+    """
+    One fetched HTML page, shared by the per-page extractors so the costly
+    derived views (stripped text, href list) are built at most once.
+    """
+    __slots__ = ("url", "html", "_text", "_hrefs", "_main")
+
+    def __init__(self, url: str, html: str):
+        self.url = url
+        self.html = html or ""
+        self._text: str | None = None
+        self._hrefs: list[str] | None = None
+        self._main: str | None | bool = False  # False = not computed yet
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = _strip_html_to_text(self.html)
+        return self._text
+
+    @property
+    def main_raw(self) -> str | None:
+        """
+        The raw HTML region the text view is built from, if it's safe to regex
+        directly (none of the script/nav/header/... blocks the text view drops);
+        else None and callers use .text.
+        """
+        if self._main is False:
+            main = _extract_main_html(self.html)
+            self._main = None if _TEXT_DROPPED_BLOCK_RE.search(main) else main
+        return self._main
+
+    @property
+    def hrefs(self) -> list[str]:
+        # raw href values in document order (JSON-escaped slashes undone)
+        if self._hrefs is None:
+            self._hrefs = [m.group(1) for m in _HREF_RE.finditer(self.html.replace("\\/", "/"))]
+        return self._hrefs
+
 def _extract_h1(html: str) -> str:
     # og:title first
-    m = re.search(r'(?is)<meta[^>]+property=["\']og:title["\'][^>]+content=["\'](.*?)["\']', html)
+    m = _META_OG_TITLE_RE.search(html)
     if m:
-        t = re.sub(r"\s+", " ", m.group(1)).strip()
+        t = _WS_RE.sub(" ", m.group(1)).strip()
         if t:
             return t
 
     # longest h1
     h1s: list[str] = []
-    for mh in re.finditer(r'(?is)<h1[^>]*>(.*?)</h1>', html):
-        t = re.sub(r'(?is)<[^>]+>', ' ', mh.group(1))
-        t = re.sub(r"\s+", " ", t).strip()
+    for mh in _H1_RE.finditer(html):
+        t = _clean_fragment(mh.group(1))
         if t:
             h1s.append(t)
     if h1s:
-        h1s.sort(key=len, reverse=True)
-        return h1s[0]
+        return max(h1s, key=len)  # first of the longest
 
     # title tag fallback
-    m2 = re.search(r'(?is)<title[^>]*>(.*?)</title>', html)
+    m2 = _TITLE_TAG_RE.search(html)
     if m2:
-        t = re.sub(r'(?is)<[^>]+>', ' ', m2.group(1))
-        t = re.sub(r"\s+", " ", t).strip()
+        t = _clean_fragment(m2.group(1))
         if t:
             return t
 
     return ""
 
 _US_MONTH_DATE_RE = re.compile(
-    r'\b('
+    r'(?i)\b('
     r'Jan(?:uary)?\.?|Feb(?:ruary)?\.?|Mar(?:ch)?\.?|Apr(?:il)?\.?|May\.?|Jun(?:e)?\.?|'
     r'Jul(?:y)?\.?|Aug(?:ust)?\.?|Sep(?:t(?:ember)?)?\.?|Oct(?:ober)?\.?|'
     r'Nov(?:ember)?\.?|Dec(?:ember)?\.?'
-    r')\s+\d{1,2},\s+\d{4}\b',
-    re.I
+    r')\s+\d{1,2},\s+\d{4}\b'
 )
 
+_MONTH_ABBR_DOT_RE = re.compile(r"(?i)\b(Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.")
+
+# case-insensitive marker screens for the JSON-LD / meta date scans: a regex
+# search, so a miss doesn't copy the page the way html.lower() would
+_LD_JSON_MARKER_RE = re.compile(r"ld\+json", re.I)
+_PUBLISH_MARKER_RE = re.compile(r"publish", re.I)
+
+def _first_us_month_date(page: ParsedPage) -> str | None:
+    """
+    First "Month DD, YYYY" in the page's text view, without building the text
+    view when the raw main HTML can answer: a raw hit is only trusted once the
+    HTML before it, tags stripped, holds no earlier date split by markup
+    ("<span>January</span> 5, 2025").
+    """
+    main = page.main_raw
+    if main is None:
+        m = _US_MONTH_DATE_RE.search(page.text)
+        return m.group(0) if m else None
+
+    m = _US_MONTH_DATE_RE.search(main)
+    head = main[:m.start()] if m else main
+    if "<" in head or "&" in head:
+        m2 = _US_MONTH_DATE_RE.search(_html.unescape(_TAG_STRIP_RE.sub(" ", head)))
+        if m2:
+            return m2.group(0)
+    return m.group(0) if m else None
+
+_US_MONTH_DATE_CANON_RE = re.compile(r"([A-Za-z]+\.?) ([0-9]{1,2}), ([0-9]{4})")
+# month words strptime's %B/%b take (C locale) once "Dec." -> "Dec" has run; the
+# leftover dotted forms ("May.", "June.") and "Sept" are rejected there, so not here
+_US_MONTH_TOKEN_NUM = {
+    **_MONTH_FULL,
+    **{k: v for k, v in _MONTH_ABBR.items() if k != "sept"},
+}
+
+@functools.lru_cache(maxsize=4096)
 def _parse_us_month_date(s: str) -> datetime | None:
-    s = re.sub(r"\s+", " ", (s or "").strip())
+    s = " ".join((s or "").split())
     # remove trailing dots in month abbreviations: "Dec." -> "Dec"
-    s = re.sub(r"(?i)\b(Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.", r"\1", s)
+    s = _MONTH_ABBR_DOT_RE.sub(r"\1", s)
 
-    for fmt in ("%B %d, %Y", "%b %d, %Y"):
+    # the canonical "Month D, YYYY" shape is built directly (strptime is ~10x
+    # slower and a backfill misses the cache on most dates); anything else keeps
+    # the strptime path and its exact rules
+    m = _US_MONTH_DATE_CANON_RE.fullmatch(s)
+    if m:
+        mon = _US_MONTH_TOKEN_NUM.get(m.group(1).lower())
+        if not mon:
+            return None
         try:
-            return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc)
-        except Exception:
-            pass
-    return None
+            return datetime(int(m.group(3)), mon, int(m.group(2)), tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    # only one format can fit, so pick it from the month word instead of
+    # letting the other strptime fail first
+    fmt = "%B %d, %Y" if s.partition(" ")[0].lower() in _MONTH_FULL else "%b %d, %Y"
+    try:
+        return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc)
+    except Exception:
+        return None
+
 
+_FUTURE_SLACK = timedelta(days=2)
+# anything at or before this bound passes the guard whenever it runs (the clock
+# only moves forward), so the common case -- a past date -- skips datetime.now()
+_NOT_FUTURE_BEFORE = datetime.now(timezone.utc) + _FUTURE_SLACK
 
 def _date_guard_not_future(dt: datetime | None) -> datetime | None:
     if not dt:
         return None
-    now = datetime.now(timezone.utc)
-    if dt > now + timedelta(days=2):
+    if dt <= _NOT_FUTURE_BEFORE:
+        return dt
+    if dt > datetime.now(timezone.utc) + _FUTURE_SLACK:
         return None
     return dt
 
-def _date_from_json_ld(html: str) -> datetime | None:
-    if not html:
+def _parse_iso_fast(s: str) -> datetime | None:
+    s = s.strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(s).astimezone(timezone.utc)
+    except (ValueError, OverflowError, OSError):
         return None
 
-    for m in re.finditer(
-        r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-        html,
-        re.I | re.S,
-    ):
-        blob = (m.group(1) or "").strip()
+_JSON_LD_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*+>((?:[^<]++|<(?!/script>))*+)</script>',
+    re.I,
+)
+
+def _iter_ld_date_candidates(html: str) -> Iterable[tuple[str, object]]:
+    """
+    ("published" | "modified", raw value) pairs from the page's JSON-LD blobs, in
+    blob order. Each blob's top-level nodes come first, then nodes nested under
+    "@graph" (Yoast-style schema.org output), level by level.
+    """
+    for m in _JSON_LD_RE.finditer(html):
+        blob = m.group(1).strip()
         if not blob:
             continue
 
         try:
-            data = __import__("json").loads(blob)
+            data = _jloads(blob)
         except Exception:
             continue
 
-        nodes = data if isinstance(data, list) else [data]
-        for node in nodes:
-            if not isinstance(node, dict):
-                continue
+        level = data if type(data) is list else [data]
+        while level:
+            nested: list = []
+            for node in level:
+                if type(node) is not dict:
+                    continue
 
-            # ✅ PRIMARY: datePublished / dateCreated
-            dp = node.get("datePublished") or node.get("dateCreated")
-            if dp:
-                try:
-                    dt = datetime.fromisoformat(str(dp).replace("Z", "+00:00")).astimezone(timezone.utc)
-                    dt = _date_guard_not_future(dt)
-                    if dt:
-                        return dt
-                except Exception:
-                    pass
+                # ✅ PRIMARY: datePublished / dateCreated
+                dp = node.get("datePublished") or node.get("dateCreated")
+                if dp:
+                    yield "published", dp
 
-            # ✅ SECONDARY: dateModified (only if not "today", since that's often untrustworthy)
-            dm = node.get("dateModified")
-            if dm:
-                try:
-                    dm_dt = datetime.fromisoformat(str(dm).replace("Z", "+00:00")).astimezone(timezone.utc)
-                    dm_dt = _date_guard_not_future(dm_dt)
-                    now = datetime.now(timezone.utc)
-                    if dm_dt and dm_dt.date() != now.date():
-                        return dm_dt
-                except Exception:
-                    pass
+                # ✅ SECONDARY: dateModified
+                # (skip when it's the same string that just failed as datePublished)
+                dm = node.get("dateModified")
+                if dm and dm != dp:
+                    yield "modified", dm
+
+                graph = node.get("@graph")
+                if type(graph) is list:
+                    nested.extend(graph)
+                elif type(graph) is dict:
+                    nested.append(graph)
+            level = nested
+
+def _date_from_json_ld(html: str) -> datetime | None:
+    if not html or not _LD_JSON_MARKER_RE.search(html):
+        return None
+
+    today = None
+    for kind, val in _iter_ld_date_candidates(html):
+        dt = _date_guard_not_future(_parse_iso_fast(str(val)))
+        if not dt:
+            continue
+        if kind == "modified":
+            # only if not "today", since that's often untrustworthy
+            if today is None:
+                today = datetime.now(timezone.utc).date()
+            if dt.date() == today:
+                continue
+        return dt
 
     return None
 
+# one pass over the page for all publish-date meta forms; the empty named group
+# marks which form matched (p0 wins over p1 over p2)
+_META_DATE_RE = re.compile(
+    r'(?i)(?:'
+    r'property=["\']article:published_time["\'](?P<p0>)|'
+    r'name=["\']publish[-_ ]?date["\'](?P<p1>)|'
+    r'itemprop=["\']datePublished["\'](?P<p2>)'
+    r')[^>]+content=["\'](?P<val>.*?)["\']'
+)
+
 def _date_from_meta(html: str) -> datetime | None:
-    if not html:
+    # every form matched below contains "publish" (published_time, publish-date, datePublished)
+    if not html or not _PUBLISH_MARKER_RE.search(html):
         return None
-    pats = [
-        r'property=["\']article:published_time["\'][^>]+content=["\'](.*?)["\']',
-        r'name=["\']publish[-_ ]?date["\'][^>]+content=["\'](.*?)["\']',
-        r'itemprop=["\']datePublished["\'][^>]+content=["\'](.*?)["\']',
-    ]
-    for pat in pats:
-        m = re.search(pat, html, re.I)
-        if not m:
-            continue
-        val = (m.group(1) or "").strip()
+    first: dict[int, str] = {}
+    for m in _META_DATE_RE.finditer(html):
+        k = 0 if m.group("p0") is not None else 1 if m.group("p1") is not None else 2
+        if k not in first:
+            first[k] = m.group("val")
+            if len(first) == 3:
+                break
+    for k in sorted(first):
+        val = (first[k] or "").strip()
         if not val:
             continue
         # iso-ish
-        try:
-            return datetime.fromisoformat(val.replace("Z", "+00:00")).astimezone(timezone.utc)
-        except Exception:
-            pass
+        dt = _parse_iso_fast(val)
+        if dt:
+            return dt
         # rfc2822-ish
         try:
             return parsedate_to_datetime(val).astimezone(timezone.utc)
@@ -3064,16 +3676,17 @@ def _date_from_meta(html: str) -> datetime | None:
             pass
     return None
 
-def _date_from_ohio_article(html: str, url: str) -> datetime | None:
+def _date_from_ohio_article(html: str, url: str, page: ParsedPage | None = None) -> datetime | None:
     dt = _date_from_meta(html) or _date_from_json_ld(html)
     dt = _date_guard_not_future(dt)
     if dt:
         return dt
 
-    text = _strip_html_to_text(html)
-    m = _US_MONTH_DATE_RE.search(text)
-    if m:
-        dt2 = _parse_us_month_date(m.group(0))
+    if page is None:
+        page = ParsedPage(url, html)
+    hit = _first_us_month_date(page)
+    if hit:
+        dt2 = _parse_us_month_date(hit)
         dt2 = _date_guard_not_future(dt2) if dt2 else None
         if dt2:
             return dt2
@@ -3087,6 +3700,7 @@ def _date_from_ohio_article(html: str, url: str) -> datetime | None:
 # Ohio listing crawl (HTML)
 # ----------------------------
 
+@functools.lru_cache(maxsize=None)
 def _ohio_detail_link_re(section: str) -> re.Pattern:
     prefix = OH_SECTION_PREFIX[section]  # e.g. "/media/news-and-media/"
     return re.compile(
@@ -3095,6 +3709,16 @@ def _ohio_detail_link_re(section: str) -> re.Pattern:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _ohio_link_pat(section: str, escaped: bool = False) -> re.Pattern:
+    # any occurrence of the section prefix (href OR JSON/script), compiled once per section;
+    # escaped=True matches the JSON form "\/media\/news-and-media\/..." instead
+    prefix = OH_SECTION_PREFIX[section]
+    if escaped:
+        prefix = prefix.replace("/", "\\/")
+    return re.compile(r"(" + re.escape(prefix) + r"[^\"'\s<>]+)", re.I)
+
+
 async def _collect_ohio_listing_urls(
     cx: httpx.AsyncClient,
     section: str,
@@ -3112,6 +3736,9 @@ async def _collect_ohio_listing_urls(
     base = OH_COMPONENT_LISTING[section]         # XHR HTML listing
     prefix = OH_SECTION_PREFIX[section]          # "/media/....../"
     listing_public = OH_PUBLIC_PAGES[section]        # public landing page for this section
+    listing_root = listing_public.rstrip("/")
+    pat = _ohio_link_pat(section)
+    esc_pat = _ohio_link_pat(section, escaped=True)
     seen: set[str] = set()
     out: List[str] = []
 
@@ -3123,50 +3750,54 @@ async def _collect_ohio_listing_urls(
 
         html = r.text
         print("OH LIST PAGE", section, page_url, "len=", len(html))
-        if p in (0, 1):
+        if _INGEST_DEBUG and p in (0, 1):
             print("OH LIST PAGE HEAD", section, "p=", p, "head=", repr(html[:200]))
 
         # Some Ohio pages don’t include <a href="..."> links in server HTML.
         # The detail URLs often appear inside JSON/script as "/media/..." or escaped as "\\/media\\/..."
         page_urls: List[str] = []
 
-        # Normalize escaped slashes from JSON blobs: "\\/media\\/news-and-media\\/..." -> "/media/news-and-media/..."
-        html_norm = html.replace("\\/", "/")
+        # Escaped slashes from JSON blobs ("\\/media\\/news-and-media\\/...") get their own
+        # literal-prefix scan of the same string, normalized per match, instead of a
+        # second scan over a normalized copy of the whole page (which re-finds every
+        # plain link too). Plain links still come first, as before.
+        scans = [(pat, False)]
+        if "\\/" in html:
+            scans.append((esc_pat, True))
 
         # Look for any occurrences of the section prefix anywhere in the HTML (href OR JSON/script)
         # Example match: /media/news-and-media/some-slug
-        pat = re.compile(r"(" + re.escape(prefix) + r"[^\"'\s<>]+)", re.I)
-
-        for blob in (html, html_norm):
-            for m in pat.finditer(blob):
-                path_like = (m.group(1) or "").strip()
-                if not path_like:
-                    continue
+        for scan_re, escaped in scans:
+            for m in scan_re.finditer(html):
+                path_like = m.group(1)
+                if escaped:
+                    path_like = path_like.replace("\\/", "/")
 
                 abs_u = _abs_ohio(path_like)
                 if not abs_u:
                     continue
 
                 # exclude listing root itself
-                if abs_u.rstrip("/") == listing_public.rstrip("/"):
+                if abs_u.rstrip("/") == listing_root:
                     continue
 
                 # keep only urls still under this section path
-                if not urlsplit(abs_u).path.startswith(prefix):
+                # (the match begins at the prefix, but case-insensitively)
+                if not path_like.startswith(prefix):
                     continue
 
                 page_urls.append(abs_u)
 
         # optional debug
-        if p == 0:
+        if _INGEST_DEBUG and p == 0:
             print("OH PREFIX", section, "=", prefix)
-            print("OH PREFIX COUNT raw:", html.count(prefix), "norm:", html_norm.count(prefix))
+            print("OH PREFIX COUNT raw:", html.count(prefix), "escaped:", html.count(prefix.replace("/", "\\/")))
             print("OH MATCHES", section, "sample:", page_urls[:5])
 
 
         # dedupe + preserve order
         new_count = 0
-        for u in page_urls:
+        for u in dict.fromkeys(page_urls):
             if u in seen:
                 continue
             seen.add(u)
@@ -3187,6 +3818,12 @@ async def _collect_ohio_listing_urls(
 
     return out
 
+# AZ views links: news detail pages first, then anything else on the site
+_AZ_KEEP_RE = _compile_keep_alternation({
+    "news": r"https://azgovernor\.gov/office-arizona-governor/news/",
+    "site": r"https://azgovernor\.gov/",
+})
+
 async def _collect_az_views_urls(
     cx: httpx.AsyncClient,
     *,
@@ -3229,10 +3866,11 @@ async def _collect_az_views_urls(
     # 2) ✅ URL filters (defined ONCE)
     # -------------------------
     if kind == "executive_orders":
-        keep_re = re.compile(r"^https://azgovernor\.gov/", re.I)
+        # EO listings keep any azgovernor.gov link (either bucket)
+        keep_buckets = ("news", "site")
 
         def is_detail(u: str) -> bool:
-            path = urlsplit(u).path.rstrip("/")
+            path = _url_path(u).rstrip("/")
             if path == "/executive-orders":
                 return False
             return (
@@ -3240,7 +3878,7 @@ async def _collect_az_views_urls(
                 or "/executive-order" in path
             )
     else:
-        keep_re = re.compile(r"^https://azgovernor\.gov/office-arizona-governor/news/", re.I)
+        keep_buckets = ("news",)
 
         def is_detail(u: str) -> bool:
             return True
@@ -3292,12 +3930,13 @@ async def _collect_az_views_urls(
         page_links = _extract_links_from_views_ajax_payload(payload)
 
         # ✅ debug (EO only)
-        if kind == "executive_orders" and p in (start_page, start_page + 1):
+        if _INGEST_DEBUG and kind == "executive_orders" and p in (start_page, start_page + 1):
             print("AZ EO raw links sample:", page_links[:25])
 
         new_count = 0
         for u in page_links:
-            if not keep_re.search(u):
+            km = _AZ_KEEP_RE.match(u)
+            if km is None or km.lastgroup not in keep_buckets:
                 continue
             if not is_detail(u):
                 continue
@@ -3337,12 +3976,11 @@ async def _collect_va_static_urls(
         return []
 
     html = r.text
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
 
     out: List[str] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
+    for m in _HREF_RE.finditer(html):
         u = _abs_va(m.group(1))
         if not u:
             continue
@@ -3364,6 +4002,9 @@ async def _collect_va_static_urls(
     return out
 
 
+# EO PDFs only
+_VA_EO_PDF_PATH_RE = re.compile(r"/pdf/eo/EO-\d+\.pdf$", re.I)
+
 async def _collect_va_eo_pdf_urls(
     cx: httpx.AsyncClient,
     *,
@@ -3380,19 +4021,15 @@ async def _collect_va_eo_pdf_urls(
         return []
 
     html = r.text
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
-
-    # EO PDFs only
-    keep_re = re.compile(r"/pdf/eo/EO-\d+\.pdf$", re.I)
 
     out: List[str] = []
     seen: set[str] = set()
 
-    for m in href_re.finditer(html):
+    for m in _HREF_RE.finditer(html):
         u = _abs_va(m.group(1))
         if not u:
             continue
-        if not keep_re.search(urlsplit(u).path):
+        if not _VA_EO_PDF_PATH_RE.search(_url_path(u)):
             continue
         if u in seen:
             continue
@@ -3405,6 +4042,33 @@ async def _collect_va_eo_pdf_urls(
 
     return out
 
+async def _sources_with_items(conn, *source_ids) -> set:
+    # backfill detection only asks "any rows yet?" per source: one round trip for
+    # all of a state's sources, and exists() stops at the first index hit instead
+    # of counting the whole source
+    rows = await conn.fetch(
+        """
+        select s.id from sources s
+        where s.id = any($1)
+          and exists (select 1 from items i where i.source_id = s.id)
+        """,
+        list(source_ids),
+    )
+    return {r["id"] for r in rows}
+
+def _dedupe_url_pairs(
+    pairs: Iterable[tuple[str, datetime | None]],
+) -> tuple[list[str], dict[str, datetime | None]]:
+    """
+    (url, date) pairs from a listing crawl -> (urls in first-seen order, url -> date).
+    Empty urls are dropped; a repeated url keeps the date it was first listed with.
+    """
+    dates: dict[str, datetime | None] = {}
+    for u, dt in pairs:
+        if u and u not in dates:
+            dates[u] = dt
+    return list(dates), dates
+
 async def _filter_new_external_ids(conn, source_id: int, urls: list[str]) -> list[str]:
     """
     Return only urls not already present in DB for this source_id.
@@ -3422,6 +4086,69 @@ async def _filter_new_external_ids(conn, source_id: int, urls: list[str]) -> lis
     return [u for u in urls if u not in existing]
 
 
+# ----------------------------
+# Shared listing -> items driver
+# ----------------------------
+
+@dataclass
+class _SourceSpec:
+    """
+    One listing-backed source of a state ingest, for _run_sources.
+      collect(max_pages, limit) -> [(external_id, upsert_args)], deduped, crawl order
+      upsert(source_id, status, *upsert_args) -> bool (row added to the shared buffer)
+    """
+    key: str            # out / upserted key, e.g. "press_releases"
+    label: str          # log tag, e.g. "PR"
+    name: str
+    kind: str
+    base_url: str
+    status: str
+    collect: Callable[[int, int], Awaitable[list[tuple[str, tuple]]]]
+    upsert: Callable[..., Awaitable[bool]]
+
+async def _run_sources(
+    conn,
+    state: str,
+    specs: list[_SourceSpec],
+    effective_params: Callable[[bool], tuple[int, int]],
+    sem: asyncio.Semaphore,
+    buf: _ItemRowBuffer,
+) -> Dict[str, object]:
+    """
+    The common ingest skeleton: create sources, detect backfill per source, crawl
+    each listing with the mode's page/limit caps, keep only new external_ids
+    unless backfilling, then fan the upserts out through _gather_upserts.
+    """
+    out: Dict[str, object] = {}
+
+    src_ids = [await get_or_create_source(conn, sp.name, sp.kind, sp.base_url) for sp in specs]
+    has_items = await _sources_with_items(conn, *src_ids)
+
+    plans: list[tuple[_SourceSpec, Any, list[tuple]]] = []
+    for sp, src in zip(specs, src_ids):
+        backfill = src not in has_items
+        if backfill:
+            buf.bulk()
+        mp, lim = effective_params(backfill)
+
+        keyed = await sp.collect(mp, lim)
+        ids = [k for k, _ in keyed]
+        new_ids = ids if backfill else await _filter_new_external_ids(conn, src, ids)
+        args_by_id = dict(keyed)
+
+        out[f"{sp.key}_seen_urls"] = len(ids)
+        out[f"{sp.key}_new_urls"] = len(new_ids)
+        print(f"{state} {sp.label} mode={'backfill' if backfill else 'cron_safe'} new={len(new_ids)} seen={len(ids)}")
+
+        plans.append((sp, src, [args_by_id[k] for k in new_ids]))
+
+    upserted: Dict[str, int] = {}
+    for sp, src, new_args in plans:
+        upserted[sp.key] = await _gather_upserts(
+            sem, (sp.upsert(src, sp.status, *a) for a in new_args), buf
+        )
+    out["upserted"] = upserted
+    return out
 
 # ----------------------------
 # Ohio ingest
@@ -3444,6 +4171,9 @@ async def ingest_ohio(limit_each: int = 2000, max_pages_each: int = 300) -> Dict
                 "Referer": "https://governor.ohio.gov/",  # default; overridden per request below
             },
             follow_redirects=True,
+            # detail pages are fetched concurrently: keep connections warm (and multiplexed over h2)
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
             timeout=httpx.Timeout(connect=15.0, read=45.0, write=15.0, pool=None),
         ) as cx:
 
@@ -3452,13 +4182,10 @@ async def ingest_ohio(limit_each: int = 2000, max_pages_each: int = 300) -> Dict
             src_appt = await get_or_create_source(conn, "Ohio — Appointments", "state_appointments", OH_PUBLIC_PAGES["appointments"])
             src_eo   = await get_or_create_source(conn, "Ohio — Executive Orders", "state_executive_orders", OH_PUBLIC_PAGES["executive_orders"])
 
-            news_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_news) or 0
-            appt_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_appt) or 0
-            eo_existing   = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-
-            news_backfill = (news_existing == 0)
-            appt_backfill = (appt_existing == 0)
-            eo_backfill   = (eo_existing == 0)
+            has_items = await _sources_with_items(conn, src_news, src_appt, src_eo)
+            news_backfill = src_news not in has_items
+            appt_backfill = src_appt not in has_items
+            eo_backfill   = src_eo not in has_items
 
 
             # ----------------------------
@@ -3520,19 +4247,24 @@ async def ingest_ohio(limit_each: int = 2000, max_pages_each: int = 300) -> Dict
             out["appointments_new_urls"] = len(appt_new_urls)
             out["executive_orders_new_urls"] = len(eo_new_urls)
 
-            async def upsert_url(source_id: int, status: str, url: str, enforce_news_year: bool = False) -> bool:
+            # detail pages are fetched/summarized concurrently (bounded); rows are
+            # buffered and written in executemany batches
+            sem = asyncio.Semaphore(8)
+            buf = _ItemRowBuffer(conn)
+
+            async def _upsert_url(source_id: int, status: str, url: str, enforce_news_year: bool = False) -> bool:
                 r = await _get(cx, url)
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallback + summary
                 title = _extract_h1(html) or url
 
-                pub_dt = _date_from_ohio_article(html, url)
+                pub_dt = _date_from_ohio_article(html, url, page)
                 if not pub_dt:
                     lm = r.headers.get("Last-Modified")
                     if lm:
@@ -3548,29 +4280,11 @@ async def ingest_ohio(limit_each: int = 2000, max_pages_each: int = 300) -> Dict
                     # keep items even if date parsing fails (safer for not missing content)
                     pass
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = await asyncio.to_thread(_summarize_page, title, url, html, page)
                 if summary:
-                    summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
                     source_id,
                     _nz(title),
@@ -3580,22 +4294,19 @@ async def ingest_ohio(limit_each: int = 2000, max_pages_each: int = 300) -> Dict
                     "Ohio Governor",
                     status,
                     pub_dt,
-                )
+                ))
                 return True
 
-            upserted = {"news": 0, "appointments": 0, "executive_orders": 0}
-
-            for u in news_new_urls:
-                if await upsert_url(src_news, STATUS_MAP["news"], u, enforce_news_year=False):
-                    upserted["news"] += 1
+            async def upsert_all(source_id: int, status: str, urls: List[str]) -> int:
+                return await _gather_upserts(
+                    sem, (_upsert_url(source_id, status, u, enforce_news_year=False) for u in urls), buf
+                )
 
-            for u in appt_new_urls:
-                if await upsert_url(src_appt, STATUS_MAP["appointments"], u, enforce_news_year=False):
-                    upserted["appointments"] += 1
+            upserted = {"news": 0, "appointments": 0, "executive_orders": 0}
 
-            for u in eo_new_urls:
-                if await upsert_url(src_eo, STATUS_MAP["executive_orders"], u, enforce_news_year=False):
-                    upserted["executive_orders"] += 1
+            upserted["news"] = await upsert_all(src_news, STATUS_MAP["news"], news_new_urls)
+            upserted["appointments"] = await upsert_all(src_appt, STATUS_MAP["appointments"], appt_new_urls)
+            upserted["executive_orders"] = await upsert_all(src_eo, STATUS_MAP["executive_orders"], eo_new_urls)
 
             out["upserted"] = upserted
             return out
@@ -3605,6 +4316,8 @@ async def ingest_ohio(limit_each: int = 2000, max_pages_each: int = 300) -> Dict
 # ----------------------------
 
 _AZ_PROC_KEEP_RE = re.compile(r"^https://goyff\.az\.gov/", re.I)
+_AZ_PROC_SLUG_RE = re.compile(r"/[A-Za-z0-9_-]{4,}")
+_AZ_PROC_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
 
 def _az_proc_page_url(page_num: int) -> str:
     """
@@ -3651,13 +4364,13 @@ async def _collect_az_proclamation_urls(
         uu = _az_proc_norm_url(u) if u else None
         if not uu:
             return None
-        pth = urlsplit(uu).path or ""
+        pth = _url_path(uu) or ""
         # treat /proclamations/<slug> and /<slug> as equivalent
         if pth.startswith("/proclamations/"):
             pth = "/" + pth[len("/proclamations/"):]
         return pth.rstrip("/") or "/"
 
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+    stop_canon = _az_proc_canon_path(stop_norm) if stop_norm else None
 
     for p in range(0, max_pages):
         page_url = _az_proc_page_url(p)
@@ -3667,12 +4380,12 @@ async def _collect_az_proclamation_urls(
 
         html = _nz(r.text)
 
-        # 🔍 DEBUG: sanity check listing page fetch
-        print("AZ PROC page", p, "html_len=", len(html))
-        print("AZ PROC page", p, "count /proclamations/ =", html.count("/proclamations/"))
+        if _INGEST_DEBUG:
+            print("AZ PROC page", p, "html_len=", len(html))
+            print("AZ PROC page", p, "count /proclamations/ =", html.count("/proclamations/"))
 
         page_links: List[str] = []
-        for m in href_re.finditer(html):
+        for m in _HREF_RE.finditer(html):
             raw = (m.group(1) or "").strip()
             u = _az_proc_norm_url(raw)
             if not u:
@@ -3681,7 +4394,7 @@ async def _collect_az_proclamation_urls(
                 continue
 
             # keep only proclamation detail pages (most common is /proclamations/<slug>)
-            path = urlsplit(u).path or ""
+            path = _url_path(u) or ""
 
             # ✅ Accept both:
             #   1) /proclamations/<slug>
@@ -3690,8 +4403,8 @@ async def _collect_az_proclamation_urls(
             # style_2 is only valid if the slug clearly looks like a proclamation slug
             # (these almost always contain a year like 2024/2025/2019, etc.)
             is_proc_style_2 = (
-                re.fullmatch(r"/[A-Za-z0-9_-]{4,}", path) is not None
-                and re.search(r"(?:19|20)\d{2}", path) is not None
+                _AZ_PROC_SLUG_RE.fullmatch(path) is not None
+                and _AZ_PROC_YEAR_RE.search(path) is not None
             )
 
             # exclude obvious non-detail routes
@@ -3711,17 +4424,14 @@ async def _collect_az_proclamation_urls(
 
         # dedupe + preserve order
         new_count = 0
-        for u in page_links:
+        for u in dict.fromkeys(page_links):
             if u in seen:
                 continue
             seen.add(u)
             out.append(u)
             new_count += 1
 
-            stop_canon = _az_proc_canon_path(stop_norm) if stop_norm else None
-            u_canon = _az_proc_canon_path(u)
-
-            if stop_canon and u_canon and u_canon == stop_canon:
+            if stop_canon and _az_proc_canon_path(u) == stop_canon:
                 return out  # inclusive stop
 
             if len(out) >= limit:
@@ -3734,21 +4444,55 @@ async def _collect_az_proclamation_urls(
 
     return out
 
-def _az_proc_date_from_html(html: str) -> datetime | None:
+_AZ_PROC_DONE_RE = re.compile(
+    r"DONE\s+at\s+the\s+Capitol.*?on\s+this\s+(?P<dayword>[A-Za-z\-]+)\s+day\s+of\s+"
+    r"(?P<month>January|February|March|April|May|June|July|August|September|October|November|December)\s+"
+    r"in\s+the\s+year\s+(?P<yearwords>[A-Za-z\-\s]+?)\s+and\s+of\s+the",
+    re.I | re.S,
+)
+_AZ_WORD_RE = re.compile(r"[a-z]+")
+
+# number words in the year clause ("two thousand and twenty five")
+_AZ_NUM_MAP = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
+    "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50, "sixty": 60,
+    "seventy": 70, "eighty": 80, "ninety": 90,
+}
+def _az_yearwords_to_int(s: str) -> int | None:
+    # Handles typical patterns like: "two thousand and twenty five".
+    # "twenty five" needs no lookahead: composing tens+units is plain addition,
+    # and "thousand" scales everything accumulated so far.
+    num = _AZ_NUM_MAP
+    base = 0
+    for t in _AZ_WORD_RE.findall(s):
+        if t == "thousand":
+            base = (base or 1) * 1000
+        else:
+            base += num.get(t, 0)
+    return base if base >= 1900 else None
+
+def _az_proc_date_from_html(html: str, page: ParsedPage | None = None) -> datetime | None:
     """
     Prefer the human-readable date near the top (e.g., 'January 1, 2026').
     Fallback: parse the 'DONE at the Capitol ...' line (day word + month + year words).
     """
     if not html:
         return None
-    
+    if page is None:
+        page = ParsedPage("", html)
+
     # 0) BEST: date near the title (right after <h1>)
     try:
-        mh1 = re.search(r"(?is)<h1[^>]*>.*?</h1>", html)
+        mh1 = _H1_RE.search(html)
         if mh1:
-            nearby_html = html[mh1.end(): mh1.end() + 9000]
-            nearby_text = _strip_html_to_text(nearby_html)
-            m0 = _US_MONTH_DATE_RE.search(nearby_text or "")
+            nearby = ParsedPage("", html[mh1.end(): mh1.end() + 9000])
+            nearby_main = nearby.main_raw
+            m0 = _US_MONTH_DATE_RE.search(nearby_main) if nearby_main is not None else None
+            if not m0:
+                m0 = _US_MONTH_DATE_RE.search(nearby.text)
             if m0:
                 dt0 = _parse_us_month_date(m0.group(0))
                 dt0 = _date_guard_not_future(dt0) if dt0 else None
@@ -3758,9 +4502,12 @@ def _az_proc_date_from_html(html: str) -> datetime | None:
         pass
 
     # 1) Top-of-page "Month D, YYYY" (use only early part to avoid grabbing DONE-date first)
-    text = _strip_html_to_text(html)
-    head = (text or "")[:2500]
-    m = _US_MONTH_DATE_RE.search(head)
+    # markup only ever shrinks on the way to text, so a raw hit before 2500 is also
+    # within the first 2500 chars of the text view
+    main = page.main_raw
+    m = _US_MONTH_DATE_RE.search(main, 0, 2500) if main is not None else None
+    if not m:
+        m = _US_MONTH_DATE_RE.search(page.text, 0, 2500)
     if m:
         dt = _parse_us_month_date(m.group(0))
         dt = _date_guard_not_future(dt) if dt else None
@@ -3768,13 +4515,7 @@ def _az_proc_date_from_html(html: str) -> datetime | None:
             return dt
 
     # 2) Fallback: "DONE ... on this fifteenth day of December in the year Two Thousand and Twenty-Five ..."
-    done_re = re.compile(
-        r"DONE\s+at\s+the\s+Capitol.*?on\s+this\s+(?P<dayword>[A-Za-z\-]+)\s+day\s+of\s+"
-        r"(?P<month>January|February|March|April|May|June|July|August|September|October|November|December)\s+"
-        r"in\s+the\s+year\s+(?P<yearwords>[A-Za-z\-\s]+?)\s+and\s+of\s+the",
-        re.I | re.S,
-    )
-    m2 = done_re.search(text or "")
+    m2 = _AZ_PROC_DONE_RE.search(page.text)
     if not m2:
         return None
 
@@ -3782,55 +4523,8 @@ def _az_proc_date_from_html(html: str) -> datetime | None:
     month = (m2.group("month") or "").strip()
     yearwords = (m2.group("yearwords") or "").lower().replace("-", " ").strip()
 
-    day_map = {
-        "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
-        "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9, "tenth": 10,
-        "eleventh": 11, "twelfth": 12, "thirteenth": 13, "fourteenth": 14, "fifteenth": 15,
-        "sixteenth": 16, "seventeenth": 17, "eighteenth": 18, "nineteenth": 19, "twentieth": 20,
-        "twenty first": 21, "twenty second": 22, "twenty third": 23, "twenty fourth": 24,
-        "twenty fifth": 25, "twenty sixth": 26, "twenty seventh": 27, "twenty eighth": 28,
-        "twenty ninth": 29, "thirtieth": 30, "thirty first": 31,
-    }
-    day = day_map.get(dayword)
-
-    def _az_yearwords_to_int(s: str) -> int | None:
-        # Handles typical patterns like: "two thousand and twenty five"
-        toks = [t for t in re.findall(r"[a-z]+", s) if t != "and"]
-        if not toks:
-            return None
-        base = 0
-        i = 0
-        num = {
-            "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
-            "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
-            "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
-            "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
-            "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50, "sixty": 60,
-            "seventy": 70, "eighty": 80, "ninety": 90,
-        }
-        while i < len(toks):
-            t = toks[i]
-            if t == "thousand":
-                if base == 0:
-                    base = 1
-                base *= 1000
-                i += 1
-                continue
-            # try "twenty five" composition
-            if t in ("twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"):
-                v = num[t]
-                if i + 1 < len(toks) and toks[i + 1] in num and num[toks[i + 1]] < 10:
-                    v += num[toks[i + 1]]
-                    i += 1
-                base += v
-                i += 1
-                continue
-            if t in num:
-                base += num[t]
-                i += 1
-                continue
-            i += 1
-        return base if base >= 1900 else None
+    # same ordinal table as the CO seals ("twenty first" form, hyphens already spaced)
+    day = _CO_ORDINAL_DAY.get(dayword)
 
     year = _az_yearwords_to_int(yearwords)
 
@@ -3855,6 +4549,10 @@ async def ingest_arizona(limit_each: int = 5000, max_pages_each: int = 300) -> D
                 "X-Requested-With": "XMLHttpRequest",
             },
             follow_redirects=True,
+            # detail pages are fetched concurrently (Semaphore(8)): keep connections
+            # warm (and multiplexed over h2), with headroom for listing prefetches
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
             timeout=httpx.Timeout(connect=15.0, read=45.0, write=15.0, pool=None),
         ) as cx:
 
@@ -3869,13 +4567,10 @@ async def ingest_arizona(limit_each: int = 5000, max_pages_each: int = 300) -> D
                 conn, "Arizona — Proclamations", "state_proclamations", AZ_PUBLIC_PAGES["proclamations"]
             )
 
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            eo_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-            proc_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_proc) or 0
-
-            pr_backfill = (pr_existing == 0)
-            eo_backfill = (eo_existing == 0)
-            proc_backfill = (proc_existing == 0)
+            has_items = await _sources_with_items(conn, src_pr, src_eo, src_proc)
+            pr_backfill = src_pr not in has_items
+            eo_backfill = src_eo not in has_items
+            proc_backfill = src_proc not in has_items
 
 
             # ----------------------------
@@ -3926,24 +4621,30 @@ async def ingest_arizona(limit_each: int = 5000, max_pages_each: int = 300) -> D
             print(f"AZ EO  mode={'backfill' if eo_backfill else 'cron_safe'} new={len(eo_new_urls)} seen={len(eo_urls)}")
             print(f"AZ PROC mode={'backfill' if proc_backfill else 'cron_safe'} new={len(proc_new_urls)} seen={len(proc_urls)}")
 
-            print("AZ PR sample new:", pr_new_urls[:5])
-            print("AZ EO sample new:", eo_new_urls[:5])
-            print("AZ PROC sample new:", proc_new_urls[:5])
+            if _INGEST_DEBUG:
+                print("AZ PR sample new:", pr_new_urls[:5])
+                print("AZ EO sample new:", eo_new_urls[:5])
+                print("AZ PROC sample new:", proc_new_urls[:5])
 
             out["press_releases_new_urls"] = len(pr_new_urls)
             out["executive_orders_new_urls"] = len(eo_new_urls)
             out["proclamations_new_urls"] = len(proc_new_urls)
 
+            # detail pages are fetched/summarized concurrently (bounded); rows are
+            # buffered and written in executemany batches
+            sem = asyncio.Semaphore(8)
+            buf = _ItemRowBuffer(conn)
+
             async def upsert_url(source_id: int, status: str, url: str) -> bool:
                 r = await _get(cx, url)
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallbacks + summary
                 title = _extract_h1(html) or url
 
                 pub_dt = _date_from_meta(html) or _date_from_json_ld(html)
@@ -3951,50 +4652,23 @@ async def ingest_arizona(limit_each: int = 5000, max_pages_each: int = 300) -> D
 
                 # ✅ NEW: AZ proclamations often have a plain date near the title, plus a DONE clause.
                 if not pub_dt and "goyff.az.gov" in url:
-                    pub_dt = _az_proc_date_from_html(html)
+                    pub_dt = _az_proc_date_from_html(html, page)
 
                 if not pub_dt:
-                    text = _strip_html_to_text(html)
-
-                    # ✅ EO pages: prefer the first date near the top (right under "Executive Order 2025-01")
-                    if status == STATUS_MAP["executive_orders"]:
-                        head = "\n".join([ln.strip() for ln in text.splitlines() if ln.strip()][:40])
-                        m = _US_MONTH_DATE_RE.search(head)
-                        if m:
-                            dt2 = _parse_us_month_date(m.group(0))
-                            pub_dt = _date_guard_not_future(dt2) if dt2 else None
-
-                    # fallback: search entire text
-                    if not pub_dt:
-                        m = _US_MONTH_DATE_RE.search(text)
-                        if m:
-                            dt2 = _parse_us_month_date(m.group(0))
-                            pub_dt = _date_guard_not_future(dt2) if dt2 else None
+                    # first "Month D, YYYY" in the text view. For EO pages that's the date
+                    # right under "Executive Order 2025-01": a separate pass over the first
+                    # 40 lines can only ever find this same leftmost match, so there isn't one
+                    m = _US_MONTH_DATE_RE.search(page.text)
+                    if m:
+                        dt2 = _parse_us_month_date(m.group(0))
+                        pub_dt = _date_guard_not_future(dt2) if dt2 else None
 
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = await asyncio.to_thread(_summarize_page, title, url, html, page)
                 if summary:
-                    summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
                     source_id,
                     _nz(title),
@@ -4004,22 +4678,24 @@ async def ingest_arizona(limit_each: int = 5000, max_pages_each: int = 300) -> D
                     "Arizona Governor",
                     status,
                     pub_dt,
-                )
+                ))
                 return True
 
             upserted = {"press_releases": 0, "executive_orders": 0, "proclamations": 0}
 
-            for u in pr_new_urls:
-                if await upsert_url(src_pr, AZ_STATUS_MAP["press_releases"], u):
-                    upserted["press_releases"] += 1
+            pr_status = AZ_STATUS_MAP["press_releases"]
+            eo_status = AZ_STATUS_MAP["executive_orders"]
+            proc_status = AZ_STATUS_MAP["proclamations"]
 
-            for u in eo_new_urls:
-                if await upsert_url(src_eo, AZ_STATUS_MAP["executive_orders"], u):
-                    upserted["executive_orders"] += 1
-
-            for u in proc_new_urls:
-                if await upsert_url(src_proc, AZ_STATUS_MAP["proclamations"], u):
-                    upserted["proclamations"] += 1
+            upserted["press_releases"] = await _gather_upserts(
+                sem, (upsert_url(src_pr, pr_status, u) for u in pr_new_urls), buf
+            )
+            upserted["executive_orders"] = await _gather_upserts(
+                sem, (upsert_url(src_eo, eo_status, u) for u in eo_new_urls), buf
+            )
+            upserted["proclamations"] = await _gather_upserts(
+                sem, (upsert_url(src_proc, proc_status, u) for u in proc_new_urls), buf
+            )
 
 
             out["upserted"] = upserted
@@ -4038,6 +4714,9 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
         async with httpx.AsyncClient(
             headers={**BROWSER_UA_HEADERS},
             follow_redirects=True,
+            # pool sized above the detail-page Semaphore(8), as for AZ
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
             timeout=httpx.Timeout(connect=15.0, read=45.0, write=15.0, pool=None),
         ) as cx:
 
@@ -4052,13 +4731,10 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
             )
 
             # --- detect backfill mode per-source ---
-            news_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_news) or 0
-            proc_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_proc) or 0
-            eo_existing   = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-
-            news_backfill = (news_existing == 0)
-            proc_backfill = (proc_existing == 0)
-            eo_backfill   = (eo_existing == 0)
+            has_items = await _sources_with_items(conn, src_news, src_proc, src_eo)
+            news_backfill = src_news not in has_items
+            proc_backfill = src_proc not in has_items
+            eo_backfill   = src_eo not in has_items
 
             # ----------------------------
             # Cron-safe crawl params
@@ -4107,8 +4783,7 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                 # last-resort fallback (kept), but ideally never used
                 news_pairs = [(VA_NEWS_LATEST_URL, None)]
 
-            news_urls = [u for (u, _) in news_pairs]
-            news_date_map = {u: dt for (u, dt) in news_pairs}
+            news_urls, news_date_map = _dedupe_url_pairs(news_pairs)
 
             # --- Proclamations ---
             proc_pairs = await _collect_va_proclamation_urls_with_dates(
@@ -4118,8 +4793,7 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                 max_urls=lim_proc,
                 stop_at_url="https://www.governor.virginia.gov/newsroom/proclamations/proclamation-list/135th-birthday-of-the-united-states-public-health-service-commissioned-corps.html",
             )
-            proc_urls = [u for (u, _) in proc_pairs]
-            proc_date_map = {u: dt for (u, dt) in proc_pairs}
+            proc_urls, proc_date_map = _dedupe_url_pairs(proc_pairs)
 
             # --- Executive Orders PDFs ---
             eo_pdf_urls = await _collect_va_eo_pdf_urls(
@@ -4147,6 +4821,13 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
             out["proclamations_new_urls"] = len(proc_new_urls)
             out["executive_orders_new_urls"] = len(eo_new_urls)
 
+            # detail pages/PDFs are fetched concurrently (bounded; PDFs get a smaller
+            # budget since each one is parsed in full); rows are buffered and written
+            # in executemany batches
+            sem = asyncio.Semaphore(8)
+            pdf_sem = asyncio.Semaphore(4)
+            buf = _ItemRowBuffer(conn)
+
             async def upsert_html_url(
                 source_id: int,
                 status: str,
@@ -4159,24 +4840,24 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallbacks + summary
                 title = _extract_va_title_by_status(html, url, status) or url
 
                 pub_dt = forced_published_at
 
-                if not pub_dt and status == VA_STATUS_MAP["news_releases"]:
-                    pub_dt = _date_from_va_news(html, url)
+                if not pub_dt and status == _VA_NEWS_STATUS:
+                    pub_dt = _date_from_va_news(html, url, page)
 
                 if not pub_dt:
                     pub_dt = _date_from_meta(html) or _date_from_json_ld(html)
                     pub_dt = _date_guard_not_future(pub_dt)
 
                 if not pub_dt:
-                    text = _strip_html_to_text(html)
+                    text = page.text
                     m = _US_MONTH_DATE_RE.search(text)
                     if m:
                         dt2 = _parse_us_month_date(m.group(0))
@@ -4185,29 +4866,11 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                 # ✅ REMOVED: "enforce 2025-only" (this was blocking 2026+)
                 # We rely on VA_NEWS_CUTOFF_URL to control backfill depth.
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = await asyncio.to_thread(_summarize_page, title, url, html, page)
                 if summary:
-                    summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
                     source_id,
                     _nz(title),
@@ -4217,7 +4880,7 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                     agency,
                     status,
                     pub_dt,
-                )
+                ))
                 return True
 
             async def upsert_pdf_url(
@@ -4232,24 +4895,17 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                 if r.status_code >= 400:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if ("pdf" not in ct) and (not url.lower().endswith(".pdf")):
+                if not _is_pdf_response(r, url):
                     return False
 
-                path = urlsplit(url).path
+                path = _url_path(url)
                 fname = (path.rsplit("/", 1)[-1] or "").strip()
-                title = (
-                    fname.replace(".pdf", "")
-                        .replace("_", " ")
-                        .replace("-", " ")
-                        .strip()
-                    or url
-                )
+                title = _pdf_title_from_fname(fname) or url
 
                 summary = ""
                 try:
-                    pdf_bytes = r.content or b""
-                    pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                    pdf_bytes = _pdf_body(r)
+                    pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes))
                     if pdf_text:
                         eo_dt = _extract_va_eo_date(pdf_text)
                         if eo_dt:
@@ -4262,24 +4918,7 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                 except Exception:
                     summary = ""
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
                     source_id,
                     _nz(title),
@@ -4289,44 +4928,48 @@ async def ingest_virginia(limit_each: int = 5000, max_pages_each: int = 1) -> Di
                     agency,
                     status,
                     published_at,
-                )
+                ))
                 return True
 
             upserted = {"news_releases": 0, "proclamations": 0, "executive_orders": 0}
+            eo_status = VA_STATUS_MAP["executive_orders"]
 
             # ✅ Only process NEW urls in cron-safe mode (prevents repolish)
-            for u in news_new_urls:
-                if await upsert_html_url(
+            upserted["news_releases"] = await _gather_upserts(sem, (
+                upsert_html_url(
                     src_news,
-                    VA_STATUS_MAP["news_releases"],
+                    _VA_NEWS_STATUS,
                     u,
                     "virginia",
                     "Virginia Governor",
                     forced_published_at=news_date_map.get(u),
-                ):
-                    upserted["news_releases"] += 1
+                )
+                for u in news_new_urls
+            ), buf)
 
-            for u in proc_new_urls:
-                if await upsert_html_url(
+            upserted["proclamations"] = await _gather_upserts(sem, (
+                upsert_html_url(
                     src_proc,
-                    VA_STATUS_MAP["proclamations"],
+                    _VA_PROC_STATUS,
                     u,
                     "virginia",
                     "Virginia Governor",
                     forced_published_at=proc_date_map.get(u),
-                ):
-                    upserted["proclamations"] += 1
+                )
+                for u in proc_new_urls
+            ), buf)
 
-            for u in eo_new_urls:
-                if await upsert_pdf_url(
+            upserted["executive_orders"] = await _gather_upserts(pdf_sem, (
+                upsert_pdf_url(
                     src_eo,
-                    VA_STATUS_MAP["executive_orders"],
+                    eo_status,
                     u,
                     "virginia",
                     "Virginia Governor",
                     published_at=None,
-                ):
-                    upserted["executive_orders"] += 1
+                )
+                for u in eo_new_urls
+            ), buf)
 
             out["upserted"] = upserted
             return out
@@ -4338,6 +4981,9 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
         async with httpx.AsyncClient(
             headers={**BROWSER_UA_HEADERS},
             follow_redirects=True,
+            # pool sized above the detail-page Semaphore(8), as for AZ
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
             timeout=httpx.Timeout(connect=15.0, read=60.0, write=15.0, pool=None),
         ) as cx:
 
@@ -4349,14 +4995,12 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
                 "Georgia — Executive Orders",
                 "state_executive_orders",
                 GA_PUBLIC_PAGES["executive_orders_home"],
-            )
-
-            # --- detect backfill mode per-source ---
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            eo_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
+            )
 
-            pr_backfill = (pr_existing == 0)
-            eo_backfill = (eo_existing == 0)
+            # --- detect backfill mode per-source ---
+            has_items = await _sources_with_items(conn, src_pr, src_eo)
+            pr_backfill = src_pr not in has_items
+            eo_backfill = src_eo not in has_items
 
             # ----------------------------
             # Cron-safe crawl params
@@ -4377,30 +5021,20 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
             # Crawl current year + previous year, newest first
             # ----------------------------
             now_year = datetime.now(timezone.utc).year
-            years_to_crawl = [now_year, now_year - 1]
 
             pr_pairs: list[tuple[str, datetime | None]] = []
-            remaining = lim_pr
 
-            for y in years_to_crawl:
-                if remaining <= 0:
+            # the budget is checked before each year, so a current year that
+            # already fills lim_pr never touches last year's listing pages
+            for y in (now_year, now_year - 1):
+                if len(pr_pairs) >= lim_pr:
                     break
                 pairs_y = await _collect_ga_press_release_pairs(
-                    cx, year=y, max_pages=mp_pr, limit=remaining
+                    cx, year=y, max_pages=mp_pr, limit=lim_pr - len(pr_pairs)
                 )
                 pr_pairs.extend(pairs_y)
-                remaining = lim_pr - len(pr_pairs)
 
-            # dedupe preserve order
-            seen_pr: set[str] = set()
-            pr_urls: list[str] = []
-            pr_date_map: dict[str, datetime | None] = {}
-            for (u, dt) in pr_pairs:
-                if not u or u in seen_pr:
-                    continue
-                seen_pr.add(u)
-                pr_urls.append(u)
-                pr_date_map[u] = dt
+            pr_urls, pr_date_map = _dedupe_url_pairs(pr_pairs)
 
             out["press_releases_seen_urls"] = len(pr_urls)
 
@@ -4410,6 +5044,11 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
             print(f"GA PR  mode={'backfill' if pr_backfill else 'cron_safe'} new={len(pr_new_urls)} seen={len(pr_urls)}")
             out["press_releases_new_urls"] = len(pr_new_urls)
 
+            # press release pages are fetched/summarized concurrently (bounded); rows
+            # are buffered and written in executemany batches
+            sem = asyncio.Semaphore(8)
+            buf = _ItemRowBuffer(conn)
+
             async def upsert_html_url(
                 source_id: int,
                 status: str,
@@ -4420,11 +5059,11 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallback + summary
                 title = _extract_h1(html) or url
 
                 pub_dt = forced_published_at
@@ -4433,7 +5072,7 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
                     pub_dt = _date_guard_not_future(pub_dt)
 
                 if not pub_dt:
-                    text = _strip_html_to_text(html)
+                    text = page.text
                     m = _US_MONTH_DATE_RE.search(text)
                     if m:
                         dt2 = _parse_us_month_date(m.group(0))
@@ -4446,29 +5085,11 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
                 if not pub_dt:
                     return False
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = await asyncio.to_thread(_summarize_page, title, url, html, page)
                 if summary:
-                    summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
                     source_id,
                     _nz(title),
@@ -4478,20 +5099,23 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
                     GA_AGENCY,
                     status,
                     pub_dt,
-                )
+                ))
                 return True
 
             upserted = {"press_releases": 0, "executive_orders": 0}
+            pr_status = GA_STATUS_MAP["press_releases"]
+            eo_status = GA_STATUS_MAP["executive_orders"]
 
             # ✅ only upsert NEW press releases in cron mode (prevents repolish)
-            for u in pr_new_urls:
-                if await upsert_html_url(
+            upserted["press_releases"] = await _gather_upserts(sem, (
+                upsert_html_url(
                     src_pr,
-                    GA_STATUS_MAP["press_releases"],
+                    pr_status,
                     u,
                     forced_published_at=pr_date_map.get(u),
-                ):
-                    upserted["press_releases"] += 1
+                )
+                for u in pr_new_urls
+            ), buf)
 
             # ----------------------------
             # Executive Orders (future-proof; stops at cutoff inclusive)
@@ -4532,24 +5156,7 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
             ) -> bool:
                 title = (f"{eo_number} — {desc}".strip(" —")) or eo_number or dl_url
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     _nz(dl_url),
                     source_id,
                     _nz(title),
@@ -4559,31 +5166,35 @@ async def ingest_georgia(limit_each: int = 5000, max_pages_each: int = 50) -> Di
                     GA_AGENCY,
                     status,
                     published_at,
-                )
+                ))
                 return True
 
             # ✅ only upsert NEW EO rows in cron mode
-            for (dl, num, desc, pub_dt) in eo_rows:
-                if upserted["executive_orders"] >= lim_eo:
-                    break
-                if dl not in eo_new_set:
-                    continue
-                if await upsert_ga_eo_row(
-                    src_eo,
-                    GA_STATUS_MAP["executive_orders"],
-                    dl,
-                    num,
-                    desc,
-                    pub_dt,
-                ):
-                    upserted["executive_orders"] += 1
+            eo_written_before = buf.written
+            eo_queued = 0
+            try:
+                for (dl, num, desc, pub_dt) in eo_rows:
+                    if eo_queued >= lim_eo:
+                        break
+                    if dl not in eo_new_set:
+                        continue
+                    if await upsert_ga_eo_row(
+                        src_eo,
+                        eo_status,
+                        dl,
+                        num,
+                        desc,
+                        pub_dt,
+                    ):
+                        eo_queued += 1
+            finally:
+                await buf.flush()
+            upserted["executive_orders"] = buf.written - eo_written_before
 
             out["upserted"] = upserted
             return out
         
 async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dict[str, object]:
-    out: Dict[str, object] = {}
-
     async with connection() as conn:
         async with httpx.AsyncClient(
             headers={**BROWSER_UA_HEADERS},
@@ -4591,25 +5202,6 @@ async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dic
             timeout=httpx.Timeout(connect=15.0, read=60.0, write=15.0, pool=None),
         ) as cx:
 
-            src_pr = await get_or_create_source(
-                conn, "Hawaii — Press Releases", "state_newsroom", HI_PUBLIC_PAGES["press_releases"]
-            )
-            src_eo = await get_or_create_source(
-                conn, "Hawaii — Executive Orders", "state_executive_orders", HI_PUBLIC_PAGES["executive_orders"]
-            )
-            src_proc = await get_or_create_source(
-                conn, "Hawaii — Proclamations", "state_proclamations", HI_PUBLIC_PAGES["proclamations"]
-            )
-
-            # --- per-source backfill detection ---
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            eo_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-            proc_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_proc) or 0
-
-            pr_backfill = (pr_existing == 0)
-            eo_backfill = (eo_existing == 0)
-            proc_backfill = (proc_existing == 0)
-
             # --- cron-safe param caps (ignore huge payloads unless backfill) ---
             def _effective_params(is_backfill: bool) -> tuple[int, int]:
                 if is_backfill:
@@ -4621,117 +5213,64 @@ async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dic
                 lim = max(50, min(int(limit_each or 0) or 200, 800))    # <= 800 urls
                 return mp, lim
 
-            mp_pr, lim_pr = _effective_params(pr_backfill)
-            mp_eo, lim_eo = _effective_params(eo_backfill)
-            mp_proc, lim_proc = _effective_params(proc_backfill)
-
-            # --- Collect seen URLs (bounded by mode) ---
-            pr_urls = await _collect_hi_press_release_urls(
-                cx,
-                start_url=HI_PUBLIC_PAGES["press_releases"],
-                max_pages=mp_pr,
-                limit=lim_pr,
-                stop_at_url=HI_PRESS_CUTOFF_URL,   # future-proof: stops at fixed 2025 boundary
-            )
-            pr_urls = [clean_url(u) for u in pr_urls if u]
-
             # --- Collect seen URLs (bounded by mode) ---
-            eo_items = await _collect_hi_pdf_items_from_category(
-                cx,
-                start_url=HI_PUBLIC_PAGES["executive_orders"],
-                max_pages=mp_eo,
-                limit=lim_eo,
-                stop_at_pdf_url=None,  # all EOs
-            )
-
-            proc_items = await _collect_hi_pdf_items_from_category(
-                cx,
-                start_url=HI_PUBLIC_PAGES["proclamations"],
-                max_pages=mp_proc,
-                limit=lim_proc,
-                stop_at_pdf_url=HI_PROC_CUTOFF_PDF_URL,  # stop at 2025 boundary (inclusive)
-            )
-
-            print("HI EO sample:", eo_items[:3])
-            print("HI PROC sample:", proc_items[:3])
-
-            out["press_releases_seen_urls"] = len(pr_urls)
-            out["executive_orders_seen_urls"] = len(eo_items)
-            out["proclamations_seen_urls"] = len(proc_items)
-
-            eo_urls = [clean_url(u) for (u, _t, _dt) in eo_items if u]
-            proc_urls = [clean_url(u) for (u, _t, _dt) in proc_items if u]
-
-            # --- Cron-safe filtering (ONLY new external_ids unless backfill) ---
-            pr_new_urls = pr_urls if pr_backfill else await _filter_new_external_ids(conn, src_pr, pr_urls)
-            eo_new_urls = eo_urls if eo_backfill else await _filter_new_external_ids(conn, src_eo, eo_urls)
-            proc_new_urls = proc_urls if proc_backfill else await _filter_new_external_ids(conn, src_proc, proc_urls)
-
-            # Map back to title + posted date for only-new processing
-            eo_map = {clean_url(u): (u, t, dt) for (u, t, dt) in eo_items if u}
-            proc_map = {clean_url(u): (u, t, dt) for (u, t, dt) in proc_items if u}
-
-            eo_new_items = [eo_map[u] for u in eo_new_urls if u in eo_map]
-            proc_new_items = [proc_map[u] for u in proc_new_urls if u in proc_map]
-
-            out["press_releases_new_urls"] = len(pr_new_urls)
-            out["executive_orders_new_urls"] = len(eo_new_urls)
-            out["proclamations_new_urls"] = len(proc_new_urls)
+            async def collect_press(mp: int, lim: int) -> list[tuple[str, tuple]]:
+                urls = await _collect_hi_press_release_urls(
+                    cx,
+                    start_url=HI_PUBLIC_PAGES["press_releases"],
+                    max_pages=mp,
+                    limit=lim,
+                    stop_at_url=HI_PRESS_CUTOFF_URL,   # future-proof: stops at fixed 2025 boundary
+                )
+                return [(u, (u,)) for u in dict.fromkeys(clean_url(u) for u in urls if u)]
 
-            print(f"HI PR mode={'backfill' if pr_backfill else 'cron_safe'} new={len(pr_new_urls)} seen={len(pr_urls)}")
-            print(f"HI EO mode={'backfill' if eo_backfill else 'cron_safe'} new={len(eo_new_urls)} seen={len(eo_urls)}")
-            print(f"HI PROC mode={'backfill' if proc_backfill else 'cron_safe'} new={len(proc_new_urls)} seen={len(proc_urls)}")
+            async def collect_pdfs(
+                mp: int, lim: int, *, start_url: str, stop_at_pdf_url: str | None, label: str
+            ) -> list[tuple[str, tuple]]:
+                items = await _collect_hi_pdf_items_from_category(
+                    cx,
+                    start_url=start_url,
+                    max_pages=mp,
+                    limit=lim,
+                    stop_at_pdf_url=stop_at_pdf_url,
+                )
+                if _INGEST_DEBUG:
+                    print(f"HI {label} sample:", items[:3])
+                # keyed by the cleaned url; maps back to (url, title, posted date)
+                return list({clean_url(u): (u, t, dt) for (u, t, dt) in items if u}.items())
 
-            # Fast exit if nothing new (prevents re-polishing)
-            if not pr_new_urls and not eo_new_items and not proc_new_items:
-                out["upserted"] = {"press_releases": 0, "executive_orders": 0, "proclamations": 0}
-                return out
+            # detail pages/PDFs are fetched + summarized concurrently (bounded); rows
+            # go out in executemany batches rather than one INSERT per item
+            sem = asyncio.Semaphore(8)
+            buf = _ItemRowBuffer(conn)
 
             async def upsert_html_url(source_id: int, status: str, url: str) -> bool:
                 r = await _get(cx, url, headers={"Referer": HI_PUBLIC_PAGES["press_releases"]})
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallback + summary
                 title = _extract_h1(html) or url
 
                 pub_dt = _date_from_meta(html) or _date_from_json_ld(html)
                 pub_dt = _date_guard_not_future(pub_dt)
 
                 if not pub_dt:
-                    text = _strip_html_to_text(html)
+                    text = page.text
                     m = _US_MONTH_DATE_RE.search(text)
                     if m:
                         dt2 = _parse_us_month_date(m.group(0))
                         pub_dt = _date_guard_not_future(dt2) if dt2 else None
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = await asyncio.to_thread(_summarize_page, title, url, html, page)
                 if summary:
-                    summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
                     source_id,
                     _nz(title),
@@ -4741,7 +5280,7 @@ async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dic
                     "Hawaii Governor",
                     status,
                     pub_dt,
-                )
+                ))
                 return True
 
             async def upsert_pdf_url(
@@ -4755,22 +5294,15 @@ async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dic
                 if r.status_code >= 400:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if ("pdf" not in ct) and (not url.lower().endswith(".pdf")):
+                if not _is_pdf_response(r, url):
                     return False
 
                 # Title: prefer listing card title
                 title = (title_hint or "").strip()
                 if not title:
-                    path = urlsplit(url).path
+                    path = _url_path(url)
                     fname = (path.rsplit("/", 1)[-1] or "").strip()
-                    title = (
-                        fname.replace(".pdf", "")
-                            .replace("_", " ")
-                            .replace("-", " ")
-                            .strip()
-                        or url
-                    )
+                    title = _pdf_title_from_fname(fname) or url
 
                 # Date: prefer "Posted on ..." from listing card, fallback to filename yymmdd...
                 published_at = _date_guard_not_future(published_at_hint) or _hi_date_from_pdf_filename(url)
@@ -4778,8 +5310,8 @@ async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dic
 
                 summary = ""
                 try:
-                    pdf_bytes = r.content or b""
-                    pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                    pdf_bytes = _pdf_body(r)
+                    pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes, _PDF_SUMMARY_MAX_PAGES))
                     if pdf_text:
                         summary = summarize_text(pdf_text, max_sentences=3, max_chars=700)
                         if summary:
@@ -4788,24 +5320,7 @@ async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dic
                 except Exception:
                     summary = ""
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
                     source_id,
                     _nz(title),
@@ -4815,30 +5330,43 @@ async def ingest_hawaii(limit_each: int = 5000, max_pages_each: int = 60) -> Dic
                     "Hawaii Governor",
                     status,
                     published_at,
-                )
+                ))
                 return True
 
-            upserted = {"press_releases": 0, "executive_orders": 0, "proclamations": 0}
-
             # IMPORTANT: Only process NEW urls in cron_safe mode (prevents repolish)
-            for u in pr_new_urls:
-                if await upsert_html_url(src_pr, HI_STATUS_MAP["press_releases"], u):
-                    upserted["press_releases"] += 1
-
-            for (u, t, dt) in eo_new_items:
-                if await upsert_pdf_url(src_eo, HI_STATUS_MAP["executive_orders"], u, t, dt):
-                    upserted["executive_orders"] += 1
-
-            for (u, t, dt) in proc_new_items:
-                if await upsert_pdf_url(src_proc, HI_STATUS_MAP["proclamations"], u, t, dt):
-                    upserted["proclamations"] += 1
-
-            out["upserted"] = upserted
-            return out
+            return await _run_sources(conn, "HI", [
+                _SourceSpec(
+                    "press_releases", "PR",
+                    "Hawaii — Press Releases", "state_newsroom", HI_PUBLIC_PAGES["press_releases"],
+                    HI_STATUS_MAP["press_releases"], collect_press, upsert_html_url,
+                ),
+                _SourceSpec(
+                    "executive_orders", "EO",
+                    "Hawaii — Executive Orders", "state_executive_orders", HI_PUBLIC_PAGES["executive_orders"],
+                    HI_STATUS_MAP["executive_orders"],
+                    functools.partial(
+                        collect_pdfs,
+                        start_url=HI_PUBLIC_PAGES["executive_orders"],
+                        stop_at_pdf_url=None,  # all EOs
+                        label="EO",
+                    ),
+                    upsert_pdf_url,
+                ),
+                _SourceSpec(
+                    "proclamations", "PROC",
+                    "Hawaii — Proclamations", "state_proclamations", HI_PUBLIC_PAGES["proclamations"],
+                    HI_STATUS_MAP["proclamations"],
+                    functools.partial(
+                        collect_pdfs,
+                        start_url=HI_PUBLIC_PAGES["proclamations"],
+                        stop_at_pdf_url=HI_PROC_CUTOFF_PDF_URL,  # stop at 2025 boundary (inclusive)
+                        label="PROC",
+                    ),
+                    upsert_pdf_url,
+                ),
+            ], _effective_params, sem, buf)
 
 async def ingest_vermont(limit_each: int = 5000, max_pages_each: int = 30) -> Dict[str, object]:
-    out: Dict[str, object] = {}
-
     async with connection() as conn:
         async with httpx.AsyncClient(
             headers={**BROWSER_UA_HEADERS},
@@ -4846,27 +5374,6 @@ async def ingest_vermont(limit_each: int = 5000, max_pages_each: int = 30) -> Di
             timeout=httpx.Timeout(connect=15.0, read=60.0, write=15.0, pool=None),
         ) as cx:
 
-            src_pr = await get_or_create_source(
-                conn, "Vermont — Press Releases", "state_newsroom", VT_PUBLIC_PAGES["press_releases"]
-            )
-            src_eo = await get_or_create_source(
-                conn, "Vermont — Executive Orders", "state_executive_orders",
-                "https://governor.vermont.gov/document-types/executive-orders"
-            )
-            src_proc = await get_or_create_source(
-                conn, "Vermont — Proclamations", "state_proclamations",
-                "https://governor.vermont.gov/document-categories/proclamations"
-            )
-
-            # --- per-source backfill detection ---
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            eo_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-            proc_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_proc) or 0
-
-            pr_backfill = (pr_existing == 0)
-            eo_backfill = (eo_existing == 0)
-            proc_backfill = (proc_existing == 0)
-
             def _effective_params(is_backfill: bool) -> tuple[int, int]:
                 if is_backfill:
                     # backfill = honor user-provided payload
@@ -4877,143 +5384,72 @@ async def ingest_vermont(limit_each: int = 5000, max_pages_each: int = 30) -> Di
                 lim = max(int(limit_each or 0), 2000)
                 return mp, lim
 
-            mp_pr, lim_pr = _effective_params(pr_backfill)
-            mp_eo, lim_eo = _effective_params(eo_backfill)
-            mp_proc, lim_proc = _effective_params(proc_backfill)
-
-
             # ---- Collect listing URLs ----
-            pr_urls_raw = await _collect_vt_listing_urls(
-                cx,
-                base_url=VT_PUBLIC_PAGES["press_releases"],
-                keep_re=_VT_KEEP_PRESS_RE,
-                max_pages=mp_pr,
-                limit=lim_pr,
-                stop_at_url=_canon_vt(VT_PRESS_CUTOFF_URL),
-                referer=VT_PUBLIC_PAGES["press_releases"],
-            )
-
-            # canonicalize + dedupe preserve order
-            pr_urls = []
-            seen = set()
-            for u in pr_urls_raw:
-                cu = _canon_vt(u)
-                if cu and cu not in seen:
-                    seen.add(cu)
-                    pr_urls.append(cu)
-
-            eo_doc_urls_raw = await _collect_vt_listing_urls(
-                cx,
-                base_url="https://governor.vermont.gov/document-types/executive-orders",
-                keep_re=_VT_KEEP_DOC_RE,
-                max_pages=mp_eo,
-                limit=lim_eo,
-                stop_at_url=None,
-                referer="https://governor.vermont.gov/document-types/executive-orders",
-            )
-
-            eo_doc_urls = []
-            seen = set()
-            for u in eo_doc_urls_raw:
-                cu = _canon_vt(u)
-                if cu and cu not in seen:
-                    seen.add(cu)
-                    eo_doc_urls.append(cu)
-
-            proc_doc_urls_raw = await _collect_vt_listing_urls(
-                cx,
-                base_url="https://governor.vermont.gov/document-categories/proclamations",
-                keep_re=_VT_KEEP_DOC_RE,
-                max_pages=mp_proc,
-                limit=lim_proc,
-                stop_at_url=_canon_vt(VT_PROC_CUTOFF_URL),
-                referer="https://governor.vermont.gov/document-categories/proclamations",
-            )
-
-            proc_doc_urls = []
-            seen = set()
-            for u in proc_doc_urls_raw:
-                cu = _canon_vt(u)
-                if cu and cu not in seen:
-                    seen.add(cu)
-                    proc_doc_urls.append(cu)
-
-            out["press_releases_seen_urls"] = len(pr_urls)
-            out["executive_orders_seen_urls"] = len(eo_doc_urls)
-            out["proclamations_seen_urls"] = len(proc_doc_urls)
-
-            # ✅ Cron-safe filtering (only new external_ids unless backfill)
-            pr_new_urls = pr_urls if pr_backfill else await _filter_new_external_ids(conn, src_pr, pr_urls)
-            eo_new_doc_urls = eo_doc_urls if eo_backfill else await _filter_new_external_ids(conn, src_eo, eo_doc_urls)
-            proc_new_doc_urls = proc_doc_urls if proc_backfill else await _filter_new_external_ids(conn, src_proc, proc_doc_urls)
-
-            out["press_releases_new_urls"] = len(pr_new_urls)
-            out["executive_orders_new_urls"] = len(eo_new_doc_urls)
-            out["proclamations_new_urls"] = len(proc_new_doc_urls)
-
-            print(f"VT PR mode={'backfill' if pr_backfill else 'cron_safe'} new={len(pr_new_urls)} seen={len(pr_urls)}")
-            print(f"VT EO mode={'backfill' if eo_backfill else 'cron_safe'} new={len(eo_new_doc_urls)} seen={len(eo_doc_urls)}")
-            print(f"VT PROC mode={'backfill' if proc_backfill else 'cron_safe'} new={len(proc_new_doc_urls)} seen={len(proc_doc_urls)}")
+            async def collect_listing(
+                mp: int,
+                lim: int,
+                *,
+                base_url: str,
+                keep: str,
+                stop_at_url: str | None,
+                referer: str,
+                doc_referer: str | None = None,
+            ) -> list[tuple[str, tuple]]:
+                urls_raw = await _collect_vt_listing_urls(
+                    cx,
+                    base_url=base_url,
+                    keep=keep,
+                    max_pages=mp,
+                    limit=lim,
+                    stop_at_url=stop_at_url,
+                    referer=referer,
+                )
+                # canonicalize + dedupe preserve order; doc pages also carry the
+                # referer their PDF fetch is made with
+                extra = (doc_referer,) if doc_referer else ()
+                return [(u, (u, *extra)) for u in _canon_dedupe_vt(urls_raw)]
 
-            # ✅ Fast exit: nothing new to ingest
-            if not pr_new_urls and not eo_new_doc_urls and not proc_new_doc_urls:
-                out["upserted"] = {"press_releases": 0, "executive_orders": 0, "proclamations": 0}
-                return out
+            # press pages and doc+PDF pairs are fetched concurrently (bounded); rows
+            # are buffered and written in executemany batches
+            sem = asyncio.Semaphore(8)
+            buf = _ItemRowBuffer(conn)
 
-            async def upsert_press_release(url: str) -> bool:
+            async def upsert_press_release(source_id: int, status: str, url: str) -> bool:
                 r = await _get(cx, url, headers={"Referer": VT_PUBLIC_PAGES["press_releases"]})
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallback + summary
                 title = _extract_h1(html) or url
 
                 pub_dt = _date_from_meta(html) or _date_from_json_ld(html)
                 pub_dt = _date_guard_not_future(pub_dt)
                 if not pub_dt:
                     # VT press pages usually show a visible "Month DD, YYYY"
-                    pub_dt = _date_from_vt_doc_page(html)
+                    pub_dt = _date_from_vt_doc_page(page)
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = await asyncio.to_thread(_summarize_page, title, url, html, page)
                 if summary:
-                    summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     url,
-                    src_pr,
+                    source_id,
                     _nz(title),
                     _nz(summary),
                     url,
                     "vermont",
                     "Vermont Governor",
-                    VT_STATUS_MAP["press_releases"],
+                    status,
                     pub_dt,
-                )
+                ))
                 return True
 
-            async def upsert_doc_with_pdf(doc_url: str, status: str, source_id: int, referer: str) -> bool:
+            async def upsert_doc_with_pdf(source_id: int, status: str, doc_url: str, referer: str) -> bool:
                 """
                 Fetch the VT document page, extract the PDF link, then fetch PDF and summarize text.
                 We store the PDF URL as the item URL (so clicking opens the actual doc),
@@ -5023,16 +5459,16 @@ async def ingest_vermont(limit_each: int = 5000, max_pages_each: int = 30) -> Di
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
                 title = _extract_h1(html) or doc_url
 
-                pub_dt = _date_from_vt_doc_page(html)
+                page = ParsedPage(doc_url, html)
+                pub_dt = _date_from_vt_doc_page(page)
 
-                pdf_url = _extract_first_pdf_link_vt(html)
+                pdf_url = _extract_first_pdf_link_vt(page)
                 if not pdf_url:
                     # If VT ever changes markup, don’t insert broken items
                     return False
@@ -5042,8 +5478,8 @@ async def ingest_vermont(limit_each: int = 5000, max_pages_each: int = 30) -> Di
                 try:
                     pr = await _get(cx, pdf_url, headers={"Referer": doc_url}, read_timeout=90.0)
                     if pr.status_code < 400:
-                        pdf_bytes = pr.content or b""
-                        pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                        pdf_bytes = _pdf_body(pr)
+                        pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes, _PDF_SUMMARY_MAX_PAGES))
                         if pdf_text:
                             summary = summarize_text(pdf_text, max_sentences=3, max_chars=700)
                             if summary:
@@ -5052,24 +5488,7 @@ async def ingest_vermont(limit_each: int = 5000, max_pages_each: int = 30) -> Di
                 except Exception:
                     summary = ""
 
-                await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                await buf.add((
                     doc_url,            # external_id = canonical doc page
                     source_id,
                     _nz(title),
@@ -5079,36 +5498,55 @@ async def ingest_vermont(limit_each: int = 5000, max_pages_each: int = 30) -> Di
                     "Vermont Governor",
                     status,
                     pub_dt,
-                )
+                ))
                 return True
 
-            upserted = {"press_releases": 0, "executive_orders": 0, "proclamations": 0}
-
-            for u in pr_new_urls:
-                if await upsert_press_release(u):
-                    upserted["press_releases"] += 1
-
-            for u in eo_new_doc_urls:
-                if await upsert_doc_with_pdf(
-                    u,
+            # ✅ Cron-safe filtering (only new external_ids unless backfill)
+            return await _run_sources(conn, "VT", [
+                _SourceSpec(
+                    "press_releases", "PR",
+                    "Vermont — Press Releases", "state_newsroom", VT_PUBLIC_PAGES["press_releases"],
+                    VT_STATUS_MAP["press_releases"],
+                    functools.partial(
+                        collect_listing,
+                        base_url=VT_PUBLIC_PAGES["press_releases"],
+                        keep="press",
+                        stop_at_url=_canon_vt(VT_PRESS_CUTOFF_URL),
+                        referer=VT_PUBLIC_PAGES["press_releases"],
+                    ),
+                    upsert_press_release,
+                ),
+                _SourceSpec(
+                    "executive_orders", "EO",
+                    "Vermont — Executive Orders", "state_executive_orders",
+                    "https://governor.vermont.gov/document-types/executive-orders",
                     VT_STATUS_MAP["executive_orders"],
-                    src_eo,
-                    referer=VT_PUBLIC_PAGES["executive_orders"],
-                ):
-                    upserted["executive_orders"] += 1
-
-            for u in proc_new_doc_urls:
-                if await upsert_doc_with_pdf(
-                    u,
+                    functools.partial(
+                        collect_listing,
+                        base_url="https://governor.vermont.gov/document-types/executive-orders",
+                        keep="doc",
+                        stop_at_url=None,
+                        referer="https://governor.vermont.gov/document-types/executive-orders",
+                        doc_referer=VT_PUBLIC_PAGES["executive_orders"],
+                    ),
+                    upsert_doc_with_pdf,
+                ),
+                _SourceSpec(
+                    "proclamations", "PROC",
+                    "Vermont — Proclamations", "state_proclamations",
+                    "https://governor.vermont.gov/document-categories/proclamations",
                     VT_STATUS_MAP["proclamations"],
-                    src_proc,
-                    referer=VT_PUBLIC_PAGES["proclamations"],
-                ):
-                    upserted["proclamations"] += 1
-
-
-            out["upserted"] = upserted
-            return out
+                    functools.partial(
+                        collect_listing,
+                        base_url="https://governor.vermont.gov/document-categories/proclamations",
+                        keep="doc",
+                        stop_at_url=_canon_vt(VT_PROC_CUTOFF_URL),
+                        referer="https://governor.vermont.gov/document-categories/proclamations",
+                        doc_referer=VT_PUBLIC_PAGES["proclamations"],
+                    ),
+                    upsert_doc_with_pdf,
+                ),
+            ], _effective_params, sem, buf)
 
 # --- ADD THIS WHOLE UTAH BLOCK INTO app/ingest_states2.py ---
 # (place it near the other state configs + helpers, before INGESTERS_V2)
@@ -5154,10 +5592,16 @@ def _ut_drive_download_url(view_url: str) -> str:
 
 _UT_GDRIVE_FILE_ID_RE = re.compile(r"^https?://drive\.google\.com/file/d/([^/]+)/", re.I)
 
+# smart quotes left over after unquote(), dropped in one translate pass
+_UT_SMART_QUOTES_TRANS = str.maketrans("", "", "“”’‘")
+
+@functools.lru_cache(maxsize=4096)
 def _ut_canon_id(u: str) -> str:
+    # cached: each EO/declaration url is canonicalized once for its map key and
+    # again by its upsert
     u = clean_url(u or "")
     u = unquote(u)
-    u = u.replace("“", "").replace("”", "").replace("’", "").replace("‘", "").strip()
+    u = u.translate(_UT_SMART_QUOTES_TRANS).strip()
 
     m = _UT_GDRIVE_FILE_ID_RE.match(u)
     if m:
@@ -5189,18 +5633,17 @@ async def _collect_ut_news_urls(
     """
     out: list[str] = []
     seen: set[str] = set()
-    href_re = re.compile(r'href=["\']([^"\']+)["\']', re.I)
 
     for p in range(1, max_pages + 1):
         page_url = _ut_news_page(p)
         r = await _get(cx, page_url, headers={"Referer": UT_PUBLIC_PAGES["news"]})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             break
 
-        html = r.text.replace("\\/", "/")
+        html = _resp_html(r)
         page_found: list[str] = []
 
-        for m in href_re.finditer(html):
+        for m in _HREF_RE.finditer(html):
             u = (m.group(1) or "").split("#")[0].strip()
             if not u:
                 continue
@@ -5294,14 +5737,13 @@ _UT_KEEP_DRIVE_RE = re.compile(r"^https?://drive\.google\.com/file/d/[^/]+/view"
 
 
 def _ut_strip_html(s: str) -> str:
-    s = re.sub(r'(?is)<[^>]+>', ' ', s or '')
-    return re.sub(r"\s+", " ", s).strip()
+    return _clean_fragment(s or '')
 
 def _parse_month_year(s: str) -> datetime | None:
     """
     Parses "January 2025" => 2025-01-01 UTC
     """
-    s = re.sub(r"\s+", " ", (s or "").strip())
+    s = _WS_RE.sub(" ", (s or "").strip())
     m = re.match(r'(?i)^(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|'
                  r'Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\.?\s+(20\d{2})$', s)
     if not m:
@@ -5374,10 +5816,10 @@ async def _collect_ut_list_items_by_year_anchor(
     collect PDF/Drive links from <li> blocks.
     """
     r = await _get(cx, page_url, headers={"Referer": page_url})
-    if r.status_code >= 400 or not r.text:
+    if r.status_code >= 400 or not r.content:
         return []
 
-    html = r.text.replace("\\/", "/")
+    html = _resp_html(r)
 
     # Walk headings + list items in document order
     token_re = re.compile(
@@ -5393,7 +5835,7 @@ async def _collect_ut_list_items_by_year_anchor(
 
     def _strip_tags(s: str) -> str:
         s = re.sub(r"(?is)<[^>]+>", " ", s or "")
-        return re.sub(r"\s+", " ", s).strip()
+        return _WS_RE.sub(" ", s).strip()
 
     for m in token_re.finditer(html):
         chunk = m.group(1) or ""
@@ -5447,14 +5889,8 @@ async def _collect_ut_list_items_by_year_anchor(
         title = _ut_strip_html(a.group("title") or "").strip()
         if not title:
             # fallback title from filename
-            fname = urlsplit(href).path.rsplit("/", 1)[-1]
-            title = (
-                fname.replace(".pdf", "")
-                    .replace("_", " ")
-                    .replace("-", " ")
-                    .strip()
-                or href
-            )
+            fname = _url_path(href).rsplit("/", 1)[-1]
+            title = _pdf_title_from_fname(fname) or href
 
         out.append((href, title, dt))
         if len(out) >= limit:
@@ -5477,13 +5913,10 @@ async def ingest_utah(limit_each: int = 8000, max_pages_each: int = 300) -> Dict
             src_decl = await get_or_create_source(conn, "Utah — Declarations", "state_declarations", UT_PUBLIC_PAGES["declarations"])
 
             # --- per-source backfill detection ---
-            news_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_news) or 0
-            eo_existing   = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-            decl_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_decl) or 0
-
-            news_backfill = (news_existing == 0)
-            eo_backfill   = (eo_existing == 0)
-            decl_backfill = (decl_existing == 0)
+            has_items = await _sources_with_items(conn, src_news, src_eo, src_decl)
+            news_backfill = src_news not in has_items
+            eo_backfill   = src_eo not in has_items
+            decl_backfill = src_decl not in has_items
 
             def _effective_params(is_backfill: bool) -> tuple[int, int]:
                 if is_backfill:
@@ -5578,54 +6011,41 @@ async def ingest_utah(limit_each: int = 8000, max_pages_each: int = 300) -> Dict
                 return out
 
 
-            print("UT EO sample:", eo_items[:5])
-            print("UT DECL sample:", decl_items[:5])
+            if _INGEST_DEBUG:
+                print("UT EO sample:", eo_items[:5])
+                print("UT DECL sample:", decl_items[:5])
 
             async def upsert_html_url(source_id: int, status: str, url: str) -> bool:
                 r = await _get(cx, url, headers={"Referer": UT_PUBLIC_PAGES["news"]})
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallback + summary
                 title = _extract_h1(html) or url
 
                 pub_dt = _date_from_meta(html) or _date_from_json_ld(html)
                 pub_dt = _date_guard_not_future(pub_dt)
                 if not pub_dt:
                     # Many UT press pages display e.g. "December 17, 2025"
-                    text = _strip_html_to_text(html)
+                    text = page.text
                     m = _US_MONTH_DATE_RE.search(text)
                     if m:
                         dt2 = _parse_us_month_date(m.group(0))
                         pub_dt = _date_guard_not_future(dt2) if dt2 else None
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = summarize_extractive(
+                    title, url, html, max_sentences=2, max_chars=700, text=page.text
+                )
                 if summary:
                     summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     url,
                     source_id,
                     _nz(title),
@@ -5668,14 +6088,7 @@ async def ingest_utah(limit_each: int = 8000, max_pages_each: int = 300) -> Dict
                     return False
 
                 # Accept PDF bytes OR a URL ending with .pdf (some servers mislabel ct)
-                ct = (r.headers.get("Content-Type") or "").lower()
-                is_pdfish = (
-                    ("pdf" in ct)
-                    or ("octet-stream" in ct)
-                    or fetch_url.lower().endswith(".pdf")
-                    or doc_url.lower().endswith(".pdf")
-                )
-                if not is_pdfish:
+                if not _is_pdf_response(r, fetch_url, doc_url, octet_ok=True):
                     return False
 
                 title = (title_hint or "").strip()
@@ -5691,22 +6104,16 @@ async def ingest_utah(limit_each: int = 8000, max_pages_each: int = 300) -> Dict
                             title = "Document"
                     else:
                         # fallback title from filename
-                        path = urlsplit(doc_url).path
+                        path = _url_path(doc_url)
                         fname = (path.rsplit("/", 1)[-1] or "").strip()
-                        title = (
-                            fname.replace(".pdf", "")
-                                .replace("_", " ")
-                                .replace("-", " ")
-                                .strip()
-                            or doc_url
-                        )
+                        title = _pdf_title_from_fname(fname) or doc_url
 
                 published_at = _date_guard_not_future(published_at_hint)
 
                 summary = ""
                 try:
-                    pdf_bytes = r.content or b""
-                    pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                    pdf_bytes = _pdf_body(r)
+                    pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes, _PDF_SUMMARY_MAX_PAGES))
                     if pdf_text:
                         summary = summarize_text(pdf_text, max_sentences=3, max_chars=700)
                         if summary:
@@ -5718,23 +6125,7 @@ async def ingest_utah(limit_each: int = 8000, max_pages_each: int = 300) -> Dict
                 external_id = _ut_canon_id(doc_url)
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     external_id,      # ✅ canonical external_id
                     source_id,
                     _nz(title),
@@ -5796,13 +6187,10 @@ async def ingest_new_jersey(limit_each: int = 20000, max_pages_each: int = 1) ->
             )
 
             # --- per-source backfill detection ---
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            eo_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-            ao_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_ao) or 0
-
-            pr_backfill = (pr_existing == 0)
-            eo_backfill = (eo_existing == 0)
-            ao_backfill = (ao_existing == 0)
+            has_items = await _sources_with_items(conn, src_pr, src_eo, src_ao)
+            pr_backfill = src_pr not in has_items
+            eo_backfill = src_eo not in has_items
+            ao_backfill = src_ao not in has_items
 
             def _effective_params(is_backfill: bool) -> tuple[int, int]:
                 if is_backfill:
@@ -5888,11 +6276,11 @@ async def ingest_new_jersey(limit_each: int = 20000, max_pages_each: int = 1) ->
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
+                page = ParsedPage(url, html)  # text view shared by the date fallback + summary
 
                 # ✅ NJ title strategy:
                 # 1) pull real headline from NJ page structure
@@ -5919,35 +6307,21 @@ async def ingest_new_jersey(limit_each: int = 20000, max_pages_each: int = 1) ->
                     pub_dt = _date_from_meta(html) or _date_from_json_ld(html)
                     pub_dt = _date_guard_not_future(pub_dt)
                 if not pub_dt:
-                    text = _strip_html_to_text(html)
+                    text = page.text
                     m = _US_MONTH_DATE_RE.search(text)
                     if m:
                         dt2 = _parse_us_month_date(m.group(0))
                         pub_dt = _date_guard_not_future(dt2) if dt2 else None
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = summarize_extractive(
+                    title, url, html, max_sentences=2, max_chars=700, text=page.text
+                )
                 if summary:
                     summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     url,
                     source_id,
                     _nz(title),
@@ -5971,24 +6345,17 @@ async def ingest_new_jersey(limit_each: int = 20000, max_pages_each: int = 1) ->
                 if r.status_code >= 400:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if ("pdf" not in ct) and (not url.lower().endswith(".pdf")):
+                if not _is_pdf_response(r, url):
                     return False
 
-                path = urlsplit(url).path
+                path = _url_path(url)
                 fname = (path.rsplit("/", 1)[-1] or "").strip()
-                title = (
-                    fname.replace(".pdf", "")
-                        .replace("_", " ")
-                        .replace("-", " ")
-                        .strip()
-                    or url
-                )
+                title = _pdf_title_from_fname(fname) or url
 
                 published_at = _date_guard_not_future(published_at_hint)
 
-                pdf_bytes = r.content or b""
-                pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                pdf_bytes = _pdf_body(r)
+                pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes))
 
                 # ✅ NJ AO published_at fallback from PDF text (isolated so it can't kill summary)
                 if (not published_at) and (status == NJ_STATUS_MAP["administrative_orders"]) and pdf_text:
@@ -6017,23 +6384,7 @@ async def ingest_new_jersey(limit_each: int = 20000, max_pages_each: int = 1) ->
 
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     url,
                     source_id,
                     _nz(title),
@@ -6108,11 +6459,9 @@ async def ingest_colorado(limit_each: int = 5000, max_pages_each: int = 300) ->
             )
 
             # --- per-source backfill detection ---
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            eo_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-
-            pr_backfill = (pr_existing == 0)
-            eo_backfill = (eo_existing == 0)
+            has_items = await _sources_with_items(conn, src_pr, src_eo)
+            pr_backfill = src_pr not in has_items
+            eo_backfill = src_eo not in has_items
 
             def _effective_params(is_backfill: bool) -> tuple[int, int]:
                 if is_backfill:
@@ -6220,54 +6569,40 @@ async def ingest_colorado(limit_each: int = 5000, max_pages_each: int = 300) ->
                 if r.status_code >= 400 or not r.text:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if "html" not in ct:
+                if not _is_html_response(r):
                     return False
 
                 html = _nz(r.text)
                 title = _extract_h1(html) or url
 
                 pub_dt = forced_published_at
+                page = ParsedPage(url, html)
 
                 if not pub_dt:
                     pub_dt = (
                         _date_from_meta(html)
                         or _date_from_json_ld(html)
-                        or _date_from_co_press(html)
+                        or _date_from_co_press(page)
                     )
                     pub_dt = _date_guard_not_future(pub_dt)
 
                 if not pub_dt:
-                    text = _strip_html_to_text(html)
-                    m = _US_MONTH_DATE_RE.search(text)
+                    # reuses the text view _date_from_co_press may already have built
+                    m = _US_MONTH_DATE_RE.search(page.text)
                     if m:
                         dt2 = _parse_us_month_date(m.group(0))
                         pub_dt = _date_guard_not_future(dt2) if dt2 else None
 
 
-                summary = summarize_extractive(title, url, html, max_sentences=2, max_chars=700)
+                summary = summarize_extractive(
+                    title, url, html, max_sentences=2, max_chars=700, text=page.text
+                )
                 if summary:
                     summary = _soft_normalize_caps(summary)
                     summary = await _safe_ai_polish(summary, title, url)
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     url,
                     source_id,
                     _nz(title),
@@ -6300,9 +6635,7 @@ async def ingest_colorado(limit_each: int = 5000, max_pages_each: int = 300) ->
                 if r.status_code >= 400:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                is_pdfish = ("pdf" in ct) or ("octet-stream" in ct) or fetch_url.lower().endswith(".pdf")
-                if not is_pdfish:
+                if not _is_pdf_response(r, fetch_url, octet_ok=True):
                     return False
 
                 title = (title_hint or "").strip()
@@ -6317,8 +6650,8 @@ async def ingest_colorado(limit_each: int = 5000, max_pages_each: int = 300) ->
 
                 summary = ""
                 try:
-                    pdf_bytes = r.content or b""
-                    pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                    pdf_bytes = _pdf_body(r)
+                    pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes))
                     if pdf_text:
                         # ✅ extract EO date from signed PDF text
                         eo_dt = _extract_co_eo_date(pdf_text)
@@ -6344,23 +6677,7 @@ async def ingest_colorado(limit_each: int = 5000, max_pages_each: int = 300) ->
 
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     view_url,          # external_id stable = drive view link
                     source_id,
                     _nz(title),
@@ -6420,17 +6737,11 @@ def _date_from_ak_dated_line(html: str) -> datetime | None:
         return None
 
     day = int(m.group(1))
-    month_name = m.group(2).title()
+    month_name = m.group(2).lower()
     year = int(m.group(3))
 
-    month_map = {
-        "January": 1, "February": 2, "March": 3, "April": 4,
-        "May": 5, "June": 6, "July": 7, "August": 8,
-        "September": 9, "October": 10, "November": 11, "December": 12
-    }
-
     try:
-        dt = datetime(year, month_map[month_name], day, tzinfo=timezone.utc)
+        dt = datetime(year, _MONTH_FULL[month_name], day, tzinfo=timezone.utc)
     except Exception:
         return None
 
@@ -6638,13 +6949,12 @@ async def _collect_ak_press_release_urls(
         # ✅ GET pagination (no nonce, no POST)
         page_url = "https://gov.alaska.gov/newsroom/" if page == 1 else f"https://gov.alaska.gov/newsroom/page/{page}/"
         r = await _get(cx, page_url, headers={"Referer": "https://gov.alaska.gov/newsroom/"})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             break
 
-        html = r.text.replace("\\/", "/")
+        html = _resp_html(r)
 
-        # ✅ TEMP DEBUG (optional)
-        if page in (1, 2):
+        if _INGEST_DEBUG and page in (1, 2):
             print("page:", page, "url:", page_url, "len(html):", len(html))
             print("divi-title-matches:", len(list(_AK_DIVI_ENTRY_TITLE_HREF_RE.finditer(html))))
             print("bookmark-matches:", len(list(_AK_REL_BOOKMARK_HREF_RE.finditer(html))))
@@ -6689,10 +6999,10 @@ async def _collect_ak_et_blog_urls(
     for p in range(1, max_pages + 1):
         page_url = _ak_et_blog_page(base_url, p)
         r = await _get(cx, page_url, headers={"Referer": base_url})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             break
 
-        html = r.text.replace("\\/", "/")
+        html = _resp_html(r)
         page_found = 0
 
         matches = list(_AK_DIVI_ENTRY_TITLE_HREF_RE.finditer(html))
@@ -6769,13 +7079,10 @@ async def ingest_alaska(limit_each: int = 5000, max_pages_each: int = 300) -> Di
             )
 
             # --- per-source backfill detection ---
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            proc_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_proc) or 0
-            ao_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_ao) or 0
-
-            pr_backfill = (pr_existing == 0)
-            proc_backfill = (proc_existing == 0)
-            ao_backfill = (ao_existing == 0)
+            has_items = await _sources_with_items(conn, src_pr, src_proc, src_ao)
+            pr_backfill = src_pr not in has_items
+            proc_backfill = src_proc not in has_items
+            ao_backfill = src_ao not in has_items
 
             def _effective_params(is_backfill: bool) -> tuple[int, int]:
                 if is_backfill:
@@ -6821,10 +7128,10 @@ async def ingest_alaska(limit_each: int = 5000, max_pages_each: int = 300) -> Di
             proc_urls = [u for u in (_canon_ak(x) for x in proc_urls) if u]
             ao_urls = [u for u in (_canon_ak(x) for x in ao_urls) if u]
 
-            # 🔍 DEBUG: check cross-source overlap (run once)
-            overlap_pr_proc = len(set(pr_urls) & set(proc_urls))
-            overlap_pr_ao = len(set(pr_urls) & set(ao_urls))
-            print("AK overlap PR∩PROC:", overlap_pr_proc, "PR∩AO:", overlap_pr_ao)
+            if _INGEST_DEBUG:
+                overlap_pr_proc = len(set(pr_urls) & set(proc_urls))
+                overlap_pr_ao = len(set(pr_urls) & set(ao_urls))
+                print("AK overlap PR∩PROC:", overlap_pr_proc, "PR∩AO:", overlap_pr_ao)
 
 
             # ✅ prevent cross-source URL overlap (keeps source_id stable across runs)
@@ -6896,23 +7203,7 @@ async def ingest_alaska(limit_each: int = 5000, max_pages_each: int = 300) -> Di
                     summary = await _safe_ai_polish(summary, title, url)
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     url,
                     source_id,
                     _nz(title),
@@ -7039,17 +7330,12 @@ def _md_parse_month_day_year(s: str) -> datetime | None:
     m = _MD_MONTH_DAY_YEAR_RE.search(s or "")
     if not m:
         return None
-    month_name = m.group(1).title()
+    month_name = m.group(1).lower()
     day = int(m.group(2))
     year = int(m.group(3))
 
-    month_map = {
-        "January": 1, "February": 2, "March": 3, "April": 4,
-        "May": 5, "June": 6, "July": 7, "August": 8,
-        "September": 9, "October": 10, "November": 11, "December": 12
-    }
     try:
-        return datetime(year, month_map[month_name], day, tzinfo=timezone.utc)
+        return datetime(year, _MONTH_FULL[month_name], day, tzinfo=timezone.utc)
     except Exception:
         return None
 
@@ -7087,10 +7373,10 @@ async def _collect_md_press_release_urls(
     for p in range(1, max_pages + 1):
         page_url = _md_page(base, p)
         r = await _get(cx, page_url, headers={"Referer": base})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             break
 
-        html = r.text.replace("\\/", "/")
+        html = _resp_html(r)
         hrefs = [m.group(1) for m in _MD_ANY_HREF_RE.finditer(html)]
 
         page_found = 0
@@ -7151,10 +7437,10 @@ async def _collect_md_pdf_links_with_dates(
     for p in range(1, max_pages + 1):
         page_url = _md_page(base_url, p)
         r = await _get(cx, page_url, headers={"Referer": base_url})
-        if r.status_code >= 400 or not r.text:
+        if r.status_code >= 400 or not r.content:
             break
 
-        html = r.text.replace("\\/", "/")
+        html = _resp_html(r)
 
         page_found = 0
         for m in row_re.finditer(html):
@@ -7230,13 +7516,10 @@ async def ingest_maryland(limit_each: int = 5000, max_pages_each: int = 250) ->
             )
 
             # --- per-source backfill detection ---
-            pr_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_pr) or 0
-            eo_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_eo) or 0
-            proc_existing = await conn.fetchval("select count(*) from items where source_id = $1", src_proc) or 0
-
-            pr_backfill = (pr_existing == 0)
-            eo_backfill = (eo_existing == 0)
-            proc_backfill = (proc_existing == 0)
+            has_items = await _sources_with_items(conn, src_pr, src_eo, src_proc)
+            pr_backfill = src_pr not in has_items
+            eo_backfill = src_eo not in has_items
+            proc_backfill = src_proc not in has_items
 
             def _effective_params(is_backfill: bool) -> tuple[int, int]:
                 if is_backfill:
@@ -7313,8 +7596,8 @@ async def ingest_maryland(limit_each: int = 5000, max_pages_each: int = 250) ->
 
             def _md_title_from_pdf_url(pdf_url: str) -> str:
                 try:
-                    from urllib.parse import unquote, urlsplit
-                    name = unquote(urlsplit(pdf_url).path.split("/")[-1])
+                    from urllib.parse import unquote
+                    name = unquote(_url_path(pdf_url).split("/")[-1])
                     name = re.sub(r"\.pdf$", "", name, flags=re.I)
                     name = name.replace("_", " ").replace("-", " ").strip()
                     return name or pdf_url
@@ -7333,8 +7616,7 @@ async def ingest_maryland(limit_each: int = 5000, max_pages_each: int = 250) ->
                 if r.status_code >= 400:
                     return False
 
-                ct = (r.headers.get("Content-Type") or "").lower()
-                if ("pdf" not in ct) and (not pdf_url.lower().endswith(".pdf")):
+                if not _is_pdf_response(r, pdf_url):
                     return False
 
                 title = _md_title_from_pdf_url(pdf_url)
@@ -7342,8 +7624,8 @@ async def ingest_maryland(limit_each: int = 5000, max_pages_each: int = 250) ->
 
                 summary = ""
                 try:
-                    pdf_bytes = r.content or b""
-                    pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                    pdf_bytes = _pdf_body(r)
+                    pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes, _PDF_SUMMARY_MAX_PAGES))
                     if pdf_text:
                         summary = summarize_text(pdf_text, max_sentences=3, max_chars=700)
                         if summary:
@@ -7354,23 +7636,7 @@ async def ingest_maryland(limit_each: int = 5000, max_pages_each: int = 250) ->
                     summary = ""
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     pdf_url,
                     source_id,
                     _nz(title),
@@ -7407,23 +7673,7 @@ async def ingest_maryland(limit_each: int = 5000, max_pages_each: int = 250) ->
                     summary = await _safe_ai_polish(summary, title, url)
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     url,
                     src_pr,
                     _nz(title),
@@ -7648,7 +7898,7 @@ def _strip_html(s: str) -> str:
     # Decode a few common entities (minimal)
     s = s.replace("&nbsp;", " ").replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">").replace("&#39;", "'").replace("&quot;", '"')
     # Collapse whitespace
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 
 def _mn_pick_date(obj) -> datetime | None:
@@ -8037,7 +8287,7 @@ def _mn_strip_tags(s: str) -> str:
         return ""
     s = re.sub(r"(?is)<[^>]+>", " ", s)
     s = _html.unescape(s)
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 def _mn_scrape_pdf_links_from_public_html(html: str) -> list[dict]:
     """
@@ -8471,23 +8721,7 @@ async def ingest_minnesota(limit_each: int = 5000, max_pages_each: int = 9999) -
                         summary = await _safe_ai_polish(summary, title, detail_url)
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     detail_url,              # keep SAME external_id so it overwrites old bad rows
                     src_pr,
                     title,
@@ -8523,8 +8757,8 @@ async def ingest_minnesota(limit_each: int = 5000, max_pages_each: int = 9999) -
                     if pr.status_code >= 400:
                         return False
 
-                    pdf_bytes = pr.content or b""
-                    pdf_text = _nz(_extract_pdf_text_from_bytes(pdf_bytes))
+                    pdf_bytes = _pdf_body(pr)
+                    pdf_text = _nz(await asyncio.to_thread(_extract_pdf_text_from_bytes, pdf_bytes, _PDF_SUMMARY_MAX_PAGES))
                     if pdf_text:
                         summary = summarize_text(pdf_text, max_sentences=3, max_chars=700)
                         if summary:
@@ -8534,23 +8768,7 @@ async def ingest_minnesota(limit_each: int = 5000, max_pages_each: int = 9999) -
                     summary = ""
 
                 await conn.execute(
-                    """
-                    insert into items (
-                        external_id, source_id, title, summary, url,
-                        jurisdiction, agency, status, published_at, fetched_at
-                    )
-                    values ($1,$2,$3,$4,$5,$6,$7,$8,$9, now())
-                    on conflict (external_id) do update set
-                        source_id=excluded.source_id,
-                        title=excluded.title,
-                        summary=excluded.summary,
-                        url=excluded.url,
-                        jurisdiction=excluded.jurisdiction,
-                        agency=excluded.agency,
-                        status=excluded.status,
-                        published_at = COALESCE(excluded.published_at, items.published_at),
-                        fetched_at=now()
-                    """,
+                    _ITEMS_UPSERT_SQL,
                     pdf_url,  # external_id
                     source_id,
                     _nz(title),
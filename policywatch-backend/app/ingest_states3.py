@@ -816,35 +816,26 @@ async def _filter_new_external_ids(conn, source_id: UUID, urls: list[str]) -> li
     if not urls:
         return []
 
-    existing: set[str] = set()
+    # one round trip: fetch just the candidates already known (= ANY probes the
+    # indexes per element), then diff locally to keep input order
+    in_items = (
+        "select i.external_id as u from public.items i"
+        " where i.source_id = $1 and i.external_id = any($2::text[])"
+        " union all select i.url from public.items i"
+        " where i.source_id = $1 and i.url = any($2::text[])"
+    )
+    in_ext_ids = (
+        " union all select x.external_id from public.item_external_ids x"
+        " where x.source_id = $1 and x.external_id = any($2::text[])"
+    )
 
-    # 1) item_external_ids (if present)
     try:
-        rows = await conn.fetch(
-            "select external_id from public.item_external_ids where source_id=$1 and external_id = any($2::text[])",
-            source_id,
-            urls,
-        )
-        existing |= {r["external_id"] for r in rows if r.get("external_id")}
+        rows = await conn.fetch(in_items + in_ext_ids, source_id, urls)
     except Exception:
-        pass
-
-    # 2) items.external_id
-    rows2 = await conn.fetch(
-        "select external_id from public.items where source_id=$1 and external_id = any($2::text[])",
-        source_id,
-        urls,
-    )
-    existing |= {r["external_id"] for r in rows2 if r.get("external_id")}
-
-    # 3) items.url
-    rows3 = await conn.fetch(
-        "select url from public.items where source_id=$1 and url = any($2::text[])",
-        source_id,
-        urls,
-    )
-    existing |= {r["url"] for r in rows3 if r.get("url")}
+        # item_external_ids isn't there
+        rows = await conn.fetch(in_items, source_id, urls)
 
+    existing = {r["u"] for r in rows}
     return [u for u in urls if u not in existing]
 
 @dataclass
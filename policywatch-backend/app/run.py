@@ -7,4 +7,6 @@ if sys.platform.startswith("win"):
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=False)
+    # loop="auto" runs the app (and the ingest endpoints) on uvloop when it is
+    # installed, falling back to the stdlib loop on Windows
+    uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=False, loop="auto")
@@ -61,34 +61,42 @@ def _remove_breadcrumb_lines(text: str) -> str:
 # Basic HTML -> clean text
 # ----------------------------
 
-_ARTICLE_PAT = re.compile(r'(?is)<article[^>]*>(.*?)</article>')
-_MAIN_PAT    = re.compile(r'(?is)<main[^>]*>(.*?)</main>')
+_ARTICLE_PAT = re.compile(r'(?is)<article[^>]*>')
+_ARTICLE_END_PAT = re.compile(r'(?i)</article>')
+_MAIN_PAT    = re.compile(r'(?is)<main[^>]*>')
+_MAIN_END_PAT = re.compile(r'(?i)</main>')
 
 def _extract_main_html(html_str: str) -> str:
     if not html_str:
         return ""
-    m = _ARTICLE_PAT.search(html_str)
-    if m:
-        return m.group(1)
-    m = _MAIN_PAT.search(html_str)
-    if m:
-        return m.group(1)
+    # inner HTML up to the first closing tag (what a lazy <x>(.*?)</x> would
+    # capture), found with two forward scans instead of a lazy match
+    for open_pat, end_pat in ((_ARTICLE_PAT, _ARTICLE_END_PAT), (_MAIN_PAT, _MAIN_END_PAT)):
+        m = open_pat.search(html_str)
+        if m:
+            e = end_pat.search(html_str, m.end())
+            if e:
+                return html_str[m.end():e.start()]
     return html_str  # fallback
 
+_DROP_BLOCK_PAT = re.compile(r"(?is)<(script|style|noscript|nav|header|footer|aside)[\s\S]*?</\1>")
+_BREAK_TAG_PAT  = re.compile(r"(?is)<br\s*/?>|</(?:p|div|h\d)>")
+_ANY_TAG_PAT    = re.compile(r"(?is)<[^>]+>")
+# a whitespace run that contains a newline collapses to a single "\n"
+_NL_RUN_PAT     = re.compile(r"[^\S\n]*+\n\s*")
+_HSPACE_RUN_PAT = re.compile(r"[ \t]{2,}")
+
 def _strip_html_to_text(html_str: str) -> str:
     """Crude but effective: drop scripts/styles/nav, keep text and paragraph breaks."""
     if not html_str:
         return ""
     html_str = _extract_main_html(html_str)   # <<< add this
-    s = re.sub(r"(?is)<(script|style|noscript|nav|header|footer|aside)[\s\S]*?</\1>", " ", html_str)
-    s = re.sub(r"(?is)<br\s*/?>", "\n", s)
-    s = re.sub(r"(?is)</(p|div|h\d)>", "\n", s)
-    s = re.sub(r"(?is)<[^>]+>", " ", s)
+    s = _DROP_BLOCK_PAT.sub(" ", html_str)
+    s = _BREAK_TAG_PAT.sub("\n", s)
+    s = _ANY_TAG_PAT.sub(" ", s)
     s = unescape(s)
-    s = re.sub(r"\s+\n", "\n", s)
-    s = re.sub(r"\n\s+", "\n", s)
-    s = re.sub(r"[ \t]{2,}", " ", s)
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    s = _NL_RUN_PAT.sub("\n", s)
+    s = _HSPACE_RUN_PAT.sub(" ", s)
     return s.strip()
 
 # ----------------------------
@@ -149,8 +157,17 @@ def _looks_like_quote(s: str) -> bool:
     return False
 
 
-def summarize_extractive(title: str, url: str, html: str, max_sentences: int = 2, max_chars: int = 700) -> str:
-    text = _strip_html_to_text(html)
+def summarize_extractive(
+    title: str,
+    url: str,
+    html: str,
+    max_sentences: int = 2,
+    max_chars: int = 700,
+    text: str | None = None,
+) -> str:
+    # callers that already flattened the page pass it as text= to skip a second pass
+    if text is None:
+        text = _strip_html_to_text(html)
     text = _remove_breadcrumb_lines(text)
     if _looks_like_eo(url):
         text = _eo_trim_preamble(text)
@@ -450,7 +467,7 @@ async def force_repolish_white_house_batch(conn, limit: int = 50) -> int:
         draft = _soft_normalize_caps(draft)
 
         # Always polish with AI (force overwrite)
-        polished = await ai_polish_summary(draft, r["title"], r["url"])
+        polished = await ai_polish_summary(draft, r["title"], r["url"], use_cache=False)
         if polished:
             updates.append((polished, r["external_id"]))
 
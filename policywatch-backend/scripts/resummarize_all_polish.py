@@ -32,7 +32,7 @@ async def main(limit=500):
             for r in rows:
                 title, url, prev = r["title"] or "", r["url"] or "", r["summary"] or ""
                 # send existing summary through polish (cheap vs refetching pages)
-                polished = await ai_polish_summary(prev, title, url)
+                polished = await ai_polish_summary(prev, title, url, use_cache=False)
                 if polished and polished != prev:
                     updates.append((polished, r["external_id"]))
 
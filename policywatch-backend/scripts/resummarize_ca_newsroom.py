@@ -48,7 +48,7 @@ async def main(limit=150):
 
                     # normalize caps then polish
                     summary = _soft_normalize_caps(summary)
-                    summary = await ai_polish_summary(summary, r["title"] or "", r["url"])
+                    summary = await ai_polish_summary(summary, r["title"] or "", r["url"], use_cache=False)
 
                     updates.append((summary, r["external_id"]))
                 except Exception:
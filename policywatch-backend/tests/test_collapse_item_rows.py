@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+from app.ingest_states2 import _collapse_item_rows
+
+
+def _row(external_id, title, published_at=None):
+    return (external_id, 1, title, "summary", external_id, "ohio", "Ohio Governor", "news", published_at)
+
+
+def test_one_row_per_external_id_last_write_wins():
+    rows = _collapse_item_rows([
+        _row("a", "first"),
+        _row("b", "other"),
+        _row("a", "second"),
+    ])
+    assert [r[0] for r in rows] == ["a", "b"]
+    assert rows[0][2] == "second"
+
+
+def test_earlier_published_at_survives_later_null():
+    dt = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    rows = _collapse_item_rows([_row("a", "first", dt), _row("a", "second", None)])
+    assert rows == [_row("a", "second", dt)]
+
+
+def test_later_published_at_replaces_earlier():
+    d1 = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    d2 = datetime(2025, 4, 1, tzinfo=timezone.utc)
+    rows = _collapse_item_rows([_row("a", "first", d1), _row("a", "second", d2)])
+    assert rows == [_row("a", "second", d2)]
+
+
+def test_empty_batch():
+    assert _collapse_item_rows([]) == []